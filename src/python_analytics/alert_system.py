@@ -1,12 +1,20 @@
 from datetime import datetime
 import logging
-from typing import Dict, Any, List
+import queue
+import threading
+from typing import List, Optional
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
 from .config import AnalyticsConfig
-from .models.data_models import AnalyticsResults
+from .models.data_models import Alert, AnalyticsResults
+
+# Максимальное число алертов, отправляемых одним письмом
+ALERT_BATCH_SIZE = 16
+
+# Маркер остановки фонового обработчика очереди
+_STOP = object()
 
 class AlertSystem:
     """Система алертов для аналитики"""
@@ -15,54 +23,73 @@ class AlertSystem:
         self.config = config
         self.logger = logging.getLogger(__name__)
         self._running = False
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
+        self._smtp: Optional[smtplib.SMTP] = None
         
     def start(self):
         """Запустить систему алертов"""
         self._running = True
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._drain, name="alert-dispatch", daemon=True)
+            self._worker.start()
         self.logger.info("Starting alert system")
         
     def stop(self):
         """Остановить систему алертов"""
         self._running = False
+        if self._worker is not None:
+            # Обработчик отправит всё, что уже в очереди, и завершится на маркере
+            self._queue.put(_STOP)
+            self._worker.join()
+            self._worker = None
         self.logger.info("Stopping alert system")
         
-    def check_alerts(self, results: AnalyticsResults) -> List[Dict[str, Any]]:
+    def check_alerts(self, results: AnalyticsResults) -> List[Alert]:
         """Проверить условия для алертов"""
         if not self._running:
             return []
             
+        # Пустые результаты (например, при старте) не могут вызвать алертов
+        gameplay_results = results.gameplay_results
+        if not gameplay_results:
+            return []
+            
+        # Все алерты одной проверки имеют общее время срабатывания
+        ts = datetime.now()
         alerts = []
         
         try:
-            # Проверка метрик геймплея
-            gameplay_results = results.gameplay_results
+            score = gameplay_results.get('average_score', 0)
+            perf_score = (gameplay_results.get('player_performance') or {}).get('average_score_per_player', 0)
+            total_games = gameplay_results.get('total_games', 0)
             
             # Проверка среднего счета
-            if gameplay_results.get('average_score', 0) > self.config.alert_threshold_score:
-                alerts.append({
-                    'type': 'high_score',
-                    'message': f'Средний счет превысил порог: {gameplay_results["average_score"]:.2f}',
-                    'severity': 'warning',
-                    'timestamp': datetime.now()
-                })
+            if score > self.config.alert_threshold_score:
+                alerts.append(Alert(
+                    type='high_score',
+                    message=f'Средний счет превысил порог: {score:.2f}',
+                    severity='warning',
+                    timestamp=ts
+                ))
                 
             # Проверка производительности
-            if gameplay_results.get('player_performance', {}).get('average_score_per_player', 0) > self.config.alert_threshold_performance:
-                alerts.append({
-                    'type': 'high_performance',
-                    'message': f'Высокая производительность игроков: {gameplay_results["player_performance"]["average_score_per_player"]:.2f}',
-                    'severity': 'info',
-                    'timestamp': datetime.now()
-                })
+            if perf_score > self.config.alert_threshold_performance:
+                alerts.append(Alert(
+                    type='high_performance',
+                    message=f'Высокая производительность игроков: {perf_score:.2f}',
+                    severity='info',
+                    timestamp=ts
+                ))
                 
             # Проверка количества игр
-            if gameplay_results.get('total_games', 0) > 1000:
-                alerts.append({
-                    'type': 'high_activity',
-                    'message': f'Высокая активность: {gameplay_results["total_games"]} игр',
-                    'severity': 'info',
-                    'timestamp': datetime.now()
-                })
+            if total_games > 1000:
+                alerts.append(Alert(
+                    type='high_activity',
+                    message=f'Высокая активность: {total_games} игр',
+                    severity='info',
+                    timestamp=ts
+                ))
                 
             # Отправка алертов
             if alerts:
@@ -74,12 +101,86 @@ class AlertSystem:
             self.logger.error(f"Error checking alerts: {e}")
             return []
             
-    def _send_alerts(self, alerts: List[Dict[str, Any]]):
-        """Отправить алерты"""
+    def _send_alerts(self, alerts: List[Alert]):
+        """Поставить алерты в очередь на отправку"""
+        # Отправка выполняется фоновым потоком, чтобы не блокировать анализ
+        for alert in alerts:
+            self._queue.put(alert)
+            
+    def _drain(self):
+        """Обработать очередь алертов пачками до получения маркера остановки"""
+        stopping = False
+        try:
+            while not stopping:
+                item = self._queue.get()
+                if item is _STOP:
+                    break
+                    
+                batch = [item]
+                while len(batch) < ALERT_BATCH_SIZE:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+                    
+                self._dispatch(batch)
+        finally:
+            self._close_smtp()
+            
+    def _dispatch(self, alerts: List[Alert]):
+        """Отправить пачку алертов"""
         try:
-            # Здесь можно добавить отправку через email, Slack, Telegram и т.д.
+            # Здесь можно добавить отправку через Slack, Telegram и т.д.
             for alert in alerts:
-                self.logger.warning(f"Alert: {alert['message']}")
+                self.logger.warning(f"Alert: {alert.message}")
+                
+            if self.config.smtp_host and self.config.alert_email_to:
+                self._send_email(alerts)
                 
         except Exception as e:
-            self.logger.error(f"Error sending alerts: {e}") 
\ No newline at end of file
+            self.logger.error(f"Error sending alerts: {e}")
+            self._close_smtp()
+            
+    def _send_email(self, alerts: List[Alert]):
+        """Отправить алерты одним письмом через постоянное SMTP-соединение"""
+        msg = MIMEMultipart()
+        msg['From'] = self.config.alert_email_from
+        msg['To'] = self.config.alert_email_to
+        msg['Subject'] = f"Tetris analytics: {len(alerts)} alert(s)"
+        body = "\n".join(
+            f"[{alert.severity}] {alert.timestamp}: {alert.message}"
+            for alert in alerts
+        )
+        msg.attach(MIMEText(body, 'plain', 'utf-8'))
+        
+        self._get_smtp().send_message(msg)
+        
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Получить открытое SMTP-соединение, переподключаясь при необходимости"""
+        if self._smtp is not None:
+            try:
+                self._smtp.noop()
+                return self._smtp
+            except (smtplib.SMTPException, OSError):
+                self._close_smtp()
+                
+        smtp = smtplib.SMTP(self.config.smtp_host, self.config.smtp_port, timeout=10)
+        smtp.starttls()
+        if self.config.smtp_user:
+            smtp.login(self.config.smtp_user, self.config.smtp_password)
+        self._smtp = smtp
+        return smtp
+        
+    def _close_smtp(self):
+        """Закрыть SMTP-соединение"""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except Exception:
+            pass
+        self._smtp = None 
\ No newline at end of file
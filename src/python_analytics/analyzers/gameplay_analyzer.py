@@ -1,13 +1,104 @@
+from collections import Counter
 from datetime import datetime
 from typing import Dict, List, Union
 import pandas as pd
 import numpy as np
 from sklearn.cluster import KMeans
-from sklearn.preprocessing import StandardScaler
 import logging
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba необязателен: без него используется np.*.reduceat
+    njit = None
+
 from ..models.data_models import GameEvent, GameplayMetrics, AnalyticsResults
 
+# Признаки игрока, используемые для кластеризации
+FEATURES = ['score', 'lines_cleared', 'time_played', 'pieces_placed', 'level']
+FEATURE_DTYPE = np.dtype([(name, 'i4') for name in FEATURES])
+SCORE, LINES_CLEARED, TIME_PLAYED, PIECES_PLACED, LEVEL = range(len(FEATURES))
+
+# До этого числа записей анализ выполняется на NumPy без построения DataFrame
+SMALL_N_THRESHOLD = 1024
+
+def _feature_matrix(metrics: List[GameplayMetrics]) -> np.ndarray:
+    """Собрать матрицу признаков (n, len(FEATURES)) типа int32 без DataFrame"""
+    arr = np.fromiter(
+        ((m.score, m.lines_cleared, m.time_played, m.pieces_placed, m.level) for m in metrics),
+        dtype=FEATURE_DTYPE,
+        count=len(metrics)
+    )
+    # Поля упакованы подряд, поэтому представление (n, 5) не копирует данные
+    return arr.view(np.int32).reshape(len(metrics), len(FEATURES))
+
+def _group_reduce_numpy(starts: np.ndarray, values: np.ndarray,
+                        out_mean: np.ndarray, out_max: np.ndarray, out_sum: np.ndarray) -> None:
+    """Среднее, максимум и сумма по группам подряд идущих строк"""
+    heads = starts[:-1]
+    out_sum[:] = np.add.reduceat(values, heads, axis=0)
+    out_max[:] = np.maximum.reduceat(values, heads, axis=0)
+    out_mean[:] = out_sum / np.diff(starts)[:, None]
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _group_reduce(starts, values, out_mean, out_max, out_sum):
+        """Среднее, максимум и сумма по группам подряд идущих строк (параллельно по группам)"""
+        n_cols = values.shape[1]
+        for g in prange(starts.shape[0] - 1):
+            lo = starts[g]
+            hi = starts[g + 1]
+            for c in range(n_cols):
+                total = 0.0
+                peak = values[lo, c]
+                for i in range(lo, hi):
+                    v = values[i, c]
+                    total += v
+                    if v > peak:
+                        peak = v
+                out_sum[g, c] = total
+                out_max[g, c] = peak
+                out_mean[g, c] = total / (hi - lo)
+else:
+    _group_reduce = _group_reduce_numpy
+
+def _per_player_stats(player_ids: np.ndarray, X: np.ndarray):
+    """Посчитать среднее, максимум и сумму признаков для каждого игрока"""
+    _, codes = np.unique(player_ids, return_inverse=True)
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    n_groups = int(sorted_codes[-1]) + 1
+    starts = np.searchsorted(sorted_codes, np.arange(n_groups + 1)).astype(np.int64)
+    values = np.ascontiguousarray(X[order], dtype=np.float64)
+    
+    out_mean = np.empty((n_groups, X.shape[1]), dtype=np.float64)
+    out_max = np.empty_like(out_mean)
+    out_sum = np.empty_like(out_mean)
+    _group_reduce(starts, values, out_mean, out_max, out_sum)
+    return out_mean, out_max, out_sum
+
+def _player_performance(player_ids: np.ndarray, X: np.ndarray) -> Dict[str, float]:
+    """Сводные показатели производительности игроков"""
+    player_mean, player_max, _ = _per_player_stats(player_ids, X)
+    return {
+        'average_score_per_player': player_mean[:, SCORE].mean(),
+        'max_score': player_max[:, SCORE].max(),
+        'average_lines_per_player': player_mean[:, LINES_CLEARED].mean(),
+        'max_lines': player_max[:, LINES_CLEARED].max(),
+        'average_time_per_player': player_mean[:, TIME_PLAYED].mean(),
+        'max_time': player_max[:, TIME_PLAYED].max(),
+    }
+
+def _cluster_labels(X: np.ndarray) -> np.ndarray:
+    """Разбить игроков на кластеры по нормализованным признакам"""
+    # Нормализация данных (эквивалент StandardScaler, результат во float32)
+    mu = X.mean(axis=0, dtype=np.float64)
+    sd = X.std(axis=0, dtype=np.float64)
+    sd[sd == 0] = 1.0
+    X_scaled = ((X - mu) / sd).astype(np.float32, copy=False)
+    
+    kmeans = KMeans(n_clusters=min(3, len(X)), random_state=42)
+    return kmeans.fit_predict(X_scaled)
+
 class GameplayAnalyzer:
     """Анализатор данных о геймплее"""
     
@@ -17,16 +108,11 @@ class GameplayAnalyzer:
     def analyze(self, events: List[GameEvent], metrics: List[GameplayMetrics]) -> Dict[str, Union[float, int, List[float]]]:
         """Проанализировать данные о геймплее"""
         try:
+            # Для небольших выборок накладные расходы pandas больше самих вычислений
+            if len(metrics) < SMALL_N_THRESHOLD:
+                return self._analyze_small(events, metrics)
+                
             # Конвертируем в DataFrame
-            events_df = pd.DataFrame([{
-                'event_id': str(e.event_id),
-                'game_id': str(e.game_id),
-                'player_id': str(e.player_id),
-                'event_type': e.event_type,
-                'timestamp': e.timestamp,
-                **e.data
-            } for e in events])
-            
             metrics_df = pd.DataFrame([{
                 'game_id': str(m.game_id),
                 'player_id': str(m.player_id),
@@ -50,43 +136,19 @@ class GameplayAnalyzer:
             }
             
             # Анализ событий
-            event_counts = events_df['event_type'].value_counts()
-            results['event_distribution'] = event_counts.to_dict()
+            results['event_distribution'] = dict(Counter(e.event_type for e in events).most_common())
             
             # Анализ производительности игроков
-            player_metrics = metrics_df.groupby('player_id').agg({
-                'score': ['mean', 'max', 'sum'],
-                'lines_cleared': ['mean', 'max', 'sum'],
-                'time_played': ['mean', 'max', 'sum'],
-                'pieces_placed': ['mean', 'max', 'sum'],
-                'level': ['mean', 'max']
-            })
-            
-            results['player_performance'] = {
-                'average_score_per_player': player_metrics[('score', 'mean')].mean(),
-                'max_score': player_metrics[('score', 'max')].max(),
-                'average_lines_per_player': player_metrics[('lines_cleared', 'mean')].mean(),
-                'max_lines': player_metrics[('lines_cleared', 'max')].max(),
-                'average_time_per_player': player_metrics[('time_played', 'mean')].mean(),
-                'max_time': player_metrics[('time_played', 'max')].max(),
-            }
+            X = _feature_matrix(metrics)
+            results['player_performance'] = _player_performance(metrics_df['player_id'].to_numpy(), X)
             
             # Кластеризация игроков
             if len(metrics_df) >= 3:  # Минимум 3 игрока для кластеризации
-                features = ['score', 'lines_cleared', 'time_played', 'pieces_placed', 'level']
-                X = metrics_df[features].values
-                
-                # Нормализация данных
-                scaler = StandardScaler()
-                X_scaled = scaler.fit_transform(X)
-                
-                # Кластеризация
-                kmeans = KMeans(n_clusters=min(3, len(metrics_df)), random_state=42)
-                clusters = kmeans.fit_predict(X_scaled)
+                clusters = _cluster_labels(X)
                 
                 # Анализ кластеров
                 metrics_df['cluster'] = clusters
-                cluster_analysis = metrics_df.groupby('cluster')[features].mean()
+                cluster_analysis = metrics_df.groupby('cluster')[FEATURES].mean()
                 
                 results['player_clusters'] = {
                     'cluster_centers': cluster_analysis.to_dict(),
@@ -97,4 +159,47 @@ class GameplayAnalyzer:
             
         except Exception as e:
             self.logger.error(f"Error analyzing gameplay data: {e}")
-            return {} 
\ No newline at end of file
+            return {}
+            
+    def _analyze_small(self, events: List[GameEvent], metrics: List[GameplayMetrics]) -> Dict[str, Union[float, int, List[float]]]:
+        """Проанализировать небольшую выборку только средствами NumPy"""
+        X = _feature_matrix(metrics)
+        player_ids = np.array([str(m.player_id) for m in metrics])
+        means = X.mean(axis=0)
+        
+        # Базовые метрики
+        results = {
+            'total_games': len({str(m.game_id) for m in metrics}),
+            'total_players': len(np.unique(player_ids)),
+            'average_score': means[SCORE],
+            'average_lines_cleared': means[LINES_CLEARED],
+            'average_time_played': means[TIME_PLAYED],
+            'average_pieces_placed': means[PIECES_PLACED],
+            'average_level': means[LEVEL],
+        }
+        
+        # Анализ событий
+        results['event_distribution'] = dict(Counter(e.event_type for e in events).most_common())
+        
+        # Анализ производительности игроков
+        results['player_performance'] = _player_performance(player_ids, X)
+        
+        # Кластеризация игроков
+        if len(metrics) >= 3:  # Минимум 3 игрока для кластеризации
+            clusters = _cluster_labels(X)
+            labels, sizes = np.unique(clusters, return_counts=True)
+            centers = [X[clusters == label].mean(axis=0) for label in labels]
+            
+            # Та же форма, что у DataFrame.to_dict() и value_counts().to_dict()
+            results['player_clusters'] = {
+                'cluster_centers': {
+                    name: {int(label): float(center[i]) for label, center in zip(labels, centers)}
+                    for i, name in enumerate(FEATURES)
+                },
+                'cluster_sizes': {
+                    int(label): int(size)
+                    for label, size in sorted(zip(labels, sizes), key=lambda item: -item[1])
+                }
+            }
+        
+        return results
@@ -1,40 +1,55 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
 import os
 from dotenv import load_dotenv
 
-load_dotenv()
+# .env читается один раз на процесс, даже при повторных импортах модуля
+if not os.environ.get("_DOTENV_LOADED"):
+    load_dotenv(override=False)
+    os.environ["_DOTENV_LOADED"] = "1"
+
+def _env(name: str, default: str, cast: Callable[[str], Any] = str):
+    """Значение по умолчанию из переменной окружения, читаемое при создании конфигурации"""
+    return field(default_factory=lambda: cast(os.getenv(name, default)))
 
 @dataclass
 class AnalyticsConfig:
     """Конфигурация аналитической системы"""
     
     # Настройки базы данных
-    db_host: str = os.getenv("DB_HOST", "localhost")
-    db_port: int = int(os.getenv("DB_PORT", "5432"))
-    db_name: str = os.getenv("DB_NAME", "tetris_analytics")
-    db_user: str = os.getenv("DB_USER", "postgres")
-    db_password: str = os.getenv("DB_PASSWORD", "postgres")
+    db_host: str = _env("DB_HOST", "localhost")
+    db_port: int = _env("DB_PORT", "5432", int)
+    db_name: str = _env("DB_NAME", "tetris_analytics")
+    db_user: str = _env("DB_USER", "postgres")
+    db_password: str = _env("DB_PASSWORD", "postgres")
     
     # Настройки API
-    api_host: str = os.getenv("API_HOST", "0.0.0.0")
-    api_port: int = int(os.getenv("API_PORT", "8082"))
+    api_host: str = _env("API_HOST", "0.0.0.0")
+    api_port: int = _env("API_PORT", "8082", int)
     
     # Настройки логирования
-    log_level: str = os.getenv("LOG_LEVEL", "INFO")
-    log_file: str = os.getenv("LOG_FILE", "analytics.log")
+    log_level: str = _env("LOG_LEVEL", "INFO")
+    log_file: str = _env("LOG_FILE", "analytics.log")
     
     # Настройки анализа
-    analysis_interval: int = int(os.getenv("ANALYSIS_INTERVAL", "3600"))  # в секундах
-    data_retention_days: int = int(os.getenv("DATA_RETENTION_DAYS", "30"))
+    analysis_interval: int = _env("ANALYSIS_INTERVAL", "3600", int)  # в секундах
+    data_retention_days: int = _env("DATA_RETENTION_DAYS", "30", int)
     
     # Настройки алертов
-    alert_threshold_score: float = float(os.getenv("ALERT_THRESHOLD_SCORE", "0.8"))
-    alert_threshold_performance: float = float(os.getenv("ALERT_THRESHOLD_PERFORMANCE", "0.9"))
+    alert_threshold_score: float = _env("ALERT_THRESHOLD_SCORE", "0.8", float)
+    alert_threshold_performance: float = _env("ALERT_THRESHOLD_PERFORMANCE", "0.9", float)
+    
+    # Настройки отправки алертов по email (пустой SMTP_HOST — только логирование)
+    smtp_host: str = _env("SMTP_HOST", "")
+    smtp_port: int = _env("SMTP_PORT", "587", int)
+    smtp_user: str = _env("SMTP_USER", "")
+    smtp_password: str = _env("SMTP_PASSWORD", "")
+    alert_email_from: str = _env("ALERT_EMAIL_FROM", "analytics@localhost")
+    alert_email_to: str = _env("ALERT_EMAIL_TO", "")
     
     # Настройки отчетов
-    report_output_dir: str = os.getenv("REPORT_OUTPUT_DIR", "reports")
-    report_format: str = os.getenv("REPORT_FORMAT", "html")
+    report_output_dir: str = _env("REPORT_OUTPUT_DIR", "reports")
+    report_format: str = _env("REPORT_FORMAT", "html")
     
     def get_database_url(self) -> str:
         """Получить URL для подключения к базе данных"""
@@ -42,4 +57,4 @@ class AnalyticsConfig:
     
     def get_api_url(self) -> str:
         """Получить URL для API"""
-        return f"http://{self.api_host}:{self.api_port}" 
\ No newline at end of file
+        return f"http://{self.api_host}:{self.api_port}"
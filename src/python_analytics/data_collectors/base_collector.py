@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import List, TypeVar, Generic
-from datetime import datetime, timedelta
+from typing import Dict, List, TypeVar, Generic
+from datetime import datetime
 import logging
+import threading
+import time
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 
 from ..config import AnalyticsConfig
@@ -10,14 +13,41 @@ from ..models.data_models import GameEvent, PlayerAction, PerformanceMetrics
 
 T = TypeVar('T')
 
+# Общий пул соединений на URL базы данных: все сборщики используют один Engine
+_ENGINE_CACHE: Dict[str, Engine] = {}
+_SESSION_CACHE: Dict[str, sessionmaker] = {}
+_ENGINE_LOCK = threading.Lock()
+
+
+def _get_session_factory(url: str) -> sessionmaker:
+    """Получить (или лениво создать) фабрику сессий для URL базы данных"""
+    factory = _SESSION_CACHE.get(url)
+    if factory is not None:
+        return factory
+    with _ENGINE_LOCK:
+        factory = _SESSION_CACHE.get(url)
+        if factory is None:
+            engine = create_engine(
+                url,
+                pool_size=10,
+                pool_pre_ping=True,
+                pool_recycle=300,
+            )
+            _ENGINE_CACHE[url] = engine
+            factory = sessionmaker(bind=engine)
+            _SESSION_CACHE[url] = factory
+    return factory
+
+
 class BaseCollector(Generic[T], ABC):
     """Базовый класс для сборщиков данных"""
     
     def __init__(self, config: AnalyticsConfig):
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.engine = create_engine(config.get_database_url())
-        self.Session = sessionmaker(bind=self.engine)
+        url = config.get_database_url()
+        self.Session = _get_session_factory(url)
+        self.engine = _ENGINE_CACHE[url]
         self._running = False
         
     def start(self):
@@ -40,8 +70,13 @@ class BaseCollector(Generic[T], ABC):
         """Получить собранные данные за период"""
         pass
     
+    def _retention_cutoff(self) -> datetime:
+        """Граница хранения данных (naive UTC, как метки времени в БД)"""
+        retention_ts = time.time() - self.config.data_retention_days * 86400.0
+        return datetime.utcfromtimestamp(retention_ts)
+        
     def cleanup_old_data(self):
         """Очистить старые данные"""
-        retention_date = datetime.now() - timedelta(days=self.config.data_retention_days)
+        retention_date = self._retention_cutoff()
         self.logger.info(f"Cleaning up data older than {retention_date}")
         # Реализация очистки в подклассах 
\ No newline at end of file
@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List
 import logging
 from sqlalchemy import select, and_
@@ -60,7 +60,7 @@ class GameplayCollector(BaseCollector[GameEvent]):
             
     def cleanup_old_data(self):
         """Очистить старые данные"""
-        retention_date = datetime.now() - timedelta(days=self.config.data_retention_days)
+        retention_date = self._retention_cutoff()
         try:
             with self.Session() as session:
                 # Удаляем старые события
@@ -6,8 +6,19 @@ from typing import List, Dict, Any, Optional
 import pandas as pd
 from datetime import datetime
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow необязателен для CSV
+    pa = None
+    pa_csv = None
+
 from .models.data_models import GameEvent, PlayerAction, PerformanceMetrics
 
+# Начиная с этого числа строк CSV пишется потоково через Arrow
+ARROW_CSV_MIN_ROWS = 10000
+ARROW_CSV_BATCH_SIZE = 65536
+
 class DataExporter:
     """Экспортер данных аналитики"""
     
@@ -31,7 +42,7 @@ class DataExporter:
             # Экспортируем в выбранном формате
             if format.lower() == 'csv':
                 output_path = os.path.join(self.output_dir, f"{filename}.csv")
-                df.to_csv(output_path, index=False)
+                self._write_csv(df, output_path)
                 
             elif format.lower() == 'json':
                 output_path = os.path.join(self.output_dir, f"{filename}.json")
@@ -51,6 +62,26 @@ class DataExporter:
             self.logger.error(f"Error exporting data: {e}")
             return None
             
+    def _write_csv(self, df: pd.DataFrame, output_path: str) -> None:
+        """Записать CSV, для больших выгрузок — пачками через Arrow"""
+        if pa_csv is not None and len(df) >= ARROW_CSV_MIN_ROWS:
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                pa_csv.write_csv(
+                    table,
+                    output_path,
+                    write_options=pa_csv.WriteOptions(
+                        include_header=True,
+                        batch_size=ARROW_CSV_BATCH_SIZE
+                    )
+                )
+                return
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+                # Колонки с объектами Python (UUID, dict) Arrow не конвертирует
+                self.logger.debug(f"Arrow CSV writer unavailable for {output_path}: {e}")
+                
+        df.to_csv(output_path, index=False)
+        
     def _convert_to_dict(self, item: Any) -> Dict[str, Any]:
         """Преобразовать объект в словарь"""
         if isinstance(item, (GameEvent, PlayerAction, PerformanceMetrics)):
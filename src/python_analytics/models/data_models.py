@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
 
 @dataclass
@@ -66,4 +66,21 @@ class AnalyticsResults:
     player_results: Dict[str, Union[float, int, List[float]]]
     balance_results: Dict[str, Union[float, int, List[float]]]
     performance_results: Dict[str, Union[float, int, List[float]]]
-    timestamp: datetime 
\ No newline at end of file
+    timestamp: datetime
+    
+@dataclass(slots=True, frozen=True)
+class Alert:
+    """Алерт аналитической системы"""
+    type: str
+    message: str
+    severity: str
+    timestamp: datetime
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Преобразовать алерт в словарь"""
+        return {
+            'type': self.type,
+            'message': self.message,
+            'severity': self.severity,
+            'timestamp': self.timestamp
+        }
@@ -1,22 +1,94 @@
 from datetime import datetime
+import asyncio
+import hashlib
+import io
 import os
 import json
 import logging
-from typing import Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Dict, Any, Tuple
+import numpy as np
+import matplotlib
+# Графики только сохраняются в файлы: GUI-бэкенд не нужен и небезопасен вне главного потока
+matplotlib.use("Agg", force=True)
 import matplotlib.pyplot as plt
-import seaborn as sns
-from jinja2 import Environment, FileSystemLoader
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+try:
+    from pybase64 import b64encode  # SIMD-кодировщик, совместим с base64.b64encode
+except ImportError:
+    from base64 import b64encode
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 from ..models.data_models import AnalyticsResults
 from ..config import AnalyticsConfig
 
+plt.rcParams["figure.max_open_warning"] = 0
+
+# Стиль и палитра настраиваются один раз при создании первого репортера
+_style_lock = threading.Lock()
+_style_applied = False
+
+def _apply_chart_style():
+    """Применить стиль графиков и палитру seaborn (однократно на процесс)"""
+    global _style_applied
+    with _style_lock:
+        if _style_applied:
+            return
+        # Импорт seaborn дорогой, поэтому откладывается до первого использования
+        import seaborn as sns
+        
+        # Стиль 'seaborn' в matplotlib >= 3.6 называется 'seaborn-v0_8'
+        try:
+            plt.style.use('seaborn-v0_8')
+        except (OSError, KeyError):
+            plt.style.use('default')
+        sns.set_palette("husl")
+        _style_applied = True
+
+# Параметры PNG для миниатюр дашборда: быстрое сжатие deflate и без метаданных
+CHART_DPI = 80
+_PNG_METADATA = {"Software": None}
+_PNG_PIL_KWARGS = {"compress_level": 1}
+
+# Показатели на графике производительности; значения выбираются одним вызовом itemgetter
+PERFORMANCE_CHART_METRICS = ('average_score_per_player', 'average_lines_per_player', 'average_time_per_player')
+_get_performance_values = itemgetter(*PERFORMANCE_CHART_METRICS)
+_PERFORMANCE_IDX = np.arange(len(PERFORMANCE_CHART_METRICS))
+
+# Размер буфера записи HTML-отчета
+REPORT_WRITE_BUFFER = 1 << 20
+
+def _content_hash(section: Any) -> bytes:
+    """Хеш содержимого раздела результатов для проверки изменений"""
+    payload = json.dumps(section, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
 class DashboardReporter:
     """Генератор отчетов для дашборда"""
     
     def __init__(self, config: AnalyticsConfig):
         self.config = config
         self.logger = logging.getLogger(__name__)
-        self.env = Environment(loader=FileSystemLoader('templates'))
+        _apply_chart_style()
+        self.env = Environment(
+            loader=FileSystemLoader('templates'),
+            bytecode_cache=FileSystemBytecodeCache(),
+            auto_reload=False
+        )
+        self._template = self.env.get_template('dashboard.html')
+        
+        # Графики рисуются в пуле потоков, у каждого потока своя переиспользуемая фигура
+        self._executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="chart")
+        self._local = threading.local()
+        
+        # Последние построенные графики: имя -> (хеш данных, data-URI)
+        self._chart_cache: Dict[str, Tuple[bytes, str]] = {}
+        
+        # Отдельный поток для генерации отчетов из асинхронного кода
+        self._report_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report")
         
         # Создаем директорию для отчетов, если её нет
         os.makedirs(config.report_output_dir, exist_ok=True)
@@ -25,24 +97,34 @@ class DashboardReporter:
         """Сгенерировать отчет"""
         try:
             # Генерируем графики
-            self._generate_charts(results)
+            charts = self._generate_charts(results)
             
-            # Генерируем HTML отчет
-            template = self.env.get_template('dashboard.html')
-            report_html = template.render(
-                results=results,
-                timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                charts=self._get_chart_paths()
-            )
+            # Время отчета в шаблоне и в имени файла совпадает
+            now = datetime.now()
             
-            # Сохраняем отчет
             report_path = os.path.join(
                 self.config.report_output_dir,
-                f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+                f"report_{now.strftime('%Y%m%d_%H%M%S')}.html"
             )
             
-            with open(report_path, 'w', encoding='utf-8') as f:
-                f.write(report_html)
+            # Генерируем HTML отчет потоково прямо в файл, не собирая всю строку в памяти.
+            # Пишем во временный файл и атомарно переименовываем: читатели не увидят частичный отчет
+            stream = self._template.stream(
+                results=results,
+                timestamp=now.strftime('%Y-%m-%d %H:%M:%S'),
+                charts=charts
+            )
+            stream.enable_buffering(size=64)
+            tmp_path = report_path + ".tmp"
+            try:
+                with open(tmp_path, 'wb', buffering=REPORT_WRITE_BUFFER) as f:
+                    stream.dump(f, encoding='utf-8')
+                os.replace(tmp_path, report_path)
+            except Exception:
+                # Шаблон рендерится во время записи: при ошибке удаляем недописанный файл
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
                 
             self.logger.info(f"Generated report: {report_path}")
             return report_path
@@ -51,58 +133,95 @@ class DashboardReporter:
             self.logger.error(f"Error generating report: {e}")
             return ""
             
-    def _generate_charts(self, results: AnalyticsResults):
-        """Сгенерировать графики"""
+    async def generate_report_async(self, results: AnalyticsResults) -> str:
+        """Сгенерировать отчет, не блокируя цикл событий"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._report_executor, self.generate_report, results)
+        
+    def _generate_charts(self, results: AnalyticsResults) -> Dict[str, str]:
+        """Сгенерировать графики в виде data-URI для встраивания в отчет"""
+        charts: Dict[str, str] = {}
         try:
-            # Настройка стиля
-            plt.style.use('seaborn')
-            sns.set_palette("husl")
-            
-            # График распределения событий
-            if 'event_distribution' in results.gameplay_results:
-                plt.figure(figsize=(10, 6))
-                events = results.gameplay_results['event_distribution']
-                plt.bar(events.keys(), events.values())
-                plt.title('Распределение событий')
-                plt.xticks(rotation=45)
-                plt.tight_layout()
-                plt.savefig(os.path.join(self.config.report_output_dir, 'event_distribution.png'))
-                plt.close()
-            
-            # График производительности игроков
-            if 'player_performance' in results.gameplay_results:
-                plt.figure(figsize=(12, 6))
-                perf = results.gameplay_results['player_performance']
-                metrics = ['average_score_per_player', 'average_lines_per_player', 'average_time_per_player']
-                values = [perf[m] for m in metrics]
-                plt.bar(metrics, values)
-                plt.title('Средняя производительность игроков')
-                plt.xticks(rotation=45)
-                plt.tight_layout()
-                plt.savefig(os.path.join(self.config.report_output_dir, 'player_performance.png'))
-                plt.close()
+            gameplay_results = results.gameplay_results
+            plotters = (
+                ('event_distribution', self._plot_event_distribution),
+                ('player_performance', self._plot_player_performance),
+                ('player_clusters', self._plot_player_clusters),
+            )
+            jobs = []
             
-            # График кластеров игроков
-            if 'player_clusters' in results.gameplay_results:
-                clusters = results.gameplay_results['player_clusters']
-                plt.figure(figsize=(10, 6))
-                plt.pie(
-                    clusters['cluster_sizes'].values(),
-                    labels=[f'Кластер {i}' for i in clusters['cluster_sizes'].keys()],
-                    autopct='%1.1f%%'
-                )
-                plt.title('Распределение игроков по кластерам')
-                plt.tight_layout()
-                plt.savefig(os.path.join(self.config.report_output_dir, 'player_clusters.png'))
-                plt.close()
+            # Графики независимы: Agg и libpng отпускают GIL, поэтому рисуем параллельно
+            for name, plot in plotters:
+                if name not in gameplay_results:
+                    continue
+                section = gameplay_results[name]
+                
+                # Данные не изменились с прошлого отчета — используем готовый график
+                digest = _content_hash(section)
+                cached = self._chart_cache.get(name)
+                if cached is not None and cached[0] == digest:
+                    charts[name] = cached[1]
+                    continue
+                    
+                jobs.append((name, digest, self._executor.submit(plot, section)))
+                
+            for name, digest, job in jobs:
+                charts[name] = job.result()
+                self._chart_cache[name] = (digest, charts[name])
                 
         except Exception as e:
             self.logger.error(f"Error generating charts: {e}")
             
-    def _get_chart_paths(self) -> Dict[str, str]:
-        """Получить пути к сгенерированным графикам"""
-        return {
-            'event_distribution': 'event_distribution.png',
-            'player_performance': 'player_performance.png',
-            'player_clusters': 'player_clusters.png'
-        } 
\ No newline at end of file
+        return charts
+            
+    def _figure(self) -> Tuple[Figure, Axes]:
+        """Получить фигуру текущего потока (pyplot не потокобезопасен)"""
+        local = self._local
+        if not hasattr(local, 'fig'):
+            local.fig = Figure(figsize=(12, 6), layout='tight')
+            local.ax = local.fig.add_subplot()
+        local.ax.clear()
+        return local.fig, local.ax
+        
+    def _plot_event_distribution(self, events: Dict[str, int]) -> str:
+        """График распределения событий"""
+        fig, ax = self._figure()
+        fig.set_size_inches(10, 6)
+        labels = np.asarray(list(events.keys()))
+        values = np.fromiter(events.values(), dtype=np.float64, count=len(events))
+        idx = np.arange(len(labels))
+        ax.bar(idx, values)
+        ax.set_xticks(idx)
+        ax.set_xticklabels(labels, rotation=45)
+        ax.set_title('Распределение событий')
+        return self._to_data_uri(fig)
+        
+    def _plot_player_performance(self, perf: Dict[str, float]) -> str:
+        """График производительности игроков"""
+        fig, ax = self._figure()
+        fig.set_size_inches(12, 6)
+        values = np.array(_get_performance_values(perf), dtype=np.float64)
+        ax.bar(_PERFORMANCE_IDX, values)
+        ax.set_xticks(_PERFORMANCE_IDX)
+        ax.set_xticklabels(PERFORMANCE_CHART_METRICS, rotation=45)
+        ax.set_title('Средняя производительность игроков')
+        return self._to_data_uri(fig)
+        
+    def _plot_player_clusters(self, clusters: Dict[str, Dict[int, Any]]) -> str:
+        """График кластеров игроков"""
+        fig, ax = self._figure()
+        fig.set_size_inches(10, 6)
+        cluster_sizes = clusters['cluster_sizes']
+        sizes = np.fromiter(cluster_sizes.values(), dtype=np.float64, count=len(cluster_sizes))
+        pct = sizes / sizes.sum() * 100.0
+        # Проценты подставляются в подписи заранее вместо форматирования autopct по секторам
+        labels = [f'Кластер {k}\n{p:.1f}%' for k, p in zip(cluster_sizes.keys(), pct)]
+        ax.pie(sizes, labels=labels)
+        ax.set_title('Распределение игроков по кластерам')
+        return self._to_data_uri(fig)
+        
+    def _to_data_uri(self, fig: Figure) -> str:
+        """Закодировать фигуру в PNG data-URI без записи на диск"""
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', dpi=CHART_DPI, metadata=_PNG_METADATA, pil_kwargs=_PNG_PIL_KWARGS)
+        return "data:image/png;base64," + b64encode(buf.getbuffer()).decode('ascii')
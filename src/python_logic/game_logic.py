@@ -14,21 +14,45 @@ to the specialized C++ component.
 """
 
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Any, Union, Callable
+import math
+from typing import Dict, List, Tuple, Optional, Any, Union, Callable, ClassVar, Deque, Iterable, Set
 import json
+import pickle
+import base64
 import uuid
 import time
 import random
+import heapq
+import contextlib
+from collections import deque
+import bisect
+import itertools
 from loguru import logger
 import threading
 import queue
-import ctypes
+from concurrent.futures import Future, ThreadPoolExecutor
 import os
 import sys
 from enum import Enum, auto
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from abc import ABC, abstractmethod
 from pydantic import BaseModel, Field
+from cffi import FFI
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; without it the integrator falls back to NumPy and the board kernels run as Python
+    njit = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; without it the board and game state payloads use json
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack is only needed for the packed player sync format
+    msgpack = None
 
 # Configure logging
 logger.add("tetris_towers_logic.log", rotation="1 day", retention="7 days")
@@ -92,12 +116,21 @@ class GameConstants:
     AI_DIFFICULTY_EASY = "easy"
     AI_DIFFICULTY_MEDIUM = "medium"
     AI_DIFFICULTY_HARD = "hard"
+    # Mean AI action rates (per second): the former 10% / 5% / 1% chance per tick at ~60 Hz
+    AI_MOVE_RATE = 6.5
+    AI_ROTATE_RATE = 3.2
+    AI_SPELL_RATE = 0.6
     
     # Misc
     MAX_PLAYERS = 4
     MAX_BLOCKS = 1000
     MAX_SPELLS = 10
+    NEXT_BLOCKS = 3  # upcoming blocks queued after the current one
     SAVE_INTERVAL = 60  # seconds
+    SAVE_FORMAT = "pickle"  # checkpoint file extension; .json files from older versions still load
+    SAVE_WRITE_BUFFER = 1 << 20  # bytes
+    SAVE_RAW_BUFFER_MIN = 256  # bytes; smaller arrays stay inside the pickle stream
+    FULL_SAVE_EVERY = 10  # incremental checkpoints between two full ones
 
 
 class BlockType(Enum):
@@ -160,7 +193,46 @@ class Direction(Enum):
     UP = auto()  # Rarely used but included for completeness
 
 
-@dataclass
+# Enum lookups for hot paths, resolved once instead of going through EnumMeta on every call
+# Rotations in clockwise order; four of them, so stepping wraps with "& 3" instead of a modulo
+_ROT_TUPLE: Tuple[BlockRotation, ...] = tuple(BlockRotation)
+_ROT_IDX: Dict[BlockRotation, int] = {rotation: i for i, rotation in enumerate(_ROT_TUPLE)}
+# (dx, dy) unit step for each movement direction
+_DIR_DELTA: Dict[Direction, Tuple[int, int]] = {
+    Direction.LEFT: (-1, 0),
+    Direction.RIGHT: (1, 0),
+    Direction.DOWN: (0, 1),
+    Direction.UP: (0, -1),
+}
+_ROTATION_BY_VALUE: Dict[int, BlockRotation] = {rotation.value: rotation for rotation in BlockRotation}
+_BLOCK_TYPE_BY_NAME: Dict[str, BlockType] = dict(BlockType.__members__)
+_SPELL_TYPE_BY_NAME: Dict[str, SpellType] = dict(SpellType.__members__)
+_BLOCK_TYPE_BY_VALUE: Dict[int, BlockType] = {block_type.value: block_type for block_type in BlockType}
+_SPELL_TYPE_BY_VALUE: Dict[int, SpellType] = {spell_type.value: spell_type for spell_type in SpellType}
+_PLAYER_STATE_BY_VALUE: Dict[int, PlayerState] = {state.value: state for state in PlayerState}
+# Points for clearing 0-4 lines at once, indexed by min(lines_cleared, 4)
+_LINE_POINTS: Tuple[int, ...] = (
+    0,
+    GameConstants.POINTS_SINGLE_LINE,
+    GameConstants.POINTS_DOUBLE_LINE,
+    GameConstants.POINTS_TRIPLE_LINE,
+    GameConstants.POINTS_TETRIS,
+)
+
+# Field order of the positional (array) encodings used by the msgpack sync format.
+# Enums are encoded by value and positions/velocities are flattened to x, y.
+_BLOCK_FIELDS = ("id", "block_type", "position.x", "position.y", "rotation", "angle",
+                 "velocity.x", "velocity.y", "angular_velocity", "density", "friction",
+                 "restitution", "is_active", "is_static", "is_placed", "player_id")
+_SPELL_FIELDS = ("id", "name", "spell_type", "effect", "duration", "strength", "target_type",
+                 "cooldown", "mana_cost", "description", "icon_path")
+_ACTIVE_SPELL_FIELDS = ("spell", "caster_id", "target_id", "start_time", "end_time", "is_active")
+_PLAYER_FIELDS = ("id", "name", "state", "score", "level", "lines_cleared", "combo_count", "mana",
+                  "max_mana", "spells", "active_spells", "current_block", "next_blocks",
+                  "blocks_placed", "is_ai", "ai_difficulty", "last_action_time")
+
+
+@dataclass(slots=True)
 class Position:
     """2D position with x and y coordinates."""
     x: float
@@ -174,7 +246,7 @@ class Position:
     
     def distance_to(self, other) -> float:
         """Calculate Euclidean distance to another position."""
-        return ((self.x - other.x) ** 2 + (self.y - other.y) ** 2) ** 0.5
+        return math.hypot(self.x - other.x, self.y - other.y)
     
     def to_tuple(self) -> Tuple[float, float]:
         """Convert to tuple representation."""
@@ -190,9 +262,31 @@ class Position:
 class BlockShape:
     """Represents the shape of a tetromino block."""
     block_type: BlockType
-    cells: List[List[bool]]  # 2D grid representing the shape
+    cells: np.ndarray  # 2D boolean grid representing the shape
     width: int
     height: int
+    # (row offset, bit pattern) of each occupied row; bit i is set for column offset i
+    row_masks: Tuple[Tuple[int, int], ...] = field(init=False, repr=False, compare=False)
+    # (n, 2) array of (dx, dy) offsets of the filled cells
+    offsets: np.ndarray = field(init=False, repr=False, compare=False)
+    # Bit pattern of every shape row (including empty ones), indexed by row offset
+    row_bits: np.ndarray = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Precompute the filled-cell offsets and the row bit patterns used for collision tests."""
+        self.cells = np.asarray(self.cells, dtype=np.bool_)
+        self.offsets = np.argwhere(self.cells)[:, ::-1].astype(np.int32)
+        self.row_bits = (self.cells @ (1 << np.arange(self.width))).astype(np.uint16)
+        self.row_masks = tuple((dy, bits) for dy, bits in enumerate(self.row_bits.tolist()) if bits)
+    
+    def __eq__(self, other: object) -> bool:
+        """Compare shapes field by field; the cell grid is an array and is compared as a whole."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            (self.block_type, self.width, self.height) == (other.block_type, other.width, other.height)
+            and np.array_equal(self.cells, other.cells)
+        )
     
     @classmethod
     def create(cls, block_type: BlockType) -> 'BlockShape':
@@ -277,15 +371,11 @@ class BlockShape:
         elif block_type == BlockType.SPECIAL:
             # Create a random special block for Tricky Towers mechanics
             # This is just an example; actual special blocks would be more varied
-            cells = [[False for _ in range(3)] for _ in range(3)]
-            # Create a random pattern
-            for i in range(3):
-                for j in range(3):
-                    cells[i][j] = random.random() > 0.5
+            cells = np.random.random((3, 3)) > 0.5
             
             # Ensure at least one cell is filled
-            if not any(any(row) for row in cells):
-                cells[1][1] = True
+            if not cells.any():
+                cells[1, 1] = True
                 
             return cls(
                 block_type=BlockType.SPECIAL,
@@ -305,37 +395,33 @@ class BlockShape:
         if self.block_type == BlockType.O:
             return self
         
-        new_cells = []
-        
-        if rotation == BlockRotation.R90:
-            # 90 degrees clockwise
-            new_cells = [[False for _ in range(self.height)] for _ in range(self.width)]
-            for i in range(self.height):
-                for j in range(self.width):
-                    new_cells[j][self.height - 1 - i] = self.cells[i][j]
-            return BlockShape(self.block_type, new_cells, self.height, self.width)
-        
-        elif rotation == BlockRotation.R180:
-            # 180 degrees
-            new_cells = [[False for _ in range(self.width)] for _ in range(self.height)]
-            for i in range(self.height):
-                for j in range(self.width):
-                    new_cells[self.height - 1 - i][self.width - 1 - j] = self.cells[i][j]
-            return BlockShape(self.block_type, new_cells, self.width, self.height)
-        
-        elif rotation == BlockRotation.R270:
-            # 270 degrees clockwise (or 90 counterclockwise)
-            new_cells = [[False for _ in range(self.height)] for _ in range(self.width)]
-            for i in range(self.height):
-                for j in range(self.width):
-                    new_cells[self.width - 1 - j][i] = self.cells[i][j]
-            return BlockShape(self.block_type, new_cells, self.height, self.width)
-        
-        else:
-            raise ValueError(f"Unknown rotation: {rotation}")
+        # Negative k rotates clockwise
+        new_cells = np.ascontiguousarray(np.rot90(self.cells, k=-(rotation.value // 90)))
+        height, width = new_cells.shape
+        return BlockShape(self.block_type, new_cells, width, height)
+    
+    def orientations(self) -> Dict[BlockRotation, 'BlockShape']:
+        """Get every rotation of this shape, treating it as the R0 orientation."""
+        return {rotation: self.rotate(rotation) for rotation in BlockRotation}
 
 
-@dataclass
+# All orientations of the standard tetrominoes, built once at import.
+# SPECIAL shapes are random, so each SPECIAL block computes its own.
+SHAPES: Dict[BlockType, Dict[BlockRotation, BlockShape]] = {
+    block_type: BlockShape.create(block_type).orientations()
+    for block_type in BlockType
+    if block_type != BlockType.SPECIAL
+}
+
+
+def _shape_for(block_type: BlockType, rotation: BlockRotation) -> BlockShape:
+    """Get the shape of a block type in the given rotation (a new random one for SPECIAL)."""
+    if block_type in SHAPES:
+        return SHAPES[block_type][rotation]
+    return BlockShape.create(block_type).rotate(rotation)
+
+
+@dataclass(slots=True)
 class Block:
     """Represents a block in the game with physical properties."""
     id: int
@@ -353,33 +439,58 @@ class Block:
     is_static: bool = False
     is_placed: bool = False
     player_id: Optional[str] = None
+    _shapes: Dict[BlockRotation, BlockShape] = field(init=False, repr=False, compare=False)
+    # Last get_cells result and the (cell x, cell y, shape) it was computed for
+    _cells_key: Optional[Tuple[int, int, BlockShape]] = field(default=None, init=False, repr=False, compare=False)
+    _cells_cache: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Look up (or, for SPECIAL blocks, precompute) the shape of every rotation."""
+        if self.block_type in SHAPES:
+            self._shapes = SHAPES[self.block_type]
+        else:
+            # The given shape is already rotated; turn it back to R0 before building the variants
+            base = self.shape.rotate(_ROTATION_BY_VALUE[(360 - self.rotation.value) % 360])
+            self._shapes = base.orientations()
+    
+    def reset(self, block_id: int, block_type: BlockType, shape: BlockShape, player_id: Optional[str] = None) -> None:
+        """Reinitialize a recycled block in place, reusing its position and velocity objects."""
+        self.id = block_id
+        self.block_type = block_type
+        self.shape = shape
+        self.position.x = 0
+        self.position.y = 0
+        self.rotation = BlockRotation.R0
+        self.angle = 0.0
+        self.velocity.x = 0
+        self.velocity.y = 0
+        self.angular_velocity = 0.0
+        self.density = GameConstants.BLOCK_DENSITY
+        self.friction = GameConstants.BLOCK_FRICTION
+        self.restitution = GameConstants.BLOCK_RESTITUTION
+        self.is_active = True
+        self.is_static = False
+        self.is_placed = False
+        self.player_id = player_id
+        self._cells_key = None
+        self._cells_cache = None
+        self.__post_init__()
     
     def rotate_clockwise(self) -> None:
         """Rotate the block 90 degrees clockwise."""
-        rotations = list(BlockRotation)
-        current_idx = rotations.index(self.rotation)
-        next_idx = (current_idx + 1) % len(rotations)
-        self.rotation = rotations[next_idx]
-        self.shape = self.shape.rotate(self.rotation)
+        self.rotation = _ROT_TUPLE[(_ROT_IDX[self.rotation] + 1) & 3]
+        self.shape = self._shapes[self.rotation]
     
     def rotate_counterclockwise(self) -> None:
         """Rotate the block 90 degrees counterclockwise."""
-        rotations = list(BlockRotation)
-        current_idx = rotations.index(self.rotation)
-        next_idx = (current_idx - 1) % len(rotations)
-        self.rotation = rotations[next_idx]
-        self.shape = self.shape.rotate(self.rotation)
+        self.rotation = _ROT_TUPLE[(_ROT_IDX[self.rotation] - 1) & 3]
+        self.shape = self._shapes[self.rotation]
     
     def move(self, direction: Direction, distance: float = 1.0) -> None:
         """Move the block in the specified direction."""
-        if direction == Direction.LEFT:
-            self.position.x -= distance
-        elif direction == Direction.RIGHT:
-            self.position.x += distance
-        elif direction == Direction.DOWN:
-            self.position.y += distance
-        elif direction == Direction.UP:
-            self.position.y -= distance
+        dx, dy = _DIR_DELTA[direction]
+        self.position.x += dx * distance
+        self.position.y += dy * distance
     
     def apply_force(self, force_x: float, force_y: float) -> None:
         """Apply a force to the block, changing its velocity."""
@@ -396,24 +507,81 @@ class Block:
         self.position.y += self.velocity.y * dt
         self.angle += self.angular_velocity * dt
     
-    def get_cells(self) -> List[Tuple[int, int]]:
-        """Get the list of cells occupied by this block in its current position and rotation."""
-        cells = []
-        for i in range(self.shape.height):
-            for j in range(self.shape.width):
-                if self.shape.cells[i][j]:
-                    x = int(self.position.x) + j
-                    y = int(self.position.y) + i
-                    cells.append((x, y))
+    def get_cells(self) -> np.ndarray:
+        """Get the (n, 2) array of (x, y) cells occupied by this block in its current position and rotation.
+        
+        The result is cached until the block moves to another cell or changes shape, and is read-only.
+        """
+        x = int(self.position.x)
+        y = int(self.position.y)
+        shape = self.shape
+        key = self._cells_key
+        if key is not None and key[0] == x and key[1] == y and key[2] is shape:
+            return self._cells_cache
+        
+        cells = shape.offsets + (x, y)
+        cells.flags.writeable = False
+        self._cells_key = (x, y, shape)
+        self._cells_cache = cells
         return cells
     
     def collides_with(self, other: 'Block') -> bool:
         """Check if this block collides with another block."""
-        my_cells = self.get_cells()
-        other_cells = other.get_cells()
+        dx = int(other.position.x) - int(self.position.x)
+        dy = int(other.position.y) - int(self.position.y)
+        if dx >= self.shape.width or -dx >= other.shape.width:
+            return False
+        
+        # Rows both shapes cover, in this block's row offsets
+        mine = self.shape.row_bits
+        theirs = other.shape.row_bits
+        lo = max(0, dy)
+        hi = min(len(mine), dy + len(theirs))
+        if lo >= hi:
+            return False
+        mine = mine[lo:hi]
+        theirs = theirs[lo - dy:hi - dy]
         
-        # Check for any overlapping cells
-        return any(cell in other_cells for cell in my_cells)
+        # Shift the block further to the right onto the other's column origin and AND the rows
+        if dx >= 0:
+            theirs = theirs << dx
+        else:
+            mine = mine << -dx
+        return bool((mine & theirs).any())
+    
+    def to_array(self) -> List[Any]:
+        """Convert the block to a positional list in _BLOCK_FIELDS order."""
+        return [
+            self.id, self.block_type.value, self.position.x, self.position.y,
+            self.rotation.value, self.angle, self.velocity.x, self.velocity.y,
+            self.angular_velocity, self.density, self.friction, self.restitution,
+            self.is_active, self.is_static, self.is_placed, self.player_id
+        ]
+    
+    @classmethod
+    def from_array(cls, arr: List[Any]) -> 'Block':
+        """Create a Block from a list produced by to_array."""
+        (block_id, type_value, x, y, rotation_value, angle, vx, vy, angular_velocity,
+         density, friction, restitution, is_active, is_static, is_placed, player_id) = arr
+        block_type = _BLOCK_TYPE_BY_VALUE[type_value]
+        rotation = _ROTATION_BY_VALUE[rotation_value]
+        return cls(
+            id=block_id,
+            block_type=block_type,
+            shape=_shape_for(block_type, rotation),
+            position=Position(x, y),
+            rotation=rotation,
+            angle=angle,
+            velocity=Position(vx, vy),
+            angular_velocity=angular_velocity,
+            density=density,
+            friction=friction,
+            restitution=restitution,
+            is_active=is_active,
+            is_static=is_static,
+            is_placed=is_placed,
+            player_id=player_id
+        )
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert the block to a dictionary for serialization."""
@@ -437,13 +605,10 @@ class Block:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Block':
         """Create a Block from a dictionary."""
-        block_type = BlockType[data["block_type"]]
-        shape = BlockShape.create(block_type)
-        rotation = BlockRotation(data["rotation"])
+        block_type = _BLOCK_TYPE_BY_NAME[data["block_type"]]
+        rotation = _ROTATION_BY_VALUE[data["rotation"]]
         
-        # Apply the rotation to the shape
-        if rotation != BlockRotation.R0:
-            shape = shape.rotate(rotation)
+        shape = _shape_for(block_type, rotation)
         
         return cls(
             id=data["id"],
@@ -464,7 +629,7 @@ class Block:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Spell:
     """Represents a spell that can be cast during gameplay."""
     id: str
@@ -479,6 +644,33 @@ class Spell:
     description: str
     icon_path: str
     
+    def to_array(self) -> List[Any]:
+        """Convert the spell to a positional list in _SPELL_FIELDS order."""
+        return [
+            self.id, self.name, self.spell_type.value, self.effect, self.duration,
+            self.strength, self.target_type, self.cooldown, self.mana_cost,
+            self.description, self.icon_path
+        ]
+    
+    @classmethod
+    def from_array(cls, arr: List[Any]) -> 'Spell':
+        """Create a Spell from a list produced by to_array."""
+        (spell_id, name, type_value, effect, duration, strength, target_type,
+         cooldown, mana_cost, description, icon_path) = arr
+        return cls(
+            id=spell_id,
+            name=name,
+            spell_type=_SPELL_TYPE_BY_VALUE[type_value],
+            effect=effect,
+            duration=duration,
+            strength=strength,
+            target_type=target_type,
+            cooldown=cooldown,
+            mana_cost=mana_cost,
+            description=description,
+            icon_path=icon_path
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert the spell to a dictionary for serialization."""
         return {
@@ -501,7 +693,7 @@ class Spell:
         return cls(
             id=data["id"],
             name=data["name"],
-            spell_type=SpellType[data["spell_type"]],
+            spell_type=_SPELL_TYPE_BY_NAME[data["spell_type"]],
             effect=data["effect"],
             duration=data["duration"],
             strength=data["strength"],
@@ -513,7 +705,7 @@ class Spell:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ActiveSpell:
     """Represents an active spell affecting the game."""
     spell: Spell
@@ -523,15 +715,57 @@ class ActiveSpell:
     end_time: float
     is_active: bool = True
     
+    # Expired instances kept for reuse by acquire()
+    _pool: ClassVar[List['ActiveSpell']] = []
+    _POOL_LIMIT: ClassVar[int] = 4 * GameConstants.MAX_SPELLS
+    
+    @classmethod
+    def acquire(cls, spell: Spell, caster_id: str, target_id: str, start_time: float) -> 'ActiveSpell':
+        """Get an active spell from the pool, or create one, ending spell.duration after start_time."""
+        end_time = start_time + spell.duration
+        try:
+            active_spell = cls._pool.pop()
+        except IndexError:
+            return cls(spell, caster_id, target_id, start_time, end_time)
+        active_spell.spell = spell
+        active_spell.caster_id = caster_id
+        active_spell.target_id = target_id
+        active_spell.start_time = start_time
+        active_spell.end_time = end_time
+        active_spell.is_active = True
+        return active_spell
+    
+    @classmethod
+    def release(cls, active_spell: 'ActiveSpell') -> None:
+        """Return an expired spell that nothing references any more to the pool."""
+        if len(cls._pool) < cls._POOL_LIMIT:
+            cls._pool.append(active_spell)
+    
     def is_expired(self, current_time: float) -> bool:
         """Check if the spell has expired."""
         return current_time >= self.end_time
     
     def remaining_time(self, current_time: float) -> float:
         """Get the remaining time for this spell."""
-        if self.is_expired(current_time):
-            return 0.0
-        return self.end_time - current_time
+        return max(self.end_time - current_time, 0.0)
+    
+    def to_array(self) -> List[Any]:
+        """Convert the active spell to a positional list in _ACTIVE_SPELL_FIELDS order."""
+        return [self.spell.to_array(), self.caster_id, self.target_id,
+                self.start_time, self.end_time, self.is_active]
+    
+    @classmethod
+    def from_array(cls, arr: List[Any]) -> 'ActiveSpell':
+        """Create an ActiveSpell from a list produced by to_array."""
+        spell, caster_id, target_id, start_time, end_time, is_active = arr
+        return cls(
+            spell=Spell.from_array(spell),
+            caster_id=caster_id,
+            target_id=target_id,
+            start_time=start_time,
+            end_time=end_time,
+            is_active=is_active
+        )
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert the active spell to a dictionary for serialization."""
@@ -557,6 +791,10 @@ class ActiveSpell:
         )
 
 
+# Tie-breaker for active spells expiring at the same time
+_EXPIRY_SEQUENCE = itertools.count()
+
+
 @dataclass
 class Player:
     """Represents a player in the game."""
@@ -572,11 +810,62 @@ class Player:
     spells: List[Spell] = field(default_factory=list)
     active_spells: List[ActiveSpell] = field(default_factory=list)
     current_block: Optional[Block] = None
-    next_blocks: List[Block] = field(default_factory=list)
+    next_blocks: Deque[Block] = field(default_factory=deque)
     blocks_placed: int = 0
     is_ai: bool = False
     ai_difficulty: Optional[str] = None
     last_action_time: float = field(default_factory=time.time)
+    _spell_by_id: Dict[str, Spell] = field(init=False, repr=False, compare=False)
+    # Heap of (end_time, sequence, active spell), so expired spells are found without a full scan
+    _expiry: List[Tuple[float, int, ActiveSpell]] = field(init=False, repr=False, compare=False)
+    # Seconds until the AI's next move, rotation and spell; exponential waits make each a Poisson process
+    ai_move_timer: float = field(default_factory=lambda: random.expovariate(GameConstants.AI_MOVE_RATE),
+                                 init=False, repr=False, compare=False)
+    ai_rotate_timer: float = field(default_factory=lambda: random.expovariate(GameConstants.AI_ROTATE_RATE),
+                                   init=False, repr=False, compare=False)
+    ai_spell_timer: float = field(default_factory=lambda: random.expovariate(GameConstants.AI_SPELL_RATE),
+                                  init=False, repr=False, compare=False)
+    # Product of the strengths of the active multiply spells, kept in step with active_spells
+    score_multiplier: float = field(default=1.0, init=False, repr=False, compare=False)
+    # Fall speed of the current block in cells per second, recomputed only when the level changes
+    fall_speed: float = field(default=0.0, init=False, repr=False, compare=False)
+    # Serializes the actions on this player's block and spells (see GameManager)
+    action_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Index the spells by ID and queue the active spells by expiry time."""
+        self._spell_by_id = {spell.id: spell for spell in self.spells}
+        self._expiry = [
+            (active_spell.end_time, next(_EXPIRY_SEQUENCE), active_spell)
+            for active_spell in self.active_spells
+        ]
+        heapq.heapify(self._expiry)
+        self._refresh_score_multiplier()
+        self._refresh_fall_speed()
+    
+    def _refresh_fall_speed(self) -> None:
+        """Recompute the block fall speed for the current level."""
+        self.fall_speed = GameConstants.INITIAL_FALL_SPEED * self.level * GameConstants.SPEED_INCREASE_FACTOR
+    
+    def _refresh_score_multiplier(self) -> None:
+        """Recompute the line score multiplier from the active multiply spells."""
+        multiplier = 1.0
+        for active_spell in self.active_spells:
+            if active_spell.spell.effect == GameConstants.SPELL_EFFECT_MULTIPLY:
+                multiplier *= active_spell.spell.strength
+        self.score_multiplier = multiplier
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle everything except the action lock."""
+        state = self.__dict__.copy()
+        del state["action_lock"]
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled player with a fresh action lock."""
+        self.__dict__.update(state)
+        self.action_lock = threading.Lock()
+        self._refresh_fall_speed()
     
     def add_score(self, points: int) -> None:
         """Add points to the player's score."""
@@ -590,6 +879,7 @@ class Player:
         new_level = (self.lines_cleared // 10) + 1
         if new_level > self.level:
             self.level = new_level
+            self._refresh_fall_speed()
     
     def add_mana(self, amount: int) -> None:
         """Add mana to the player's pool."""
@@ -605,34 +895,98 @@ class Player:
     def add_spell(self, spell: Spell) -> None:
         """Add a spell to the player's collection."""
         self.spells.append(spell)
+        self._spell_by_id[spell.id] = spell
+    
+    def set_spells(self, spells: List[Spell]) -> None:
+        """Replace the player's spell collection."""
+        self.spells = list(spells)
+        self._spell_by_id = {spell.id: spell for spell in self.spells}
+    
+    def get_spell(self, spell_id: str) -> Optional[Spell]:
+        """Get one of the player's spells by ID."""
+        return self._spell_by_id.get(spell_id)
     
     def cast_spell(self, spell_id: str, target_id: str, current_time: float) -> Optional[ActiveSpell]:
         """Cast a spell if the player has it and enough mana."""
-        spell = next((s for s in self.spells if s.id == spell_id), None)
+        spell = self._spell_by_id.get(spell_id)
         if not spell:
             return None
         
         if not self.use_mana(spell.mana_cost):
             return None
         
-        active_spell = ActiveSpell(
-            spell=spell,
-            caster_id=self.id,
-            target_id=target_id,
-            start_time=current_time,
-            end_time=current_time + spell.duration
-        )
+        active_spell = ActiveSpell.acquire(spell, self.id, target_id, current_time)
         
         self.active_spells.append(active_spell)
+        heapq.heappush(self._expiry, (active_spell.end_time, next(_EXPIRY_SEQUENCE), active_spell))
+        if spell.effect == GameConstants.SPELL_EFFECT_MULTIPLY:
+            self.score_multiplier *= spell.strength
         return active_spell
     
-    def update_active_spells(self, current_time: float) -> None:
-        """Update the status of active spells and remove expired ones."""
+    def update_active_spells(self, current_time: float) -> Iterable[ActiveSpell]:
+        """Update the status of active spells and return the expired ones it removed."""
+        expiry = self._expiry
+        if not expiry or expiry[0][0] > current_time:
+            return ()
+        
+        expired = {}
+        while expiry and expiry[0][0] <= current_time:
+            active_spell = heapq.heappop(expiry)[2]
+            expired[id(active_spell)] = active_spell
         self.active_spells = [
             spell for spell in self.active_spells
-            if not spell.is_expired(current_time)
+            if id(spell) not in expired
+        ]
+        self._refresh_score_multiplier()
+        return expired.values()
+    
+    def to_msgpack_array(self) -> List[Any]:
+        """Convert the player to a positional list in _PLAYER_FIELDS order."""
+        return [
+            self.id, self.name, self.state.value, self.score, self.level,
+            self.lines_cleared, self.combo_count, self.mana, self.max_mana,
+            [spell.to_array() for spell in self.spells],
+            [spell.to_array() for spell in self.active_spells],
+            self.current_block.to_array() if self.current_block else None,
+            [block.to_array() for block in self.next_blocks],
+            self.blocks_placed, self.is_ai, self.ai_difficulty, self.last_action_time
         ]
     
+    @classmethod
+    def from_msgpack_array(cls, arr: List[Any]) -> 'Player':
+        """Create a Player from a list produced by to_msgpack_array."""
+        (player_id, name, state_value, score, level, lines_cleared, combo_count, mana,
+         max_mana, spells, active_spells, current_block, next_blocks, blocks_placed,
+         is_ai, ai_difficulty, last_action_time) = arr
+        return cls(
+            id=player_id,
+            name=name,
+            state=_PLAYER_STATE_BY_VALUE[state_value],
+            score=score,
+            level=level,
+            lines_cleared=lines_cleared,
+            combo_count=combo_count,
+            mana=mana,
+            max_mana=max_mana,
+            spells=[Spell.from_array(spell) for spell in spells],
+            active_spells=[ActiveSpell.from_array(spell) for spell in active_spells],
+            current_block=Block.from_array(current_block) if current_block else None,
+            next_blocks=deque(Block.from_array(block) for block in next_blocks),
+            blocks_placed=blocks_placed,
+            is_ai=is_ai,
+            ai_difficulty=ai_difficulty,
+            last_action_time=last_action_time
+        )
+    
+    def to_msgpack(self) -> bytes:
+        """Pack the player into the compact msgpack sync format."""
+        return msgpack.packb(self.to_msgpack_array(), use_bin_type=True)
+    
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> 'Player':
+        """Unpack a player packed with to_msgpack."""
+        return cls.from_msgpack_array(msgpack.unpackb(data, raw=False))
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert the player to a dictionary for serialization."""
         return {
@@ -679,22 +1033,287 @@ class Player:
         if data["current_block"]:
             player.current_block = Block.from_dict(data["current_block"])
         
-        player.next_blocks = [Block.from_dict(block_data) for block_data in data["next_blocks"]]
+        player.next_blocks = deque(Block.from_dict(block_data) for block_data in data["next_blocks"])
         
         return player
 
 
+def _integrate_numpy(pos_x, pos_y, vel_x, vel_y, angle, ang_vel, is_static, dt):
+    """Advance positions and angles of non-static blocks by one time step in place."""
+    moving = ~is_static
+    pos_x[moving] += vel_x[moving] * dt
+    pos_y[moving] += vel_y[moving] * dt
+    angle[moving] += ang_vel[moving] * dt
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True)
+    def _integrate(pos_x, pos_y, vel_x, vel_y, angle, ang_vel, is_static, dt):
+        """Advance positions and angles of non-static blocks by one time step in place (parallel over blocks)."""
+        for i in prange(pos_x.size):
+            if not is_static[i]:
+                pos_x[i] += vel_x[i] * dt
+                pos_y[i] += vel_y[i] * dt
+                angle[i] += ang_vel[i] * dt
+else:
+    _integrate = _integrate_numpy
+
+
+def _shape_fits(row_mask, row_bits, x, y, full_row):
+    """Check whether a shape with the given row bit patterns fits the bitboard with its origin at column x, row y."""
+    height = row_mask.shape[0]
+    for dy in range(row_bits.shape[0]):
+        bits = int(row_bits[dy])
+        if bits == 0:
+            continue
+        row = y + dy
+        if row < 0 or row >= height:
+            return False
+        
+        # Align the shape row with the board; bits shifted off either edge are out of bounds
+        if x < 0:
+            if bits & ((1 << -x) - 1):
+                return False
+            bits >>= -x
+        else:
+            bits <<= x
+            if bits > full_row:
+                return False
+        
+        if int(row_mask[row]) & bits:
+            return False
+    return True
+
+
+def _drop_distance(row_mask, row_bits, x, y, full_row):
+    """Count the whole rows a shape at column x and (fractional) row y can fall before it collides."""
+    distance = 0
+    while _shape_fits(row_mask, row_bits, x, int(y + (distance + 1)), full_row):
+        distance += 1
+    return distance
+
+
+def _find_kick(row_mask, row_bits, x, y, kicks, full_row):
+    """Get the index of the first (dx, dy) in kicks that makes the shape fit at (x + dx, y + dy), or -1."""
+    for i in range(kicks.shape[0]):
+        if _shape_fits(row_mask, row_bits, int(x + kicks[i, 0]), int(y + kicks[i, 1]), full_row):
+            return i
+    return -1
+
+
+if njit is not None:
+    # Same bodies compiled; _drop_distance and _find_kick call the compiled _shape_fits.
+    # No cache=True here or on _integrate: Numba's disk cache stores the kernels' globals under
+    # the name the module was imported as, and loading them under another name fails
+    _shape_fits = njit(_shape_fits)
+    _drop_distance = njit(_drop_distance)
+    _find_kick = njit(_find_kick)
+
+
+# Positions tried when a rotated block does not fit: in place first, then the wall kicks
+ROTATION_KICKS = np.array([
+    (0, 0),
+    (1, 0), (-1, 0), (0, 1), (0, -1),  # Basic NESW
+    (2, 0), (-2, 0), (0, 2), (0, -2),  # Extended NESW
+    (1, 1), (-1, 1), (1, -1), (-1, -1)  # Diagonals
+], dtype=np.int32)
+
+
+def warm_up_board_kernels() -> None:
+    """Run the board kernels once so that JIT compilation happens up front."""
+    board = GameBoard(GameConstants.BOARD_WIDTH, GameConstants.BOARD_HEIGHT)
+    row_bits = SHAPES[BlockType.T][BlockRotation.R0].row_bits
+    _drop_distance(board.row_mask, row_bits, 0, 0.0, board._full_row)
+    _find_kick(board.row_mask, row_bits, 0.0, 0.0, ROTATION_KICKS, board._full_row)
+    
+    # One resting row of the block store's columns
+    store = board.store
+    _integrate(store.pos_x[:1], store.pos_y[:1], store.vel_x[:1], store.vel_y[:1],
+               store.angle[:1], store.ang_vel[:1], store.is_static[:1], 0.0)
+
+
+class BlockStore:
+    """Columnar (structure-of-arrays) physical state of the blocks placed on a board.
+    
+    Every placed block owns one row; sweeps over a single property (integration,
+    friction changes, ...) run over contiguous columns and are written back to the
+    Block objects afterwards with write_back().
+    """
+    
+    FLOAT_COLUMNS = ("pos_x", "pos_y", "vel_x", "vel_y", "angle", "ang_vel",
+                     "density", "friction", "restitution")
+    
+    def __init__(self, capacity: int = GameConstants.MAX_BLOCKS):
+        """Allocate the columns for up to capacity blocks."""
+        self.size = 0
+        self.index: Dict[int, int] = {}  # block ID -> row
+        self.rows: List[Block] = []      # row -> block
+        self._dynamic_rows: Optional[np.ndarray] = None  # cached rows of non-static blocks
+        self._allocate(capacity)
+    
+    def _allocate(self, capacity: int) -> None:
+        """(Re)allocate the columns, keeping the first size rows."""
+        n = self.size
+        for name in self.FLOAT_COLUMNS:
+            column = np.zeros(capacity, dtype=np.float64)
+            if n:
+                column[:n] = getattr(self, name)[:n]
+            setattr(self, name, column)
+        is_static = np.zeros(capacity, dtype=np.bool_)
+        is_active = np.zeros(capacity, dtype=np.bool_)
+        ids = np.zeros(capacity, dtype=np.int32)
+        if n:
+            is_static[:n] = self.is_static[:n]
+            is_active[:n] = self.is_active[:n]
+            ids[:n] = self.ids[:n]
+        self.is_static = is_static
+        self.is_active = is_active
+        self.ids = ids
+    
+    def add(self, block: Block) -> int:
+        """Add a block and return its row."""
+        if block.id in self.index:
+            self.remove(block.id)
+        if self.size == len(self.pos_x):
+            self._allocate(2 * self.size)
+        
+        row = self.size
+        self.pos_x[row] = block.position.x
+        self.pos_y[row] = block.position.y
+        self.vel_x[row] = block.velocity.x
+        self.vel_y[row] = block.velocity.y
+        self.angle[row] = block.angle
+        self.ang_vel[row] = block.angular_velocity
+        self.density[row] = block.density
+        self.friction[row] = block.friction
+        self.restitution[row] = block.restitution
+        self.is_static[row] = block.is_static
+        self.is_active[row] = block.is_active
+        self.ids[row] = block.id
+        
+        self.index[block.id] = row
+        self.rows.append(block)
+        self.size += 1
+        self._dynamic_rows = None
+        return row
+    
+    def remove(self, block_id: int) -> bool:
+        """Remove a block, moving the last row into its place."""
+        row = self.index.pop(block_id, None)
+        if row is None:
+            return False
+        
+        last = self.size - 1
+        if row != last:
+            for name in self.FLOAT_COLUMNS:
+                column = getattr(self, name)
+                column[row] = column[last]
+            self.is_static[row] = self.is_static[last]
+            self.is_active[row] = self.is_active[last]
+            self.ids[row] = self.ids[last]
+            moved = self.rows[last]
+            self.rows[row] = moved
+            self.index[moved.id] = row
+        
+        self.rows.pop()
+        self.size = last
+        self._dynamic_rows = None
+        return True
+    
+    def dynamic_rows(self) -> np.ndarray:
+        """Rows of the non-static blocks, recomputed only after blocks are added or removed."""
+        if self._dynamic_rows is None:
+            self._dynamic_rows = np.flatnonzero(~self.is_static[:self.size])
+        return self._dynamic_rows
+    
+    def step(self, dt: float) -> None:
+        """Integrate every non-static block by dt."""
+        n = self.size
+        if n:
+            _integrate(self.pos_x[:n], self.pos_y[:n], self.vel_x[:n], self.vel_y[:n],
+                       self.angle[:n], self.ang_vel[:n], self.is_static[:n], dt)
+    
+    def write_back(self) -> None:
+        """Copy the mutable columns back to the Block objects."""
+        n = self.size
+        for block, x, y, angle, ang_vel, density, friction in zip(
+            self.rows,
+            self.pos_x[:n].tolist(), self.pos_y[:n].tolist(),
+            self.angle[:n].tolist(), self.ang_vel[:n].tolist(),
+            self.density[:n].tolist(), self.friction[:n].tolist()
+        ):
+            block.position.x = x
+            block.position.y = y
+            block.angle = angle
+            block.angular_velocity = ang_vel
+            block.density = density
+            block.friction = friction
+
+
+# Board cells hold block IDs; EMPTY_CELL marks a free cell. Block IDs come from a
+# process-wide counter shared by all games, so they outgrow int16 on a long-running server
+CELL_DTYPE = np.int32
+EMPTY_CELL = -1
+# Byte layout of the serialized grid (little-endian int32), independent of the host
+CELL_WIRE_DTYPE = np.dtype('<i4')
+# Older saves stored the grid as little-endian int16
+_LEGACY_CELL_WIRE_DTYPE = np.dtype('<i2')
+
+
 @dataclass
 class GameBoard:
     """Represents the game board where blocks are placed."""
     width: int
     height: int
-    cells: List[List[Optional[int]]]  # Grid of block IDs (None for empty)
+    cells: np.ndarray = field(init=False)  # (height, width) grid of block IDs (EMPTY_CELL for empty)
     blocks: Dict[int, Block] = field(default_factory=dict)
+    # Bitboard of occupied cells, one uint16 per row (bit x set when column x is occupied)
+    row_mask: np.ndarray = field(init=False, repr=False, compare=False)
+    # Columnar physical state of the placed blocks
+    store: BlockStore = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Initialize the board with empty cells."""
-        self.cells = [[None for _ in range(self.width)] for _ in range(self.height)]
+        if self.width > 16:
+            raise ValueError(f"Board width {self.width} does not fit a uint16 row mask")
+        # Row-major (C order): the frequent operations - full-row checks, row deletion in
+        # clear_lines and the per-row bitboard refresh - all walk rows
+        self.cells = np.full((self.height, self.width), EMPTY_CELL, dtype=CELL_DTYPE, order='C')
+        self.row_mask = np.zeros(self.height, dtype=np.uint16)
+        self._full_row = (1 << self.width) - 1
+        self._column_bits = (1 << np.arange(self.width)).astype(np.uint16)
+        # Topmost occupied row (height when empty); recomputed lazily once marked dirty
+        self._top_row = self.height
+        self._top_row_dirty = False
+        self.store = BlockStore()
+    
+    def __eq__(self, other: object) -> bool:
+        """Compare boards field by field; the cell grid is an array and is compared as a whole."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            (self.width, self.height, self.blocks) == (other.width, other.height, other.blocks)
+            and np.array_equal(self.cells, other.cells)
+        )
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the grid, bitboard and blocks; the block store is rebuilt from the blocks on load."""
+        state = self.__dict__.copy()
+        del state["store"]
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled board and refill its block store."""
+        self.__dict__.update(state)
+        # Older checkpoints pickled an int16 grid
+        self.cells = self.cells.astype(CELL_DTYPE, copy=False)
+        self.store = BlockStore()
+        for block in self.blocks.values():
+            self.store.add(block)
+    
+    def _refresh_row_mask(self, rows) -> None:
+        """Rebuild the bitboard rows from the cell grid."""
+        self.row_mask[rows] = (self.cells[rows] != EMPTY_CELL) @ self._column_bits
     
     def is_valid_position(self, x: int, y: int) -> bool:
         """Check if a position is within the board boundaries."""
@@ -704,24 +1323,81 @@ class GameBoard:
         """Check if a cell is empty."""
         if not self.is_valid_position(x, y):
             return False
-        return self.cells[y][x] is None
+        return self.cells[y, x] == EMPTY_CELL
+    
+    def find_gap(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        """Find the empty run around (x, y) bounded by occupied cells on both sides.
+        
+        Returns the inclusive (start, end) columns, or None when the run is not closed
+        on both sides or (x, y) itself is occupied. Column 0 never closes a run on the left.
+        """
+        if not (1 <= x < self.width and 0 <= y < self.height):
+            return None
+        bits = int(self.row_mask[y])
+        
+        # Nearest occupied column in 1..x, then nearest occupied column in x..width-1
+        left = bits & ((1 << (x + 1)) - 2)
+        right = bits >> x
+        if not left or not right:
+            return None
+        gap_start = left.bit_length()
+        gap_end = x + (right & -right).bit_length() - 2
+        if gap_start > gap_end:
+            return None
+        return gap_start, gap_end
     
     def can_place_block(self, block: Block) -> bool:
         """Check if a block can be placed at its current position."""
-        for cell_x, cell_y in block.get_cells():
-            if not self.is_valid_position(cell_x, cell_y) or not self.is_cell_empty(cell_x, cell_y):
+        x = int(block.position.x)
+        y = int(block.position.y)
+        row_mask = self.row_mask
+        
+        for dy, bits in block.shape.row_masks:
+            row = y + dy
+            if not 0 <= row < self.height:
+                return False
+            
+            # Align the shape row with the board; bits shifted off either edge are out of bounds
+            if x < 0:
+                if bits & ((1 << -x) - 1):
+                    return False
+                bits >>= -x
+            else:
+                bits <<= x
+                if bits > self._full_row:
+                    return False
+            
+            if row_mask[row] & bits:
                 return False
         return True
     
+    def drop_distance(self, block: Block) -> int:
+        """Get how many rows a block can fall from its current position before it collides."""
+        return _drop_distance(self.row_mask, block.shape.row_bits, int(block.position.x),
+                              block.position.y, self._full_row)
+    
+    def find_kick(self, block: Block, kicks: np.ndarray = ROTATION_KICKS) -> Optional[Tuple[int, int]]:
+        """Get the first (dx, dy) offset in kicks at which the block fits, or None if there is none."""
+        i = _find_kick(self.row_mask, block.shape.row_bits, block.position.x, block.position.y,
+                       kicks, self._full_row)
+        if i < 0:
+            return None
+        dx, dy = kicks[i].tolist()
+        return dx, dy
+    
     def place_block(self, block: Block) -> bool:
         """Place a block on the board."""
         if not self.can_place_block(block):
             return False
         
-        for cell_x, cell_y in block.get_cells():
-            self.cells[cell_y][cell_x] = block.id
+        xs, ys = block.get_cells().T
+        self.cells[ys, xs] = block.id
+        self._refresh_row_mask(np.unique(ys))
+        if not self._top_row_dirty:
+            self._top_row = min(self._top_row, int(ys.min()))
         
         self.blocks[block.id] = block
+        self.store.add(block)
         block.is_placed = True
         return True
     
@@ -732,68 +1408,81 @@ class GameBoard:
         
         block = self.blocks[block_id]
         
-        for cell_x, cell_y in block.get_cells():
-            if self.is_valid_position(cell_x, cell_y) and self.cells[cell_y][cell_x] == block_id:
-                self.cells[cell_y][cell_x] = None
+        xs, ys = block.get_cells().T
+        inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        xs, ys = xs[inside], ys[inside]
+        owned = self.cells[ys, xs] == block_id
+        self.cells[ys[owned], xs[owned]] = EMPTY_CELL
+        self._refresh_row_mask(np.unique(ys))
+        if owned.any():
+            self._top_row_dirty = True
         
         del self.blocks[block_id]
+        self.store.remove(block_id)
+        BlockFactory.release(block)
         return True
     
     def check_lines(self) -> List[int]:
         """Check for completed lines and return their indices."""
-        completed_lines = []
-        
-        for y in range(self.height):
-            if all(self.cells[y][x] is not None for x in range(self.width)):
-                completed_lines.append(y)
-        
-        return completed_lines
+        return np.flatnonzero(self.row_mask == self._full_row).tolist()
     
     def clear_lines(self, lines: List[int]) -> int:
         """Clear the specified lines and return the number of lines cleared."""
         if not lines:
             return 0
         
-        # Sort lines in descending order to avoid shifting issues
-        lines.sort(reverse=True)
-        
-        for line in lines:
-            # Remove blocks in this line
-            for x in range(self.width):
-                block_id = self.cells[line][x]
-                if block_id is not None:
-                    self.remove_block(block_id)
-            
-            # Shift all lines above this one down
-            for y in range(line, 0, -1):
-                for x in range(self.width):
-                    self.cells[y][x] = self.cells[y-1][x]
-            
-            # Clear the top line
-            for x in range(self.width):
-                self.cells[0][x] = None
+        lines = np.unique(lines)
+        assert self.cells.flags.c_contiguous, "board cells must stay a row-major array"
+        
+        # Forget the blocks that had cells in the cleared lines
+        block_ids = np.unique(self.cells[lines])
+        for block_id in block_ids[block_ids != EMPTY_CELL].tolist():
+            block = self.blocks.pop(block_id, None)
+            self.store.remove(block_id)
+            if block is not None:
+                BlockFactory.release(block)
+        
+        # Shift the remaining rows down in one copy and clear the rows freed at the top
+        kept = np.delete(self.cells, lines, axis=0)
+        count = len(lines)
+        self.cells[count:] = kept
+        self.cells[:count] = EMPTY_CELL
+        self.row_mask[count:] = np.delete(self.row_mask, lines)
+        self.row_mask[:count] = 0
+        
+        # Rows above the cleared lines only shift down; otherwise the top row itself was cleared
+        if self._top_row < lines[0]:
+            self._top_row += count
+        else:
+            self._top_row_dirty = True
         
-        return len(lines)
+        return count
     
     def get_highest_block_position(self) -> int:
         """Get the y-coordinate of the highest block on the board."""
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.cells[y][x] is not None:
-                    return y
-        return self.height
+        if self._top_row_dirty:
+            occupied = np.flatnonzero(self.row_mask)
+            self._top_row = int(occupied[0]) if occupied.size else self.height
+            self._top_row_dirty = False
+        return self._top_row
     
     def is_game_over(self) -> bool:
         """Check if the game is over (blocks stacked to the top)."""
         # If there are blocks in the top row, the game is over
-        return any(self.cells[0][x] is not None for x in range(self.width))
+        return self.get_highest_block_position() == 0
+    
+    def update_physics(self, dt: float) -> None:
+        """Integrate the motion of all non-static blocks on the board in one batch."""
+        self.store.step(dt)
+        self.store.write_back()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert the game board to a dictionary for serialization."""
         return {
             "width": self.width,
             "height": self.height,
-            "cells": self.cells,
+            "shape": [self.height, self.width],
+            "cells_b64": base64.b64encode(self.cells.astype(CELL_WIRE_DTYPE, copy=False).tobytes()).decode("ascii"),
             "blocks": {str(block_id): block.to_dict() for block_id, block in self.blocks.items()}
         }
     
@@ -805,11 +1494,103 @@ class GameBoard:
             height=data["height"]
         )
         
-        board.cells = data["cells"]
+        if "cells_b64" in data:
+            # Restore the grid straight from its raw buffer
+            raw = base64.b64decode(data["cells_b64"])
+            height, width = data["shape"]
+            wire_dtype = (CELL_WIRE_DTYPE if len(raw) == height * width * CELL_WIRE_DTYPE.itemsize
+                          else _LEGACY_CELL_WIRE_DTYPE)
+            cells = np.frombuffer(raw, dtype=wire_dtype)
+            board.cells = cells.reshape(height, width).astype(CELL_DTYPE, order='C')
+        else:
+            # Older saves store nested lists and mark empty cells with None
+            board.cells = np.array(
+                [[EMPTY_CELL if cell is None else cell for cell in row] for row in data["cells"]],
+                dtype=CELL_DTYPE,
+                order='C'
+            )
+        board._refresh_row_mask(slice(None))
+        board._top_row_dirty = True
         
         for block_id_str, block_data in data["blocks"].items():
             block_id = int(block_id_str)
-            board.blocks[block_id] = Block.from_dict(block_data)
+            block = Block.from_dict(block_data)
+            board.blocks[block_id] = block
+            board.store.add(block)
+        
+        return board
+    
+    def to_orjson(self) -> bytes:
+        """Serialize the board as a compact columnar JSON payload (one array per block field)."""
+        store = self.store
+        n = store.size
+        rows = store.rows
+        payload = {
+            "width": self.width,
+            "height": self.height,
+            "cells": self.cells,
+            "blocks": {
+                "id": [block.id for block in rows],
+                "block_type": [block.block_type.name for block in rows],
+                "rotation": [block.rotation.value for block in rows],
+                "pos_x": store.pos_x[:n],
+                "pos_y": store.pos_y[:n],
+                "vel_x": store.vel_x[:n],
+                "vel_y": store.vel_y[:n],
+                "angle": store.angle[:n],
+                "angular_velocity": store.ang_vel[:n],
+                "density": store.density[:n],
+                "friction": store.friction[:n],
+                "restitution": store.restitution[:n],
+                "is_active": [block.is_active for block in rows],
+                "is_static": store.is_static[:n],
+                "is_placed": [block.is_placed for block in rows],
+                "player_id": [block.player_id for block in rows]
+            }
+        }
+        if orjson is not None:
+            return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(payload, default=np.ndarray.tolist).encode("utf-8")
+    
+    @classmethod
+    def from_orjson(cls, data: bytes) -> 'GameBoard':
+        """Create a GameBoard from a payload produced by to_orjson."""
+        payload = orjson.loads(data) if orjson is not None else json.loads(data)
+        board = cls(width=payload["width"], height=payload["height"])
+        board.cells = np.array(payload["cells"], dtype=CELL_DTYPE, order='C')
+        board._refresh_row_mask(slice(None))
+        board._top_row_dirty = True
+        
+        columns = payload["blocks"]
+        for (block_id, type_name, rotation_value, x, y, vx, vy, angle, angular_velocity,
+             density, friction, restitution, is_active, is_static, is_placed, player_id) in zip(
+            columns["id"], columns["block_type"], columns["rotation"],
+            columns["pos_x"], columns["pos_y"], columns["vel_x"], columns["vel_y"],
+            columns["angle"], columns["angular_velocity"], columns["density"],
+            columns["friction"], columns["restitution"], columns["is_active"],
+            columns["is_static"], columns["is_placed"], columns["player_id"]
+        ):
+            block_type = _BLOCK_TYPE_BY_NAME[type_name]
+            rotation = _ROTATION_BY_VALUE[rotation_value]
+            block = Block(
+                id=block_id,
+                block_type=block_type,
+                shape=_shape_for(block_type, rotation),
+                position=Position(x, y),
+                rotation=rotation,
+                angle=angle,
+                velocity=Position(vx, vy),
+                angular_velocity=angular_velocity,
+                density=density,
+                friction=friction,
+                restitution=restitution,
+                is_active=is_active,
+                is_static=is_static,
+                is_placed=is_placed,
+                player_id=player_id
+            )
+            board.blocks[block_id] = block
+            board.store.add(block)
         
         return board
 
@@ -817,121 +1598,126 @@ class GameBoard:
 class SpellFactory:
     """Factory for creating spells."""
     
+    # Spell definitions are built once; create_*_spells clone them with fresh ids
+    _LIGHT_TEMPLATES = (
+        Spell(
+            id="",
+            name="Strengthen",
+            spell_type=SpellType.LIGHT,
+            effect=GameConstants.SPELL_EFFECT_STRENGTHEN,
+            duration=15.0,
+            strength=2.0,
+            target_type="self",
+            cooldown=30.0,
+            mana_cost=30,
+            description="Strengthens your blocks, making them more stable.",
+            icon_path="assets/spells/strengthen.png"
+        ),
+        Spell(
+            id="",
+            name="Lighten",
+            spell_type=SpellType.LIGHT,
+            effect=GameConstants.SPELL_EFFECT_LIGHTEN,
+            duration=10.0,
+            strength=0.5,
+            target_type="self",
+            cooldown=25.0,
+            mana_cost=25,
+            description="Makes your blocks lighter, reducing their impact when falling.",
+            icon_path="assets/spells/lighten.png"
+        ),
+        Spell(
+            id="",
+            name="Multiply",
+            spell_type=SpellType.LIGHT,
+            effect=GameConstants.SPELL_EFFECT_MULTIPLY,
+            duration=5.0,
+            strength=2.0,
+            target_type="self",
+            cooldown=60.0,
+            mana_cost=50,
+            description="Doubles the points you earn for a short time.",
+            icon_path="assets/spells/multiply.png"
+        ),
+        Spell(
+            id="",
+            name="Bridge",
+            spell_type=SpellType.LIGHT,
+            effect=GameConstants.SPELL_EFFECT_BRIDGE,
+            duration=0.0,  # Instant effect
+            strength=1.0,
+            target_type="self",
+            cooldown=45.0,
+            mana_cost=40,
+            description="Creates a horizontal bridge to fill gaps in your tower.",
+            icon_path="assets/spells/bridge.png"
+        ),
+    )
+    
+    _DARK_TEMPLATES = (
+        Spell(
+            id="",
+            name="Destabilize",
+            spell_type=SpellType.DARK,
+            effect=GameConstants.SPELL_EFFECT_DESTABILIZE,
+            duration=10.0,
+            strength=0.5,
+            target_type="opponent",
+            cooldown=35.0,
+            mana_cost=35,
+            description="Destabilizes your opponent's tower, making it more likely to collapse.",
+            icon_path="assets/spells/destabilize.png"
+        ),
+        Spell(
+            id="",
+            name="Wind Gust",
+            spell_type=SpellType.DARK,
+            effect=GameConstants.SPELL_EFFECT_WIND,
+            duration=5.0,
+            strength=3.0,
+            target_type="opponent",
+            cooldown=40.0,
+            mana_cost=40,
+            description="Creates a gust of wind that pushes your opponent's blocks.",
+            icon_path="assets/spells/wind.png"
+        ),
+        Spell(
+            id="",
+            name="Slippery",
+            spell_type=SpellType.DARK,
+            effect=GameConstants.SPELL_EFFECT_SLIPPERY,
+            duration=12.0,
+            strength=0.8,
+            target_type="opponent",
+            cooldown=30.0,
+            mana_cost=30,
+            description="Makes your opponent's blocks slippery, reducing friction.",
+            icon_path="assets/spells/slippery.png"
+        ),
+        Spell(
+            id="",
+            name="Grow",
+            spell_type=SpellType.DARK,
+            effect=GameConstants.SPELL_EFFECT_GROW,
+            duration=8.0,
+            strength=1.5,
+            target_type="opponent",
+            cooldown=50.0,
+            mana_cost=45,
+            description="Makes your opponent's blocks grow larger, making them harder to place.",
+            icon_path="assets/spells/grow.png"
+        ),
+    )
+    
     @staticmethod
     def create_light_spells() -> List[Spell]:
         """Create a list of light (helpful) spells."""
-        return [
-            Spell(
-                id=str(uuid.uuid4()),
-                name="Strengthen",
-                spell_type=SpellType.LIGHT,
-                effect=GameConstants.SPELL_EFFECT_STRENGTHEN,
-                duration=15.0,
-                strength=2.0,
-                target_type="self",
-                cooldown=30.0,
-                mana_cost=30,
-                description="Strengthens your blocks, making them more stable.",
-                icon_path="assets/spells/strengthen.png"
-            ),
-            Spell(
-                id=str(uuid.uuid4()),
-                name="Lighten",
-                spell_type=SpellType.LIGHT,
-                effect=GameConstants.SPELL_EFFECT_LIGHTEN,
-                duration=10.0,
-                strength=0.5,
-                target_type="self",
-                cooldown=25.0,
-                mana_cost=25,
-                description="Makes your blocks lighter, reducing their impact when falling.",
-                icon_path="assets/spells/lighten.png"
-            ),
-            Spell(
-                id=str(uuid.uuid4()),
-                name="Multiply",
-                spell_type=SpellType.LIGHT,
-                effect=GameConstants.SPELL_EFFECT_MULTIPLY,
-                duration=5.0,
-                strength=2.0,
-                target_type="self",
-                cooldown=60.0,
-                mana_cost=50,
-                description="Doubles the points you earn for a short time.",
-                icon_path="assets/spells/multiply.png"
-            ),
-            Spell(
-                id=str(uuid.uuid4()),
-                name="Bridge",
-                spell_type=SpellType.LIGHT,
-                effect=GameConstants.SPELL_EFFECT_BRIDGE,
-                duration=0.0,  # Instant effect
-                strength=1.0,
-                target_type="self",
-                cooldown=45.0,
-                mana_cost=40,
-                description="Creates a horizontal bridge to fill gaps in your tower.",
-                icon_path="assets/spells/bridge.png"
-            )
-        ]
+        return [replace(spell, id=str(uuid.uuid4())) for spell in SpellFactory._LIGHT_TEMPLATES]
     
     @staticmethod
     def create_dark_spells() -> List[Spell]:
         """Create a list of dark (harmful) spells."""
-        return [
-            Spell(
-                id=str(uuid.uuid4()),
-                name="Destabilize",
-                spell_type=SpellType.DARK,
-                effect=GameConstants.SPELL_EFFECT_DESTABILIZE,
-                duration=10.0,
-                strength=0.5,
-                target_type="opponent",
-                cooldown=35.0,
-                mana_cost=35,
-                description="Destabilizes your opponent's tower, making it more likely to collapse.",
-                icon_path="assets/spells/destabilize.png"
-            ),
-            Spell(
-                id=str(uuid.uuid4()),
-                name="Wind Gust",
-                spell_type=SpellType.DARK,
-                effect=GameConstants.SPELL_EFFECT_WIND,
-                duration=5.0,
-                strength=3.0,
-                target_type="opponent",
-                cooldown=40.0,
-                mana_cost=40,
-                description="Creates a gust of wind that pushes your opponent's blocks.",
-                icon_path="assets/spells/wind.png"
-            ),
-            Spell(
-                id=str(uuid.uuid4()),
-                name="Slippery",
-                spell_type=SpellType.DARK,
-                effect=GameConstants.SPELL_EFFECT_SLIPPERY,
-                duration=12.0,
-                strength=0.8,
-                target_type="opponent",
-                cooldown=30.0,
-                mana_cost=30,
-                description="Makes your opponent's blocks slippery, reducing friction.",
-                icon_path="assets/spells/slippery.png"
-            ),
-            Spell(
-                id=str(uuid.uuid4()),
-                name="Grow",
-                spell_type=SpellType.DARK,
-                effect=GameConstants.SPELL_EFFECT_GROW,
-                duration=8.0,
-                strength=1.5,
-                target_type="opponent",
-                cooldown=50.0,
-                mana_cost=45,
-                description="Makes your opponent's blocks grow larger, making them harder to place.",
-                icon_path="assets/spells/grow.png"
-            )
-        ]
+        return [replace(spell, id=str(uuid.uuid4())) for spell in SpellFactory._DARK_TEMPLATES]
     
     @staticmethod
     def create_all_spells() -> List[Spell]:
@@ -942,50 +1728,165 @@ class SpellFactory:
 class BlockFactory:
     """Factory for creating blocks."""
     
-    _next_block_id = 1
+    # Block IDs are shared by all games, which tick in parallel; next() on a count is atomic
+    _block_ids = itertools.count(1)
+    
+    # Blocks returned by the board once they leave play, reused by create_block
+    _pool: List[Block] = []
+    _POOL_LIMIT = GameConstants.MAX_BLOCKS
+    
+    # Random block distribution, with SPECIAL being less common; sampled by bisecting the cumulative weights
+    _block_types = tuple(BlockType)
+    _cum_weights = list(itertools.accumulate([1, 1, 1, 1, 1, 1, 1, 0.3]))
+    _total_weight = _cum_weights[-1]
     
     @classmethod
     def create_block(cls, block_type: Optional[BlockType] = None, player_id: Optional[str] = None) -> Block:
         """Create a new block of the specified type."""
         if block_type is None:
-            # Randomly select a block type, with SPECIAL being less common
-            weights = [1, 1, 1, 1, 1, 1, 1, 0.3]  # Lower weight for SPECIAL
-            block_types = list(BlockType)
-            block_type = random.choices(block_types, weights=weights, k=1)[0]
+            block_type = cls._block_types[bisect.bisect(cls._cum_weights, random.random() * cls._total_weight)]
         
-        shape = BlockShape.create(block_type)
+        shape = SHAPES[block_type][BlockRotation.R0] if block_type in SHAPES else BlockShape.create(block_type)
         
-        block = Block(
-            id=cls._next_block_id,
-            block_type=block_type,
-            shape=shape,
-            position=Position(0, 0),
-            player_id=player_id
-        )
+        # list.pop is atomic, so concurrent callers never receive the same pooled block
+        try:
+            block = cls._pool.pop()
+        except IndexError:
+            block = Block(
+                id=next(cls._block_ids),
+                block_type=block_type,
+                shape=shape,
+                position=Position(0, 0),
+                player_id=player_id
+            )
+        else:
+            block.reset(next(cls._block_ids), block_type, shape, player_id)
         
-        cls._next_block_id += 1
         return block
     
     @classmethod
-    def create_next_blocks(cls, count: int, player_id: Optional[str] = None) -> List[Block]:
-        """Create a list of upcoming blocks."""
-        return [cls.create_block(player_id=player_id) for _ in range(count)]
+    def release(cls, block: Block) -> None:
+        """Return a block that is no longer referenced by the game to the pool."""
+        if len(cls._pool) < cls._POOL_LIMIT:
+            cls._pool.append(block)
+    
+    @classmethod
+    def create_next_blocks(cls, count: int, player_id: Optional[str] = None) -> Deque[Block]:
+        """Create a queue of upcoming blocks."""
+        return deque(cls.create_block(player_id=player_id) for _ in range(count))
     
     @classmethod
     def reset_block_id_counter(cls) -> None:
         """Reset the block ID counter."""
-        cls._next_block_id = 1
+        cls._block_ids = itertools.count(1)
+
+
+# C API библиотеки физики (libphysics.so), используемый через cffi в ABI-режиме.
+# Вызовы через cffi конвертируют аргументы по прототипам без ctypes-обёрток на каждый вызов.
+_PHYSICS_CDEF = """
+typedef struct { float x; float y; } Vec2;
+
+typedef struct {
+    int id;
+    Vec2 position;
+    float angle;
+    Vec2 velocity;
+    float angular_velocity;
+    bool is_static;
+    bool is_active;
+} BlockInfo;
+
+typedef struct {
+    int block_a_id;
+    int block_b_id;
+    Vec2 point;
+    Vec2 normal;
+    float depth;
+} CollisionInfo;
+
+bool init_physics(void);
+void cleanup_physics(void);
+void step_physics(float dt);
+int create_block(float x, float y, float angle, float vx, float vy,
+                 float angular_velocity, bool is_static, bool is_active);
+bool remove_block(int block_id);
+BlockInfo *get_block_info(int block_id);
+void update_block(int block_id, float x, float y, float angle, float vx, float vy,
+                  float angular_velocity, bool is_static, bool is_active);
+bool apply_force(int block_id, float force_x, float force_y, float point_x, float point_y);
+bool apply_torque(int block_id, float torque);
+bool check_collision(int block_a_id, int block_b_id);
+CollisionInfo *get_collisions(void);
+
+/* Необязательный пакетный вызов: ids — count идентификаторов блоков, state — их строки BLOCK_STATE_COLUMNS float */
+void update_blocks_batch(const int *ids, const float *state, int count);
+
+/* Необязательный пакетный запрос: строки BLOCK_INFO_COLUMNS float, NaN для неизвестных id */
+void get_block_info_batch(const int *ids, int count, float *out_state);
+
+/* Необязательный пакетный вызов: силы и точки приложения — count пар (x, y) */
+void apply_forces_batch(const int *ids, const float *forces_xy, const float *points_xy, int count);
+
+/* Необязательный сброс мира без повторной инициализации библиотеки */
+void reset_physics(void);
+"""
+
+_physics_ffi = FFI()
+_physics_ffi.cdef(_PHYSICS_CDEF)
+
+# Столбцы строки состояния блока в пакетном обновлении
+BLOCK_STATE_COLUMNS = ("x", "y", "angle", "vx", "vy", "angular_velocity", "is_static", "is_active")
+
+# Столбцы состояния блока, возвращаемого пакетным запросом
+BLOCK_INFO_COLUMNS = ("x", "y", "angle", "vx", "vy", "angular_velocity")
+
+# Структурированный тип с раскладкой CollisionInfo: массив столкновений читается из C без копирования по полям
+COLLISION_DTYPE = np.dtype({
+    "names": ["block_a_id", "block_b_id", "point", "normal", "depth"],
+    "formats": [np.int32, np.int32, (np.float32, 2), (np.float32, 2), np.float32],
+    "offsets": [_physics_ffi.offsetof("CollisionInfo", name)
+                for name in ("block_a_id", "block_b_id", "point", "normal", "depth")],
+    "itemsize": _physics_ffi.sizeof("CollisionInfo"),
+})
 
 
 class PhysicsEngine:
-    """Интерфейс для работы с C++ физическим движком."""
+    """Интерфейс для работы с C++ физическим движком.
+    
+    Библиотека хранит один глобальный мир, поэтому экземпляр движка единственный на процесс.
+    """
+    
+    _instance: Optional['PhysicsEngine'] = None
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
     
     def __init__(self):
+        # Повторное создание возвращает уже загруженный движок
+        if getattr(self, "_initialized", False):
+            return
+        
         self._lib = None
         self._initialized = False
         self._block_count = 0
         self._error_count = 0
         self._max_errors = 3
+        self._has_batch_update = False
+        # Буферы идентификаторов и состояния блоков для пакетного обновления, растут при необходимости
+        self._block_id_buffer = np.empty(GameConstants.MAX_BLOCKS, dtype=np.int32)
+        self._block_buffer = np.empty((GameConstants.MAX_BLOCKS, len(BLOCK_STATE_COLUMNS)), dtype=np.float32)
+        self._has_batch_info = False
+        self._has_batch_forces = False
+        self._has_reset = False
+        # Библиотека не потокобезопасна: вызывающие из разных потоков держат этот замок
+        self.lock = threading.Lock()
+        # Один рабочий поток: шаги симуляции выполняются строго по очереди
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="physics")
+        # Буферы результатов пакетного запроса состояния блоков
+        self._id_buf = np.empty(GameConstants.MAX_BLOCKS, dtype=np.int32)
+        self._info_buf = np.empty((GameConstants.MAX_BLOCKS, len(BLOCK_INFO_COLUMNS)), dtype=np.float32)
         
         try:
             self.initialize()
@@ -996,48 +1897,22 @@ class PhysicsEngine:
     def initialize(self) -> None:
         """Инициализация физического движка."""
         try:
-            # Определение структур для взаимодействия с C++
-            class Vec2(ctypes.Structure):
-                _fields_ = [("x", ctypes.c_float), ("y", ctypes.c_float)]
-            
-            class BlockInfo(ctypes.Structure):
-                _fields_ = [
-                    ("id", ctypes.c_int),
-                    ("position", Vec2),
-                    ("angle", ctypes.c_float),
-                    ("velocity", Vec2),
-                    ("angular_velocity", ctypes.c_float),
-                    ("is_static", ctypes.c_bool),
-                    ("is_active", ctypes.c_bool)
-                ]
-            
-            class CollisionInfo(ctypes.Structure):
-                _fields_ = [
-                    ("block_a_id", ctypes.c_int),
-                    ("block_b_id", ctypes.c_int),
-                    ("point", Vec2),
-                    ("normal", Vec2),
-                    ("depth", ctypes.c_float)
-                ]
-            
-            # Загрузка библиотеки
+            # Загрузка библиотеки; прототипы и структуры объявлены один раз в _physics_ffi
             try:
-                self._lib = ctypes.CDLL("./libphysics.so")
+                self._lib = _physics_ffi.dlopen("./libphysics.so")
             except OSError:
                 # Попытка загрузить библиотеку из альтернативного пути
                 try:
-                    self._lib = ctypes.CDLL("./build/libphysics.so")
+                    self._lib = _physics_ffi.dlopen("./build/libphysics.so")
                 except OSError as e:
                     logger.error(f"Failed to load physics library: {e}")
                     raise RuntimeError("Physics library not found")
             
-            # Настройка типов возвращаемых значений
-            self._lib.init_physics.restype = ctypes.c_bool
-            self._lib.create_block.restype = ctypes.c_int
-            self._lib.remove_block.restype = ctypes.c_bool
-            self._lib.get_block_info.restype = ctypes.POINTER(BlockInfo)
-            self._lib.check_collision.restype = ctypes.c_bool
-            self._lib.get_collisions.restype = ctypes.POINTER(CollisionInfo)
+            # Старые сборки библиотеки не экспортируют пакетное обновление
+            self._has_batch_update = hasattr(self._lib, "update_blocks_batch")
+            self._has_batch_info = hasattr(self._lib, "get_block_info_batch")
+            self._has_batch_forces = hasattr(self._lib, "apply_forces_batch")
+            self._has_reset = hasattr(self._lib, "reset_physics")
             
             # Инициализация физического движка
             if not self._lib.init_physics():
@@ -1051,6 +1926,35 @@ class PhysicsEngine:
             self._initialized = False
             raise
     
+    def record_error(self, error: Exception) -> None:
+        """Учёт ошибки физической фазы; после _max_errors ошибок движок считается неисправным."""
+        self._error_count += 1
+        logger.error(f"Physics engine error: {error}")
+        if self._error_count >= self._max_errors:
+            raise RuntimeError("Too many physics engine errors") from error
+    
+    def reset(self) -> None:
+        """Очистка мира без повторной загрузки библиотеки."""
+        # Шаг в рабочем потоке движка может быть внутри step_physics
+        with self.lock:
+            self._reset()
+    
+    def _reset(self) -> None:
+        """Очистка мира; вызывающий держит замок движка."""
+        if not self._initialized:
+            raise RuntimeError("Physics engine not initialized")
+        
+        if self._has_reset:
+            self._lib.reset_physics()
+        else:
+            self._lib.cleanup_physics()
+            if not self._lib.init_physics():
+                self._initialized = False
+                raise RuntimeError("Failed to reinitialize physics engine")
+        
+        self._block_count = 0
+        self._error_count = 0
+    
     def __del__(self):
         """Очистка ресурсов при уничтожении объекта."""
         try:
@@ -1065,13 +1969,16 @@ class PhysicsEngine:
         if not self._initialized:
             raise RuntimeError("Physics engine not initialized")
         
-        try:
-            self._lib.step_physics(ctypes.c_float(dt))
-        except Exception as e:
-            self._error_count += 1
-            logger.error(f"Error during physics step: {e}")
-            if self._error_count >= self._max_errors:
-                raise RuntimeError("Too many physics engine errors")
+        self._lib.step_physics(dt)
+    
+    def step_async(self, dt: float) -> Future:
+        """Запуск шага симуляции в рабочем потоке движка; результат нужно дождаться до других вызовов."""
+        return self._executor.submit(self._locked_step, dt)
+    
+    def _locked_step(self, dt: float) -> None:
+        """Шаг симуляции под замком движка."""
+        with self.lock:
+            self.step(dt)
     
     def create_block(self, block: Block) -> int:
         """Создание блока в физическом движке."""
@@ -1081,30 +1988,23 @@ class PhysicsEngine:
         if not block:
             raise ValueError("Block cannot be null")
         
-        try:
-            block_id = self._lib.create_block(
-                ctypes.c_float(block.position.x),
-                ctypes.c_float(block.position.y),
-                ctypes.c_float(block.angle),
-                ctypes.c_float(block.velocity.x),
-                ctypes.c_float(block.velocity.y),
-                ctypes.c_float(block.angular_velocity),
-                ctypes.c_bool(block.is_static),
-                ctypes.c_bool(block.is_active)
-            )
-            
-            if block_id < 0:
-                raise RuntimeError("Failed to create block in physics engine")
-            
-            self._block_count += 1
-            return block_id
-            
-        except Exception as e:
-            self._error_count += 1
-            logger.error(f"Error creating block: {e}")
-            if self._error_count >= self._max_errors:
-                raise RuntimeError("Too many physics engine errors")
+        block_id = self._lib.create_block(
+            block.position.x,
+            block.position.y,
+            block.angle,
+            block.velocity.x,
+            block.velocity.y,
+            block.angular_velocity,
+            block.is_static,
+            block.is_active
+        )
+        
+        if block_id < 0:
+            logger.error("Failed to create block in physics engine")
             return -1
+        
+        self._block_count += 1
+        return block_id
     
     def remove_block(self, block_id: int) -> bool:
         """Удаление блока из физического движка."""
@@ -1114,17 +2014,10 @@ class PhysicsEngine:
         if block_id < 0:
             return False
         
-        try:
-            result = self._lib.remove_block(ctypes.c_int(block_id))
-            if result:
-                self._block_count -= 1
-            return result
-        except Exception as e:
-            self._error_count += 1
-            logger.error(f"Error removing block: {e}")
-            if self._error_count >= self._max_errors:
-                raise RuntimeError("Too many physics engine errors")
-            return False
+        result = self._lib.remove_block(block_id)
+        if result:
+            self._block_count -= 1
+        return result
     
     def get_block_info(self, block_id: int) -> Optional[Dict[str, Any]]:
         """Получение информации о блоке."""
@@ -1134,27 +2027,56 @@ class PhysicsEngine:
         if block_id < 0:
             return None
         
-        try:
-            info_ptr = self._lib.get_block_info(ctypes.c_int(block_id))
-            if not info_ptr:
-                return None
-            
-            info = info_ptr.contents
-            return {
-                "id": info.id,
-                "position": {"x": info.position.x, "y": info.position.y},
-                "angle": info.angle,
-                "velocity": {"x": info.velocity.x, "y": info.velocity.y},
-                "angular_velocity": info.angular_velocity,
-                "is_static": info.is_static,
-                "is_active": info.is_active
-            }
-        except Exception as e:
-            self._error_count += 1
-            logger.error(f"Error getting block info: {e}")
-            if self._error_count >= self._max_errors:
-                raise RuntimeError("Too many physics engine errors")
+        info_ptr = self._lib.get_block_info(block_id)
+        if info_ptr == _physics_ffi.NULL:
             return None
+        
+        info = info_ptr[0]
+        return {
+            "id": info.id,
+            "position": {"x": info.position.x, "y": info.position.y},
+            "angle": info.angle,
+            "velocity": {"x": info.velocity.x, "y": info.velocity.y},
+            "angular_velocity": info.angular_velocity,
+            "is_static": info.is_static,
+            "is_active": info.is_active
+        }
+    
+    def get_blocks_info(self, block_ids: List[int]) -> np.ndarray:
+        """Получение состояния группы блоков в виде массива (n, BLOCK_INFO_COLUMNS).
+        
+        Возвращается представление внутреннего буфера, действительное до следующего вызова.
+        Для неизвестных блоков строка заполнена NaN.
+        """
+        if not self._initialized:
+            raise RuntimeError("Physics engine not initialized")
+        
+        count = len(block_ids)
+        if count > len(self._id_buf):
+            self._id_buf = np.empty(2 * count, dtype=np.int32)
+            self._info_buf = np.empty((2 * count, len(BLOCK_INFO_COLUMNS)), dtype=np.float32)
+        ids = self._id_buf[:count]
+        out = self._info_buf[:count]
+        ids[:] = block_ids
+        
+        if self._has_batch_info:
+            self._lib.get_block_info_batch(
+                _physics_ffi.from_buffer("int[]", ids),
+                count,
+                _physics_ffi.from_buffer("float[]", self._info_buf)
+            )
+            return out
+        
+        out.fill(np.nan)
+        get_info = self._lib.get_block_info
+        for row, block_id in enumerate(block_ids):
+            info_ptr = get_info(block_id)
+            if info_ptr == _physics_ffi.NULL:
+                continue
+            info = info_ptr[0]
+            out[row] = (info.position.x, info.position.y, info.angle,
+                        info.velocity.x, info.velocity.y, info.angular_velocity)
+        return out
     
     def update_block(self, block: Block) -> None:
         """Обновление состояния блока."""
@@ -1164,66 +2086,127 @@ class PhysicsEngine:
         if not block:
             raise ValueError("Block cannot be null")
         
-        try:
-            self._lib.update_block(
-                ctypes.c_int(block.id),
-                ctypes.c_float(block.position.x),
-                ctypes.c_float(block.position.y),
-                ctypes.c_float(block.angle),
-                ctypes.c_float(block.velocity.x),
-                ctypes.c_float(block.velocity.y),
-                ctypes.c_float(block.angular_velocity),
-                ctypes.c_bool(block.is_static),
-                ctypes.c_bool(block.is_active)
-            )
-        except Exception as e:
-            self._error_count += 1
-            logger.error(f"Error updating block: {e}")
-            if self._error_count >= self._max_errors:
-                raise RuntimeError("Too many physics engine errors")
+        self._lib.update_block(
+            block.id,
+            block.position.x,
+            block.position.y,
+            block.angle,
+            block.velocity.x,
+            block.velocity.y,
+            block.angular_velocity,
+            block.is_static,
+            block.is_active
+        )
     
-    def apply_force(self, block_id: int, force_x: float, force_y: float, point_x: float, point_y: float) -> bool:
-        """Применение силы к блоку."""
+    def update_blocks_batch(self, blocks: List[Block]) -> None:
+        """Обновление состояния группы блоков одним вызовом библиотеки."""
         if not self._initialized:
             raise RuntimeError("Physics engine not initialized")
         
-        if block_id < 0:
-            return False
+        if not self._has_batch_update:
+            for block in blocks:
+                self.update_block(block)
+            return
         
-        try:
-            return self._lib.apply_force(
-                ctypes.c_int(block_id),
-                ctypes.c_float(force_x),
-                ctypes.c_float(force_y),
-                ctypes.c_float(point_x),
-                ctypes.c_float(point_y)
-            )
-        except Exception as e:
-            self._error_count += 1
-            logger.error(f"Error applying force: {e}")
-            if self._error_count >= self._max_errors:
-                raise RuntimeError("Too many physics engine errors")
-            return False
+        rows = [
+            (block.position.x, block.position.y, block.angle,
+             block.velocity.x, block.velocity.y, block.angular_velocity,
+             block.is_static, block.is_active)
+            for block in blocks
+        ]
+        count = len(rows)
+        if not count:
+            return
+        
+        if count > len(self._block_buffer):
+            self._block_id_buffer = np.empty(2 * count, dtype=np.int32)
+            self._block_buffer = np.empty((2 * count, len(BLOCK_STATE_COLUMNS)), dtype=np.float32)
+        ids = self._block_id_buffer
+        buf = self._block_buffer
+        ids[:count] = [block.id for block in blocks]
+        buf[:count] = rows
+        
+        self._lib.update_blocks_batch(
+            _physics_ffi.from_buffer("int[]", ids),
+            _physics_ffi.from_buffer("float[]", buf),
+            count
+        )
     
-    def apply_torque(self, block_id: int, torque: float) -> bool:
-        """Применение крутящего момента к блоку."""
+    def update_store_blocks(self, store: 'BlockStore') -> None:
+        """Обновление всех блоков хранилища одним вызовом; состояние берётся прямо из его столбцов."""
         if not self._initialized:
             raise RuntimeError("Physics engine not initialized")
         
-        if block_id < 0:
+        if not self._has_batch_update:
+            self.update_blocks_batch(store.rows)
+            return
+        
+        count = store.size
+        if not count:
+            return
+        
+        if count > len(self._block_buffer):
+            self._block_buffer = np.empty((2 * count, len(BLOCK_STATE_COLUMNS)), dtype=np.float32)
+        buf = self._block_buffer
+        columns = (store.pos_x, store.pos_y, store.angle, store.vel_x, store.vel_y,
+                   store.ang_vel, store.is_static, store.is_active)
+        for col, values in enumerate(columns):
+            buf[:count, col] = values[:count]
+        
+        # Идентификаторы уже лежат в хранилище непрерывным столбцом int32
+        self._lib.update_blocks_batch(
+            _physics_ffi.from_buffer("int[]", store.ids[:count]),
+            _physics_ffi.from_buffer("float[]", buf),
+            count
+        )
+    
+    def apply_force(self, block_id: int, force_x: float, force_y: float, point_x: float, point_y: float) -> bool:
+        """Применение силы к блоку."""
+        if not self._initialized:
+            raise RuntimeError("Physics engine not initialized")
+        
+        if block_id < 0:
             return False
         
-        try:
-            return self._lib.apply_torque(
-                ctypes.c_int(block_id),
-                ctypes.c_float(torque)
-            )
-        except Exception as e:
-            self._error_count += 1
-            logger.error(f"Error applying torque: {e}")
-            if self._error_count >= self._max_errors:
-                raise RuntimeError("Too many physics engine errors")
+        return self._lib.apply_force(block_id, force_x, force_y, point_x, point_y)
+    
+    def apply_forces_batch(self, block_ids: np.ndarray, forces: np.ndarray, points: np.ndarray) -> None:
+        """Применение сил к группе блоков одним вызовом библиотеки.
+        
+        forces и points — массивы (n, 2) с силами и точками их приложения.
+        """
+        if not self._initialized:
+            raise RuntimeError("Physics engine not initialized")
+        
+        count = len(block_ids)
+        if not count:
+            return
+        
+        if not self._has_batch_forces:
+            for block_id, (fx, fy), (px, py) in zip(block_ids.tolist(), forces.tolist(), points.tolist()):
+                self.apply_force(block_id, fx, fy, px, py)
+            return
+        
+        ids = np.ascontiguousarray(block_ids, dtype=np.int32)
+        forces = np.ascontiguousarray(forces, dtype=np.float32)
+        points = np.ascontiguousarray(points, dtype=np.float32)
+        
+        self._lib.apply_forces_batch(
+            _physics_ffi.from_buffer("int[]", ids),
+            _physics_ffi.from_buffer("float[]", forces),
+            _physics_ffi.from_buffer("float[]", points),
+            count
+        )
+    
+    def apply_torque(self, block_id: int, torque: float) -> bool:
+        """Применение крутящего момента к блоку."""
+        if not self._initialized:
+            raise RuntimeError("Physics engine not initialized")
+        
+        if block_id < 0:
             return False
+        
+        return self._lib.apply_torque(block_id, torque)
     
     def check_collision(self, block_a_id: int, block_b_id: int) -> bool:
         """Проверка столкновения между блоками."""
@@ -1233,51 +2216,64 @@ class PhysicsEngine:
         if block_a_id < 0 or block_b_id < 0:
             return False
         
-        try:
-            return self._lib.check_collision(
-                ctypes.c_int(block_a_id),
-                ctypes.c_int(block_b_id)
-            )
-        except Exception as e:
-            self._error_count += 1
-            logger.error(f"Error checking collision: {e}")
-            if self._error_count >= self._max_errors:
-                raise RuntimeError("Too many physics engine errors")
-            return False
+        return self._lib.check_collision(block_a_id, block_b_id)
     
-    def get_collisions(self) -> List[Dict[str, Any]]:
-        """Получение списка всех столкновений."""
+    def get_collisions(self) -> np.ndarray:
+        """Получение всех столкновений в виде структурированного массива COLLISION_DTYPE."""
         if not self._initialized:
             raise RuntimeError("Physics engine not initialized")
         
-        try:
-            collisions_ptr = self._lib.get_collisions()
-            if not collisions_ptr:
-                return []
-            
-            collisions = []
-            i = 0
-            while True:
-                collision = collisions_ptr[i]
-                if collision.block_a_id < 0:  # Маркер конца списка
-                    break
-                
-                collisions.append({
-                    "block_a_id": collision.block_a_id,
-                    "block_b_id": collision.block_b_id,
-                    "point": {"x": collision.point.x, "y": collision.point.y},
-                    "normal": {"x": collision.normal.x, "y": collision.normal.y},
-                    "depth": collision.depth
-                })
-                i += 1
-            
-            return collisions
-        except Exception as e:
-            self._error_count += 1
-            logger.error(f"Error getting collisions: {e}")
-            if self._error_count >= self._max_errors:
-                raise RuntimeError("Too many physics engine errors")
-            return []
+        collisions_ptr = self._lib.get_collisions()
+        if collisions_ptr == _physics_ffi.NULL:
+            return np.empty(0, dtype=COLLISION_DTYPE)
+        
+        # Ищем маркер конца списка, затем копируем весь массив структур одним блоком
+        count = 0
+        while collisions_ptr[count].block_a_id >= 0:
+            count += 1
+        
+        raw = _physics_ffi.buffer(collisions_ptr, count * COLLISION_DTYPE.itemsize)
+        return np.frombuffer(raw, dtype=COLLISION_DTYPE).copy()
+
+
+def _encode_checkpoint(obj: Any) -> List[bytes]:
+    """Serialize obj into the chunks of a checkpoint file, storing large array buffers (the board grids) as raw bytes.
+    
+    Chunks: the pickled list of raw buffer sizes, the raw buffers, then the pickle stream
+    that references them out of band. The buffers are copied, so the chunks stay valid
+    while the game goes on.
+    """
+    buffers: List[bytes] = []
+    
+    def keep_out_of_band(buf: pickle.PickleBuffer) -> bool:
+        # A false return value moves the buffer out of band
+        raw = buf.raw()
+        if raw.nbytes < GameConstants.SAVE_RAW_BUFFER_MIN:
+            return True
+        buffers.append(raw.tobytes())
+        return False
+    
+    stream = pickle.dumps(obj, protocol=5, buffer_callback=keep_out_of_band)
+    return [pickle.dumps([len(buf) for buf in buffers], protocol=5), *buffers, stream]
+
+
+def _write_checkpoint(file_path: str, chunks: List[bytes]) -> None:
+    """Write checkpoint chunks to file_path, replacing any previous checkpoint atomically."""
+    tmp_path = file_path + ".tmp"
+    with open(tmp_path, "wb", buffering=GameConstants.SAVE_WRITE_BUFFER) as f:
+        f.writelines(chunks)
+    os.replace(tmp_path, file_path)
+
+
+def _load_checkpoint(file_path: str) -> Any:
+    """Read a checkpoint file written by _write_checkpoint."""
+    with open(file_path, "rb") as f:
+        sizes = pickle.load(f)
+        # Writable buffers, so the restored arrays can be modified in place
+        buffers = [bytearray(size) for size in sizes]
+        for buf in buffers:
+            f.readinto(buf)
+        return pickle.load(f, buffers=buffers)
 
 
 class GameManager:
@@ -1294,13 +2290,27 @@ class GameManager:
         self.current_time = time.time()
         self.start_time = 0.0
         self.last_update_time = 0.0
+        self._last_tick_ns = time.monotonic_ns()  # monotonic clock used for the tick dt
         self.active_spells: List[ActiveSpell] = []
+        # Min-heap of (end_time, sequence, active spell) mirroring active_spells
+        self._spell_expiry: List[Tuple[float, int, ActiveSpell]] = []
+        # Spells cast since the last tick; casters only put here, the tick moves them to active_spells
+        self._incoming_spells: queue.SimpleQueue = queue.SimpleQueue()
         self.next_block_queue: Dict[str, List[Block]] = {}
         self.block_fall_speed = GameConstants.INITIAL_FALL_SPEED
         self.gravity = GameConstants.GRAVITY
         self.save_timer = 0.0
+        # Players (and their boards) changed since the last checkpoint; an incremental
+        # checkpoint stores only these. An empty generation forces the next checkpoint to be full.
+        self._dirty_players: Set[str] = set()
+        self._checkpoint_generation = ""
+        self._checkpoint_seq = 0
         self.event_queue = queue.Queue()
-        self.lock = threading.RLock()
+        # Lock order: self.lock -> player.action_lock -> physics_engine.lock.
+        # self.lock guards the game structure and the tick; each player's actions take only
+        # that player's action_lock, so players act concurrently. Code already holding a lock
+        # calls the _-prefixed unlocked bodies.
+        self.lock = threading.Lock()
     
     def initialize_game(self) -> None:
         """Initialize the game with default settings."""
@@ -1309,18 +2319,23 @@ class GameManager:
             self.current_time = time.time()
             self.start_time = self.current_time
             self.last_update_time = self.current_time
+            self._last_tick_ns = time.monotonic_ns()
             
-            # Reset block ID counter
-            BlockFactory.reset_block_id_counter()
-            
-            # Initialize physics engine
-            self.physics_engine = PhysicsEngine()
+            # Reset block ID counter and clear the physics world, keeping the loaded library.
+            # Both are shared with the other games, whose steps hold the engine lock
+            with self.physics_engine.lock:
+                BlockFactory.reset_block_id_counter()
+                self.physics_engine._reset()
             
             # Clear existing data
             self.players.clear()
             self.boards.clear()
             self.active_spells.clear()
+            self._spell_expiry.clear()
+            self._incoming_spells = queue.SimpleQueue()
             self.next_block_queue.clear()
+            self._dirty_players.clear()
+            self._checkpoint_generation = ""
             
             # Set initial game parameters
             self.block_fall_speed = GameConstants.INITIAL_FALL_SPEED
@@ -1348,10 +2363,10 @@ class GameManager:
             # Add some initial spells
             if random.random() < 0.5:
                 # Give light spells
-                player.spells = SpellFactory.create_light_spells()
+                player.set_spells(SpellFactory.create_light_spells())
             else:
                 # Give dark spells
-                player.spells = SpellFactory.create_dark_spells()
+                player.set_spells(SpellFactory.create_dark_spells())
             
             # Create a game board for this player
             board = GameBoard(
@@ -1360,12 +2375,13 @@ class GameManager:
             )
             
             # Generate initial blocks
-            next_blocks = BlockFactory.create_next_blocks(3, player_id)
+            next_blocks = BlockFactory.create_next_blocks(GameConstants.NEXT_BLOCKS, player_id)
             player.next_blocks = next_blocks
             
             # Store the player and board
             self.players[player_id] = player
             self.boards[player_id] = board
+            self._checkpoint_generation = ""
             
             return player_id
     
@@ -1384,11 +2400,20 @@ class GameManager:
             if player_id in self.next_block_queue:
                 del self.next_block_queue[player_id]
             
+            self._dirty_players.discard(player_id)
+            self._checkpoint_generation = ""
+            
             # Remove any active spells cast by or targeting this player
+            self._drain_incoming_spells()
             self.active_spells = [
                 spell for spell in self.active_spells
                 if spell.caster_id != player_id and spell.target_id != player_id
             ]
+            self._spell_expiry = [
+                entry for entry in self._spell_expiry
+                if entry[2].caster_id != player_id and entry[2].target_id != player_id
+            ]
+            heapq.heapify(self._spell_expiry)
             
             return True
     
@@ -1410,8 +2435,10 @@ class GameManager:
             self.current_time = time.time()
             self.start_time = self.current_time
             self.last_update_time = self.current_time
+            self._last_tick_ns = time.monotonic_ns()
             
             # Set all players to playing state
+            self._dirty_players.update(self.players)
             for player in self.players.values():
                 player.state = PlayerState.PLAYING
                 
@@ -1438,84 +2465,122 @@ class GameManager:
             self.game_state = GameState.RUNNING
             self.current_time = time.time()
             self.last_update_time = self.current_time
+            self._last_tick_ns = time.monotonic_ns()
             return True
     
     def end_game(self) -> None:
         """End the game and determine the winner."""
         with self.lock:
-            if self.game_state not in (GameState.RUNNING, GameState.PAUSED):
-                return
+            self._end_game()
+    
+    def _end_game(self) -> None:
+        """End the game and determine the winner; the caller holds self.lock."""
+        if self.game_state not in (GameState.RUNNING, GameState.PAUSED):
+            return
+        
+        # Determine the winner based on game mode
+        if self.game_mode == GameMode.RACE:
+            # Winner is the player who reached the top first
+            winner_id = None
+            highest_position = float('inf')
             
-            # Determine the winner based on game mode
-            if self.game_mode == GameMode.RACE:
-                # Winner is the player who reached the top first
-                winner_id = None
-                highest_position = float('inf')
-                
-                for player_id, board in self.boards.items():
-                    position = board.get_highest_block_position()
-                    if position < highest_position:
-                        highest_position = position
-                        winner_id = player_id
-                
-                if winner_id:
-                    self.players[winner_id].state = PlayerState.VICTORIOUS
-            
-            elif self.game_mode == GameMode.SURVIVAL:
-                # Winner is the last player standing
-                active_players = [
-                    player_id for player_id, player in self.players.items()
-                    if player.state == PlayerState.PLAYING
-                ]
-                
-                if len(active_players) == 1:
-                    self.players[active_players[0]].state = PlayerState.VICTORIOUS
+            for player_id, board in self.boards.items():
+                position = board.get_highest_block_position()
+                if position < highest_position:
+                    highest_position = position
+                    winner_id = player_id
             
-            elif self.game_mode == GameMode.PUZZLE:
-                # Winner is the player who completed the puzzle with the fewest blocks
-                winner_id = None
-                min_blocks = float('inf')
-                
-                for player_id, player in self.players.items():
-                    if player.state == PlayerState.PLAYING and player.blocks_placed < min_blocks:
-                        min_blocks = player.blocks_placed
-                        winner_id = player_id
-                
-                if winner_id:
-                    self.players[winner_id].state = PlayerState.VICTORIOUS
+            if winner_id:
+                self.players[winner_id].state = PlayerState.VICTORIOUS
+        
+        elif self.game_mode == GameMode.SURVIVAL:
+            # Winner is the last player standing
+            active_players = [
+                player_id for player_id, player in self.players.items()
+                if player.state == PlayerState.PLAYING
+            ]
+            
+            if len(active_players) == 1:
+                self.players[active_players[0]].state = PlayerState.VICTORIOUS
+        
+        elif self.game_mode == GameMode.PUZZLE:
+            # Winner is the player who completed the puzzle with the fewest blocks
+            winner_id = None
+            min_blocks = float('inf')
+            
+            for player_id, player in self.players.items():
+                if player.state == PlayerState.PLAYING and player.blocks_placed < min_blocks:
+                    min_blocks = player.blocks_placed
+                    winner_id = player_id
             
-            # Set game state to game over
-            self.game_state = GameState.GAME_OVER
+            if winner_id:
+                self.players[winner_id].state = PlayerState.VICTORIOUS
+        
+        # Set game state to game over
+        self._dirty_players.update(self.players)
+        self.game_state = GameState.GAME_OVER
     
     def update(self) -> None:
         """Update the game state."""
+        checkpoint = None
         with self.lock:
             if self.game_state != GameState.RUNNING:
                 return
             
-            # Update current time
+            # Frame time comes from the monotonic clock so wall-clock adjustments can't skew it;
+            # current_time stays wall-clock because spell end times are saved with the game
+            now_ns = time.monotonic_ns()
+            dt = (now_ns - self._last_tick_ns) * 1e-9
+            self._last_tick_ns = now_ns
             current_time = time.time()
-            dt = current_time - self.last_update_time
             self.current_time = current_time
             self.last_update_time = current_time
             
-            # Update physics
-            self.physics_engine.step(dt)
-            
-            # Update active spells
-            self._update_active_spells()
+            # Start the physics step on the engine's worker thread (the native call releases the GIL)
+            physics_step = self.physics_engine.step_async(dt)
             
-            # Update players
+            # Take in the spells cast since the last tick, then expire game and player spells
+            # while the step runs; this touches no physics state
+            self._drain_incoming_spells()
+            dropped = self._update_active_spells()
+            for player in self.players.values():
+                if player.state == PlayerState.PLAYING:
+                    with player.action_lock:
+                        expired = player.update_active_spells(current_time)
+                    # A spell the game-wide list dropped too has no references left and goes back
+                    # to the pool; one cast after the drain is still queued and must not be reused
+                    for active_spell in expired:
+                        if dropped.get(id(active_spell)) is active_spell:
+                            ActiveSpell.release(active_spell)
+            
+            # Wait for the step before anything below talks to the physics engine;
+            # the FFI wrappers don't catch errors, so the step, the spell effects and the
+            # placement sync count them with record_error instead of aborting the tick
+            try:
+                physics_step.result()
+            except Exception as e:
+                self.physics_engine.record_error(e)
+            
+            # Apply spell effects
+            apply_spell_effect = self._apply_spell_effect
+            mark_dirty = self._dirty_players.add
+            for spell in self.active_spells:
+                apply_spell_effect(spell)
+                mark_dirty(spell.target_id)
+            
+            # Update players; everything that changes a player or their board (falling blocks,
+            # actions, spells) happens while they are playing, so that marks them dirty
+            update_block_position = self._update_block_position
+            handle_ai_player = self._handle_ai_player
             for player_id, player in list(self.players.items()):
                 if player.state != PlayerState.PLAYING:
                     continue
-                
-                # Update player's active spells
-                player.update_active_spells(self.current_time)
+                mark_dirty(player_id)
                 
                 # Update current block position
                 if player.current_block:
-                    self._update_block_position(player_id, dt)
+                    with player.action_lock:
+                        update_block_position(player_id, dt)
                 
                 # Check for game over conditions
                 board = self.boards.get(player_id)
@@ -1529,11 +2594,12 @@ class GameManager:
                     ]
                     
                     if not active_players:
-                        self.end_game()
+                        self._end_game()
                 
                 # Handle AI players
                 if player.is_ai:
-                    self._handle_ai_player(player_id, dt)
+                    with player.action_lock:
+                        handle_ai_player(player_id, dt)
             
             # Check for victory conditions based on game mode
             self._check_victory_conditions()
@@ -1542,19 +2608,42 @@ class GameManager:
             self.save_timer += dt
             if self.save_timer >= GameConstants.SAVE_INTERVAL:
                 self.save_timer = 0
-                self._save_game_state()
-    
-    def _update_active_spells(self) -> None:
-        """Update all active spells and remove expired ones."""
-        # Filter out expired spells
-        self.active_spells = [
-            spell for spell in self.active_spells
-            if not spell.is_expired(self.current_time)
-        ]
+                checkpoint = self._snapshot_game_state()
         
-        # Apply spell effects
-        for spell in self.active_spells:
-            self._apply_spell_effect(spell)
+        # The snapshot is already serialized; write it without holding up other threads
+        if checkpoint is not None:
+            self._write_game_state(*checkpoint)
+    
+    def _drain_incoming_spells(self) -> None:
+        """Move the spells cast since the last call into active_spells; the caller holds self.lock."""
+        incoming = self._incoming_spells
+        if incoming.empty():
+            return
+        active_spells = self.active_spells
+        expiry = self._spell_expiry
+        try:
+            while True:
+                active_spell = incoming.get_nowait()
+                active_spells.append(active_spell)
+                heapq.heappush(expiry, (active_spell.end_time, next(_EXPIRY_SEQUENCE), active_spell))
+        except queue.Empty:
+            pass
+    
+    def _update_active_spells(self) -> Dict[int, ActiveSpell]:
+        """Remove expired spells from the game-wide active spells and return them keyed by id()."""
+        # Filter out expired spells; the list is only rebuilt when the earliest one has ended
+        expiry = self._spell_expiry
+        current_time = self.current_time
+        expired = {}
+        if expiry and expiry[0][0] <= current_time:
+            while expiry and expiry[0][0] <= current_time:
+                active_spell = heapq.heappop(expiry)[2]
+                expired[id(active_spell)] = active_spell
+            self.active_spells = [
+                spell for spell in self.active_spells
+                if id(spell) not in expired
+            ]
+        return expired
     
     def _apply_spell_effect(self, active_spell: ActiveSpell) -> None:
         """Apply the effect of an active spell."""
@@ -1562,108 +2651,120 @@ class GameManager:
         target_id = active_spell.target_id
         
         # Skip if the target player doesn't exist
-        if target_id not in self.players:
+        target = self.players.get(target_id)
+        if target is None:
             return
         
-        # Apply different effects based on the spell type
-        if spell.effect == GameConstants.SPELL_EFFECT_STRENGTHEN:
-            # Increase block density and friction
-            if self.players[target_id].current_block:
-                block = self.players[target_id].current_block
-                block.density *= spell.strength
-                block.friction *= spell.strength
-                self.physics_engine.update_block(block)
-        
-        elif spell.effect == GameConstants.SPELL_EFFECT_LIGHTEN:
-            # Decrease block density
-            if self.players[target_id].current_block:
-                block = self.players[target_id].current_block
-                block.density *= spell.strength  # strength < 1 for lightening
-                self.physics_engine.update_block(block)
-        
-        elif spell.effect == GameConstants.SPELL_EFFECT_MULTIPLY:
-            # This is handled when scoring points
-            pass
+        # Apply different effects based on the spell type; they change the target's block and
+        # board, which the target's own actions change under its action_lock
+        handler = self._EFFECT_HANDLERS.get(spell.effect)
+        if handler is not None:
+            with target.action_lock, self.physics_engine.lock:
+                try:
+                    handler(self, spell, target_id)
+                except Exception as e:
+                    self.physics_engine.record_error(e)
+    
+    def _effect_strengthen(self, spell: Spell, target_id: str) -> None:
+        """Increase block density and friction."""
+        block = self.players[target_id].current_block
+        if block:
+            block.density *= spell.strength
+            block.friction *= spell.strength
+            self.physics_engine.update_block(block)
+    
+    def _effect_lighten(self, spell: Spell, target_id: str) -> None:
+        """Decrease block density."""
+        block = self.players[target_id].current_block
+        if block:
+            block.density *= spell.strength  # strength < 1 for lightening
+            self.physics_engine.update_block(block)
+    
+    def _effect_bridge(self, spell: Spell, target_id: str) -> None:
+        """Create a horizontal bridge."""
+        board = self.boards.get(target_id)
+        current_block = self.players[target_id].current_block
+        if not board or not current_block:
+            return
         
-        elif spell.effect == GameConstants.SPELL_EFFECT_BRIDGE:
-            # Create a horizontal bridge
-            board = self.boards.get(target_id)
-            if board and self.players[target_id].current_block:
-                current_block = self.players[target_id].current_block
-                x = int(current_block.position.x)
-                y = int(current_block.position.y)
-                
-                # Find the nearest gap
-                gap_start = None
-                gap_end = None
-                
-                # Look left for the start of a gap
-                for i in range(x, 0, -1):
-                    if not board.is_cell_empty(i, y):
-                        gap_start = i + 1
-                        break
-                
-                # Look right for the end of a gap
-                for i in range(x, board.width):
-                    if not board.is_cell_empty(i, y):
-                        gap_end = i - 1
-                        break
-                
-                if gap_start is not None and gap_end is not None and gap_start <= gap_end:
-                    # Create blocks to fill the gap
-                    for i in range(gap_start, gap_end + 1):
-                        bridge_block = BlockFactory.create_block(BlockType.SPECIAL, target_id)
-                        bridge_block.position = Position(i, y)
-                        bridge_block.is_static = True
-                        
-                        # Place the block on the board
-                        board.place_block(bridge_block)
-                        
-                        # Add to physics engine
-                        self.physics_engine.create_block(bridge_block)
-        
-        elif spell.effect == GameConstants.SPELL_EFFECT_DESTABILIZE:
-            # Decrease friction and increase angular velocity
-            board = self.boards.get(target_id)
-            if board:
-                for block in board.blocks.values():
-                    block.friction *= spell.strength  # strength < 1 for destabilizing
-                    block.angular_velocity += random.uniform(-2.0, 2.0)
-                    self.physics_engine.update_block(block)
-        
-        elif spell.effect == GameConstants.SPELL_EFFECT_WIND:
-            # Apply a horizontal force to all blocks
-            board = self.boards.get(target_id)
-            if board:
-                wind_direction = 1 if random.random() > 0.5 else -1
-                wind_force = spell.strength * wind_direction
-                
-                for block in board.blocks.values():
-                    if not block.is_static:
-                        self.physics_engine.apply_force(
-                            block.id,
-                            wind_force,
-                            0.0,
-                            block.position.x,
-                            block.position.y
-                        )
-        
-        elif spell.effect == GameConstants.SPELL_EFFECT_SLIPPERY:
-            # Decrease friction
-            board = self.boards.get(target_id)
-            if board:
-                for block in board.blocks.values():
-                    block.friction *= spell.strength  # strength < 1 for slippery
-                    self.physics_engine.update_block(block)
-        
-        elif spell.effect == GameConstants.SPELL_EFFECT_GROW:
-            # Increase block size
-            if self.players[target_id].current_block:
-                block = self.players[target_id].current_block
-                # This would require more complex handling in a real implementation
-                # For now, we just make it harder to place by increasing density
-                block.density *= spell.strength
-                self.physics_engine.update_block(block)
+        x = int(current_block.position.x)
+        y = int(current_block.position.y)
+        
+        # Find the nearest gap
+        gap = board.find_gap(x, y)
+        if gap is None:
+            return
+        
+        # Create blocks to fill the gap
+        gap_start, gap_end = gap
+        create_block = BlockFactory.create_block
+        place_block = board.place_block
+        add_to_physics = self.physics_engine.create_block
+        for i in range(gap_start, gap_end + 1):
+            bridge_block = create_block(BlockType.SPECIAL, target_id)
+            bridge_block.position.x = i
+            bridge_block.position.y = y
+            bridge_block.is_static = True
+            
+            # Place the block on the board
+            place_block(bridge_block)
+            
+            # Add to physics engine
+            add_to_physics(bridge_block)
+    
+    def _effect_destabilize(self, spell: Spell, target_id: str) -> None:
+        """Decrease friction and increase angular velocity."""
+        board = self.boards.get(target_id)
+        if board:
+            store = board.store
+            n = store.size
+            store.friction[:n] *= spell.strength  # strength < 1 for destabilizing
+            store.ang_vel[:n] += np.random.uniform(-2.0, 2.0, n)
+            store.write_back()
+            self.physics_engine.update_store_blocks(store)
+    
+    def _effect_wind(self, spell: Spell, target_id: str) -> None:
+        """Apply a horizontal force to all blocks."""
+        board = self.boards.get(target_id)
+        if board:
+            wind_direction = 1 if random.random() > 0.5 else -1
+            wind_force = spell.strength * wind_direction
+            
+            store = board.store
+            rows = store.dynamic_rows()
+            points = np.column_stack((store.pos_x[rows], store.pos_y[rows]))
+            forces = np.zeros_like(points)
+            forces[:, 0] = wind_force
+            self.physics_engine.apply_forces_batch(store.ids[rows], forces, points)
+    
+    def _effect_slippery(self, spell: Spell, target_id: str) -> None:
+        """Decrease friction."""
+        board = self.boards.get(target_id)
+        if board:
+            store = board.store
+            store.friction[:store.size] *= spell.strength  # strength < 1 for slippery
+            store.write_back()
+            self.physics_engine.update_store_blocks(store)
+    
+    def _effect_grow(self, spell: Spell, target_id: str) -> None:
+        """Increase block size."""
+        block = self.players[target_id].current_block
+        if block:
+            # This would require more complex handling in a real implementation
+            # For now, we just make it harder to place by increasing density
+            block.density *= spell.strength
+            self.physics_engine.update_block(block)
+    
+    # Spell effect -> handler; MULTIPLY has none because it is handled when scoring points
+    _EFFECT_HANDLERS: Dict[str, Callable[['GameManager', Spell, str], None]] = {
+        GameConstants.SPELL_EFFECT_STRENGTHEN: _effect_strengthen,
+        GameConstants.SPELL_EFFECT_LIGHTEN: _effect_lighten,
+        GameConstants.SPELL_EFFECT_BRIDGE: _effect_bridge,
+        GameConstants.SPELL_EFFECT_DESTABILIZE: _effect_destabilize,
+        GameConstants.SPELL_EFFECT_WIND: _effect_wind,
+        GameConstants.SPELL_EFFECT_SLIPPERY: _effect_slippery,
+        GameConstants.SPELL_EFFECT_GROW: _effect_grow,
+    }
     
     def _update_block_position(self, player_id: str, dt: float) -> None:
         """Update the position of a player's current block."""
@@ -1678,51 +2779,58 @@ class GameManager:
         block = player.current_block
         
         # Calculate fall distance based on speed and time
-        fall_speed = self.block_fall_speed * player.level * GameConstants.SPEED_INCREASE_FACTOR
-        fall_distance = fall_speed * dt
+        fall_distance = player.fall_speed * dt
         
         # Move the block down
-        old_position = Position(block.position.x, block.position.y)
+        old_y = block.position.y
         block.position.y += fall_distance
         
         # Check if the block can be placed at the new position
         if not board.can_place_block(block):
             # Revert to the old position
-            block.position = old_position
+            block.position.y = old_y
             
-            # Try to place the block
-            if board.place_block(block):
-                player.blocks_placed += 1
-                
-                # Add the block to the physics engine
+            # Place the block and settle the lines it completes
+            self._finalize_placement(player_id, player, board, block)
+    
+    def _finalize_placement(self, player_id: str, player: Player, board: GameBoard, block: Block) -> bool:
+        """Place a player's block where it is, then clear the completed lines, score them and hand out the next block.
+        
+        The caller holds the player's action_lock. Returns False if the block does not fit.
+        """
+        if not board.place_block(block):
+            return False
+        player.blocks_placed += 1
+        
+        # Add the block to the physics engine; the board already holds it, so a failed
+        # sync is only counted
+        with self.physics_engine.lock:
+            try:
                 self.physics_engine.create_block(block)
-                
-                # Check for completed lines
-                completed_lines = board.check_lines()
-                if completed_lines:
-                    lines_cleared = board.clear_lines(completed_lines)
-                    
-                    # Update player stats
-                    player.add_lines(lines_cleared)
-                    
-                    # Calculate score
-                    score = self._calculate_score(lines_cleared, player.combo_count)
-                    
-                    # Apply score multiplier from spells
-                    for spell in player.active_spells:
-                        if spell.spell.effect == GameConstants.SPELL_EFFECT_MULTIPLY:
-                            score = int(score * spell.spell.strength)
-                    
-                    player.add_score(score)
-                    
-                    # Update combo count
-                    player.combo_count += 1
-                else:
-                    # Reset combo count
-                    player.combo_count = 0
-                
-                # Give the player their next block
-                self._give_next_block(player_id)
+            except Exception as e:
+                self.physics_engine.record_error(e)
+        
+        # Check for completed lines
+        completed_lines = board.check_lines()
+        if completed_lines:
+            lines_cleared = board.clear_lines(completed_lines)
+            
+            # Update player stats
+            player.add_lines(lines_cleared)
+            
+            # Score the lines, scaled by the player's multiply spells
+            score = self._calculate_score(lines_cleared, player.combo_count)
+            player.add_score(int(score * player.score_multiplier))
+            
+            # Update combo count
+            player.combo_count += 1
+        else:
+            # Reset combo count
+            player.combo_count = 0
+        
+        # Give the player their next block
+        self._give_next_block(player_id)
+        return True
     
     def _give_next_block(self, player_id: str) -> None:
         """Give the player their next block."""
@@ -1732,15 +2840,14 @@ class GameManager:
         
         # Take the next block from the queue
         if player.next_blocks:
-            player.current_block = player.next_blocks.pop(0)
+            player.current_block = player.next_blocks.popleft()
             
             # Position the block at the top center of the board
             board = self.boards.get(player_id)
             if board:
-                player.current_block.position = Position(
-                    board.width // 2 - player.current_block.shape.width // 2,
-                    0
-                )
+                position = player.current_block.position
+                position.x = board.width // 2 - player.current_block.shape.width // 2
+                position.y = 0
         
         # Generate a new block for the queue
         new_block = BlockFactory.create_block(player_id=player_id)
@@ -1748,21 +2855,8 @@ class GameManager:
     
     def _calculate_score(self, lines_cleared: int, combo_count: int) -> int:
         """Calculate the score for clearing lines."""
-        base_score = 0
-        
-        if lines_cleared == 1:
-            base_score = GameConstants.POINTS_SINGLE_LINE
-        elif lines_cleared == 2:
-            base_score = GameConstants.POINTS_DOUBLE_LINE
-        elif lines_cleared == 3:
-            base_score = GameConstants.POINTS_TRIPLE_LINE
-        elif lines_cleared >= 4:
-            base_score = GameConstants.POINTS_TETRIS
-        
         # Add combo bonus
-        combo_bonus = combo_count * GameConstants.POINTS_COMBO_MULTIPLIER
-        
-        return base_score + combo_bonus
+        return _LINE_POINTS[min(lines_cleared, 4)] + combo_count * GameConstants.POINTS_COMBO_MULTIPLIER
     
     def _check_victory_conditions(self) -> None:
         """Check for victory conditions based on the game mode."""
@@ -1803,17 +2897,24 @@ class GameManager:
         if not player or not player.is_ai or not player.current_block:
             return
         
-        # Simple AI: move randomly and occasionally rotate
-        if random.random() < 0.1:  # 10% chance to move each update
+        # Simple AI: move randomly and occasionally rotate. Each action waits out its own
+        # timer, so most ticks only decrement three floats
+        player.ai_move_timer -= dt
+        if player.ai_move_timer <= 0:
+            player.ai_move_timer = random.expovariate(GameConstants.AI_MOVE_RATE)
             # Choose a random direction
             direction = random.choice([Direction.LEFT, Direction.RIGHT])
-            self.move_block(player_id, direction)
+            self._move_block(player_id, direction)
         
-        if random.random() < 0.05:  # 5% chance to rotate each update
-            self.rotate_block(player_id, clockwise=random.choice([True, False]))
+        player.ai_rotate_timer -= dt
+        if player.ai_rotate_timer <= 0:
+            player.ai_rotate_timer = random.expovariate(GameConstants.AI_ROTATE_RATE)
+            self._rotate_block(player_id, clockwise=random.choice([True, False]))
         
         # Occasionally cast spells if available
-        if random.random() < 0.01 and player.spells:  # 1% chance each update
+        player.ai_spell_timer -= dt
+        if player.ai_spell_timer <= 0 and player.spells:
+            player.ai_spell_timer = random.expovariate(GameConstants.AI_SPELL_RATE)
             spell = random.choice(player.spells)
             
             # Choose a target based on the spell type
@@ -1831,60 +2932,107 @@ class GameManager:
                 else:
                     target_id = player_id
             
-            self.cast_spell(player_id, spell.id, target_id)
+            self._cast_spell(player_id, spell.id, target_id)
     
-    def _save_game_state(self) -> None:
-        """Save the current game state."""
+    def _snapshot_game_state(self) -> Optional[Tuple[str, List[bytes], bool]]:
+        """Serialize a checkpoint of the game; the caller holds self.lock.
+        
+        Every FULL_SAVE_EVERY-th checkpoint (and the first one after players join or leave) holds
+        the whole game; the ones in between hold only the players changed since the previous
+        checkpoint and go to numbered files next to it. Returns the path, the file chunks and
+        whether it is a full checkpoint, for _write_game_state, or None on failure.
+        """
         try:
+            self._drain_incoming_spells()
+            file_path = f"game_state_{self.game_id}.{GameConstants.SAVE_FORMAT}"
+            full = not self._checkpoint_generation or self._checkpoint_seq >= GameConstants.FULL_SAVE_EVERY
+            if full:
+                generation = uuid.uuid4().hex
+                seq = 0
+                players = self.players
+                boards = self.boards
+            else:
+                generation = self._checkpoint_generation
+                seq = self._checkpoint_seq + 1
+                file_path = f"{file_path}.{seq}"
+                dirty = self._dirty_players
+                players = {player_id: player for player_id, player in self.players.items() if player_id in dirty}
+                boards = {player_id: board for player_id, board in self.boards.items() if player_id in dirty}
+            
+            # The objects are pickled as they are, sharing the spells between players and the game
             game_state = {
+                "generation": generation,
+                "seq": seq,
                 "game_id": self.game_id,
-                "game_mode": self.game_mode.name,
-                "game_state": self.game_state.name,
+                "game_mode": self.game_mode,
+                "game_state": self.game_state,
                 "current_time": self.current_time,
                 "start_time": self.start_time,
-                "players": {player_id: player.to_dict() for player_id, player in self.players.items()},
-                "boards": {player_id: board.to_dict() for player_id, board in self.boards.items()},
-                "active_spells": [spell.to_dict() for spell in self.active_spells]
+                "players": players,
+                "boards": boards,
+                "active_spells": self.active_spells
             }
             
-            with open(f"game_state_{self.game_id}.json", "w") as f:
-                json.dump(game_state, f, indent=2)
+            # Player actions only take their action_lock; hold them all for a consistent snapshot
+            with contextlib.ExitStack() as stack:
+                for player in self.players.values():
+                    stack.enter_context(player.action_lock)
+                chunks = _encode_checkpoint(game_state)
             
-            logger.info(f"Game state saved: game_state_{self.game_id}.json")
+            self._checkpoint_generation = generation
+            self._checkpoint_seq = seq
+            self._dirty_players.clear()
+            return file_path, chunks, full
         except Exception as e:
             logger.error(f"Failed to save game state: {e}")
+            return None
+    
+    def _write_game_state(self, file_path: str, chunks: List[bytes], full: bool) -> None:
+        """Write a checkpoint from _snapshot_game_state to disk; called without self.lock."""
+        try:
+            _write_checkpoint(file_path, chunks)
+            logger.info(f"Game state saved: {file_path}")
+        except Exception as e:
+            logger.error(f"Failed to save game state: {e}")
+            # Later incremental checkpoints would build on the missing one; start over
+            self._checkpoint_generation = ""
+            return
+        
+        if full:
+            # Drop the incremental checkpoints of the previous generation
+            seq = 1
+            while os.path.exists(f"{file_path}.{seq}"):
+                os.remove(f"{file_path}.{seq}")
+                seq += 1
     
     def load_game_state(self, file_path: str) -> bool:
         """Load a game state from a file."""
         try:
-            with open(file_path, "r") as f:
-                game_state = json.load(f)
+            if file_path.endswith(".json"):
+                game_state = self._read_json_game_state(file_path)
+            else:
+                game_state = _load_checkpoint(file_path)
+                self._apply_incremental_checkpoints(file_path, game_state)
             
             with self.lock:
                 self.game_id = game_state["game_id"]
-                self.game_mode = GameMode[game_state["game_mode"]]
-                self.game_state = GameState[game_state["game_state"]]
+                self.game_mode = game_state["game_mode"]
+                self.game_state = game_state["game_state"]
                 self.current_time = game_state["current_time"]
                 self.start_time = game_state["start_time"]
                 self.last_update_time = time.time()
-                
-                # Load players
-                self.players = {
-                    player_id: Player.from_dict(player_data)
-                    for player_id, player_data in game_state["players"].items()
-                }
-                
-                # Load boards
-                self.boards = {
-                    player_id: GameBoard.from_dict(board_data)
-                    for player_id, board_data in game_state["boards"].items()
-                }
-                
-                # Load active spells
-                self.active_spells = [
-                    ActiveSpell.from_dict(spell_data)
-                    for spell_data in game_state["active_spells"]
+                self._last_tick_ns = time.monotonic_ns()
+                self.players = game_state["players"]
+                self.boards = game_state["boards"]
+                self.active_spells = game_state["active_spells"]
+                self._incoming_spells = queue.SimpleQueue()
+                self._dirty_players.clear()
+                self._checkpoint_generation = ""
+                self._spell_expiry = [
+                    (active_spell.end_time, next(_EXPIRY_SEQUENCE), active_spell)
+                    for active_spell in self.active_spells
                 ]
+                heapq.heapify(self._spell_expiry)
                 
                 logger.info(f"Game state loaded from {file_path}")
                 return True
@@ -1892,232 +3040,214 @@ class GameManager:
             logger.error(f"Failed to load game state: {e}")
             return False
     
+    @staticmethod
+    def _apply_incremental_checkpoints(file_path: str, game_state: Dict[str, Any]) -> None:
+        """Replay the incremental checkpoints written after the full one at file_path onto game_state."""
+        generation = game_state["generation"]
+        seq = 1
+        while os.path.exists(f"{file_path}.{seq}"):
+            delta = _load_checkpoint(f"{file_path}.{seq}")
+            # A leftover from an older generation ends the chain
+            if delta["generation"] != generation:
+                break
+            game_state["game_state"] = delta["game_state"]
+            game_state["current_time"] = delta["current_time"]
+            game_state["players"].update(delta["players"])
+            game_state["boards"].update(delta["boards"])
+            game_state["active_spells"] = delta["active_spells"]
+            seq += 1
+    
+    @staticmethod
+    def _read_json_game_state(file_path: str) -> Dict[str, Any]:
+        """Read a JSON save written by older versions into the objects a pickled save holds."""
+        with open(file_path, "r") as f:
+            game_state = json.load(f)
+        
+        return {
+            "game_id": game_state["game_id"],
+            "game_mode": GameMode[game_state["game_mode"]],
+            "game_state": GameState[game_state["game_state"]],
+            "current_time": game_state["current_time"],
+            "start_time": game_state["start_time"],
+            "players": {
+                player_id: Player.from_dict(player_data)
+                for player_id, player_data in game_state["players"].items()
+            },
+            "boards": {
+                player_id: GameBoard.from_dict(board_data)
+                for player_id, board_data in game_state["boards"].items()
+            },
+            "active_spells": [
+                ActiveSpell.from_dict(spell_data)
+                for spell_data in game_state["active_spells"]
+            ]
+        }
+    
     # Player action methods
     
     def move_block(self, player_id: str, direction: Direction) -> bool:
         """Move a player's current block in the specified direction."""
-        with self.lock:
-            player = self.players.get(player_id)
-            if not player or player.state != PlayerState.PLAYING or not player.current_block:
-                return False
-            
-            board = self.boards.get(player_id)
-            if not board:
-                return False
-            
-            block = player.current_block
-            
-            # Save the old position
-            old_position = Position(block.position.x, block.position.y)
-            
-            # Move the block
-            block.move(direction)
-            
-            # Check if the new position is valid
-            if not board.can_place_block(block):
-                # Revert to the old position
-                block.position = old_position
-                return False
-            
-            return True
+        player = self.players.get(player_id)
+        if not player:
+            return False
+        with player.action_lock:
+            return self._move_block(player_id, direction)
+    
+    def _move_block(self, player_id: str, direction: Direction) -> bool:
+        """Move a player's current block in the specified direction; the caller holds the player's action_lock."""
+        player = self.players.get(player_id)
+        if not player or player.state != PlayerState.PLAYING or not player.current_block:
+            return False
+        
+        board = self.boards.get(player_id)
+        if not board:
+            return False
+        
+        block = player.current_block
+        
+        # Save the old position
+        old_x, old_y = block.position.x, block.position.y
+        
+        # Move the block
+        block.move(direction)
+        
+        # Check if the new position is valid
+        if not board.can_place_block(block):
+            # Revert to the old position
+            block.position.x, block.position.y = old_x, old_y
+            return False
+        
+        return True
     
     def rotate_block(self, player_id: str, clockwise: bool = True) -> bool:
         """Rotate a player's current block."""
-        with self.lock:
-            player = self.players.get(player_id)
-            if not player or player.state != PlayerState.PLAYING or not player.current_block:
-                return False
-            
-            board = self.boards.get(player_id)
-            if not board:
-                return False
-            
-            block = player.current_block
-            
-            # Save the old shape and rotation
-            old_shape = block.shape
-            old_rotation = block.rotation
-            
-            # Rotate the block
-            if clockwise:
-                block.rotate_clockwise()
-            else:
-                block.rotate_counterclockwise()
-            
-            # Check if the new position is valid
-            if not board.can_place_block(block):
-                # Try wall kicks (standard SRS wall kick)
-                # These are the standard offsets to try when a rotation fails
-                offsets = [
-                    (1, 0), (-1, 0), (0, 1), (0, -1),  # Basic NESW
-                    (2, 0), (-2, 0), (0, 2), (0, -2),  # Extended NESW
-                    (1, 1), (-1, 1), (1, -1), (-1, -1)  # Diagonals
-                ]
-                
-                success = False
-                original_position = Position(block.position.x, block.position.y)
-                
-                for offset_x, offset_y in offsets:
-                    block.position.x = original_position.x + offset_x
-                    block.position.y = original_position.y + offset_y
-                    
-                    if board.can_place_block(block):
-                        success = True
-                        break
-                
-                if not success:
-                    # Revert to the old shape and rotation
-                    block.shape = old_shape
-                    block.rotation = old_rotation
-                    block.position = original_position
-                    return False
-            
-            return True
+        player = self.players.get(player_id)
+        if not player:
+            return False
+        with player.action_lock:
+            return self._rotate_block(player_id, clockwise)
+    
+    def _rotate_block(self, player_id: str, clockwise: bool = True) -> bool:
+        """Rotate a player's current block; the caller holds the player's action_lock."""
+        player = self.players.get(player_id)
+        if not player or player.state != PlayerState.PLAYING or not player.current_block:
+            return False
+        
+        board = self.boards.get(player_id)
+        if not board:
+            return False
+        
+        block = player.current_block
+        
+        # Save the old shape and rotation
+        old_shape = block.shape
+        old_rotation = block.rotation
+        
+        # Rotate the block
+        if clockwise:
+            block.rotate_clockwise()
+        else:
+            block.rotate_counterclockwise()
+        
+        # Find where the rotated block fits: in place or at the first standard wall kick
+        kick = board.find_kick(block)
+        if kick is None:
+            # Revert to the old shape and rotation
+            block.shape = old_shape
+            block.rotation = old_rotation
+            return False
+        
+        offset_x, offset_y = kick
+        if offset_x or offset_y:
+            block.position.x += offset_x
+            block.position.y += offset_y
+        
+        return True
     
     def drop_block(self, player_id: str, hard_drop: bool = False) -> bool:
         """Drop a player's current block."""
-        with self.lock:
-            player = self.players.get(player_id)
-            if not player or player.state != PlayerState.PLAYING or not player.current_block:
-                return False
-            
-            board = self.boards.get(player_id)
-            if not board:
-                return False
+        player = self.players.get(player_id)
+        if not player:
+            return False
+        with player.action_lock:
+            return self._drop_block(player_id, hard_drop)
+    
+    def _drop_block(self, player_id: str, hard_drop: bool = False) -> bool:
+        """Drop a player's current block; the caller holds the player's action_lock."""
+        player = self.players.get(player_id)
+        if not player or player.state != PlayerState.PLAYING or not player.current_block:
+            return False
+        
+        board = self.boards.get(player_id)
+        if not board:
+            return False
+        
+        block = player.current_block
+        
+        if hard_drop:
+            # Hard drop: move the block down as far as possible
+            drop_distance = board.drop_distance(block)
+            block.position.y += drop_distance
             
-            block = player.current_block
+            # Place the block
+            if self._finalize_placement(player_id, player, board, block):
+                # Add points for hard drop
+                player.add_score(drop_distance * GameConstants.POINTS_HARD_DROP)
+                return True
+        else:
+            # Soft drop: move the block down one cell
+            old_y = block.position.y
+            block.position.y += 1
             
-            if hard_drop:
-                # Hard drop: move the block down as far as possible
-                drop_distance = 0
-                
-                while True:
-                    old_position = Position(block.position.x, block.position.y)
-                    block.position.y += 1
-                    
-                    if not board.can_place_block(block):
-                        block.position = old_position
-                        break
-                    
-                    drop_distance += 1
+            if not board.can_place_block(block):
+                block.position.y = old_y
                 
                 # Place the block
-                if board.place_block(block):
-                    player.blocks_placed += 1
-                    
-                    # Add points for hard drop
-                    player.add_score(drop_distance * GameConstants.POINTS_HARD_DROP)
-                    
-                    # Add the block to the physics engine
-                    self.physics_engine.create_block(block)
-                    
-                    # Check for completed lines
-                    completed_lines = board.check_lines()
-                    if completed_lines:
-                        lines_cleared = board.clear_lines(completed_lines)
-                        
-                        # Update player stats
-                        player.add_lines(lines_cleared)
-                        
-                        # Calculate score
-                        score = self._calculate_score(lines_cleared, player.combo_count)
-                        
-                        # Apply score multiplier from spells
-                        for spell in player.active_spells:
-                            if spell.spell.effect == GameConstants.SPELL_EFFECT_MULTIPLY:
-                                score = int(score * spell.spell.strength)
-                        
-                        player.add_score(score)
-                        
-                        # Update combo count
-                        player.combo_count += 1
-                    else:
-                        # Reset combo count
-                        player.combo_count = 0
-                    
-                    # Give the player their next block
-                    self._give_next_block(player_id)
-                    
+                if self._finalize_placement(player_id, player, board, block):
                     return True
             else:
-                # Soft drop: move the block down one cell
-                old_position = Position(block.position.x, block.position.y)
-                block.position.y += 1
-                
-                if not board.can_place_block(block):
-                    block.position = old_position
-                    
-                    # Place the block
-                    if board.place_block(block):
-                        player.blocks_placed += 1
-                        
-                        # Add the block to the physics engine
-                        self.physics_engine.create_block(block)
-                        
-                        # Check for completed lines
-                        completed_lines = board.check_lines()
-                        if completed_lines:
-                            lines_cleared = board.clear_lines(completed_lines)
-                            
-                            # Update player stats
-                            player.add_lines(lines_cleared)
-                            
-                            # Calculate score
-                            score = self._calculate_score(lines_cleared, player.combo_count)
-                            
-                            # Apply score multiplier from spells
-                            for spell in player.active_spells:
-                                if spell.spell.effect == GameConstants.SPELL_EFFECT_MULTIPLY:
-                                    score = int(score * spell.spell.strength)
-                            
-                            player.add_score(score)
-                            
-                            # Update combo count
-                            player.combo_count += 1
-                        else:
-                            # Reset combo count
-                            player.combo_count = 0
-                        
-                        # Give the player their next block
-                        self._give_next_block(player_id)
-                        
-                        return True
-                else:
-                    # Add points for soft drop
-                    player.add_score(GameConstants.POINTS_SOFT_DROP)
-                    return True
-            
-            return False
-    
+                # Add points for soft drop
+                player.add_score(GameConstants.POINTS_SOFT_DROP)
+                return True
+        
+        return False
+
     def cast_spell(self, caster_id: str, spell_id: str, target_id: str) -> bool:
         """Cast a spell."""
-        with self.lock:
-            caster = self.players.get(caster_id)
-            if not caster or caster.state != PlayerState.PLAYING:
-                return False
-            
-            target = self.players.get(target_id)
-            if not target or target.state != PlayerState.PLAYING:
-                return False
-            
-            # Find the spell
-            spell = next((s for s in caster.spells if s.id == spell_id), None)
-            if not spell:
-                return False
-            
-            # Check if the caster has enough mana
-            if caster.mana < spell.mana_cost:
-                return False
-            
-            # Cast the spell
-            active_spell = caster.cast_spell(spell_id, target_id, self.current_time)
-            if not active_spell:
-                return False
-            
-            # Add to global active spells
-            self.active_spells.append(active_spell)
-            
-            return True
+        caster = self.players.get(caster_id)
+        if not caster:
+            return False
+        with caster.action_lock:
+            return self._cast_spell(caster_id, spell_id, target_id)
+    
+    def _cast_spell(self, caster_id: str, spell_id: str, target_id: str) -> bool:
+        """Cast a spell; the caller holds the caster's action_lock."""
+        caster = self.players.get(caster_id)
+        if not caster or caster.state != PlayerState.PLAYING:
+            return False
+        
+        target = self.players.get(target_id)
+        if not target or target.state != PlayerState.PLAYING:
+            return False
+        
+        # Find the spell
+        spell = caster.get_spell(spell_id)
+        if not spell:
+            return False
+        
+        # Check if the caster has enough mana
+        if caster.mana < spell.mana_cost:
+            return False
+        
+        # Cast the spell
+        active_spell = caster.cast_spell(spell_id, target_id, self.current_time)
+        if not active_spell:
+            return False
+        
+        # Hand over to the game-wide active spells; the next tick picks it up
+        self._incoming_spells.put_nowait(active_spell)
+        
+        return True
     
     def set_player_ready(self, player_id: str, ready: bool = True) -> bool:
         """Set a player's ready state."""
@@ -2126,6 +3256,7 @@ class GameManager:
             if not player:
                 return False
             
+            self._dirty_players.add(player_id)
             if ready:
                 player.state = PlayerState.READY
             else:
@@ -2135,17 +3266,36 @@ class GameManager:
     
     def get_game_state(self) -> Dict[str, Any]:
         """Get the current game state."""
+        # Copy the game-wide fields under the lock; pooled spells are converted here, before
+        # the next tick can recycle them
         with self.lock:
-            return {
+            self._drain_incoming_spells()
+            state = {
                 "game_id": self.game_id,
                 "game_mode": self.game_mode.name,
                 "game_state": self.game_state.name,
                 "current_time": self.current_time,
                 "start_time": self.start_time,
                 "elapsed_time": self.current_time - self.start_time if self.start_time > 0 else 0,
-                "players": {player_id: player.to_dict() for player_id, player in self.players.items()},
+                "players": None,
                 "active_spells": [spell.to_dict() for spell in self.active_spells]
             }
+            players = list(self.players.items())
+        
+        # Convert each player under its own action_lock, so the tick only waits for one player at a time
+        players_state = {}
+        for player_id, player in players:
+            with player.action_lock:
+                players_state[player_id] = player.to_dict()
+        state["players"] = players_state
+        return state
+    
+    def get_game_state_json(self) -> bytes:
+        """Get the current game state as compact UTF-8 JSON, for status polling."""
+        state = self.get_game_state()
+        if orjson is not None:
+            return orjson.dumps(state, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(state, separators=(",", ":")).encode("utf-8")
     
     def get_player_state(self, player_id: str) -> Optional[Dict[str, Any]]:
         """Get a player's state."""
@@ -2158,10 +3308,12 @@ class GameManager:
             if not board:
                 return None
             
-            return {
-                "player": player.to_dict(),
-                "board": board.to_dict()
-            }
+            # Player actions change the block queue and the board under the action_lock only
+            with player.action_lock:
+                return {
+                    "player": player.to_dict(),
+                    "board": board.to_dict()
+                }
 
 
 class GameServer:
@@ -2171,6 +3323,10 @@ class GameServer:
         """Initialize the game server."""
         self.games: Dict[str, GameManager] = {}
         self.lock = threading.RLock()
+        # Games lock themselves, so independent games are updated in parallel
+        self._executor = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="game")
+        # Compile the board kernels now rather than on the first player action
+        warm_up_board_kernels()
     
     def create_game(self, game_mode: GameMode = GameMode.SURVIVAL) -> str:
         """Create a new game and return its ID."""
@@ -2196,38 +3352,55 @@ class GameServer:
     def get_all_games(self) -> Dict[str, Dict[str, Any]]:
         """Get information about all games."""
         with self.lock:
-            return {
-                game_id: {
-                    "game_id": game.game_id,
-                    "game_mode": game.game_mode.name,
-                    "game_state": game.game_state.name,
-                    "player_count": len(game.players),
-                    "start_time": game.start_time
-                }
-                for game_id, game in self.games.items()
+            games = list(self.games.items())
+        
+        return {
+            game_id: {
+                "game_id": game.game_id,
+                "game_mode": game.game_mode.name,
+                "game_state": game.game_state.name,
+                "player_count": len(game.players),
+                "start_time": game.start_time
             }
+            for game_id, game in games
+        }
     
     def update_all_games(self) -> None:
         """Update all running games."""
+        # The server lock only guards the games dict; each update takes its own game's lock
         with self.lock:
-            for game in list(self.games.values()):
-                if game.game_state == GameState.RUNNING:
-                    game.update()
+            games = [game for game in self.games.values() if game.game_state == GameState.RUNNING]
+        
+        if len(games) == 1:
+            games[0].update()
+        elif games:
+            # Wait for every update and re-raise the first error
+            for _ in self._executor.map(GameManager.update, games):
+                pass
     
     def cleanup_inactive_games(self, max_age: float = 3600.0) -> int:
         """Remove inactive games older than max_age seconds."""
         with self.lock:
-            current_time = time.time()
-            inactive_games = [
-                game_id for game_id, game in self.games.items()
-                if game.game_state in (GameState.GAME_OVER, GameState.VICTORY) and
-                current_time - game.current_time > max_age
-            ]
-            
-            for game_id in inactive_games:
-                del self.games[game_id]
-            
-            return len(inactive_games)
+            games = list(self.games.items())
+        
+        current_time = time.time()
+        inactive_games = [
+            (game_id, game) for game_id, game in games
+            if game.game_state in (GameState.GAME_OVER, GameState.VICTORY) and
+            current_time - game.current_time > max_age
+        ]
+        if not inactive_games:
+            return 0
+        
+        # Skip IDs that were removed or replaced in the meantime
+        removed = 0
+        with self.lock:
+            for game_id, game in inactive_games:
+                if self.games.get(game_id) is game:
+                    del self.games[game_id]
+                    removed += 1
+        
+        return removed
 
 
 # Example usage
@@ -0,0 +1,3 @@
+"""
+Tests for the game logic package.
+"""
@@ -0,0 +1,54 @@
+"""
+Common fixtures for the game logic tests.
+"""
+
+import random
+import pytest
+import numpy as np
+from ..game_logic import (
+    BlockFactory,
+    BlockShape,
+    BlockType,
+    Block,
+    GameManager,
+    GameMode,
+    Position
+)
+
+@pytest.fixture
+def rng():
+    """Seeded random generators, so failures reproduce."""
+    random.seed(1234)
+    np.random.seed(1234)
+    return np.random.default_rng(1234)
+
+@pytest.fixture
+def make_cell():
+    """Create a one-cell block at (x, y), used to draw arbitrary board patterns."""
+    shape = BlockShape(BlockType.SPECIAL, cells=[[True]], width=1, height=1)
+
+    def make(x, y):
+        block_id = next(BlockFactory._block_ids)
+        return Block(block_id, BlockType.SPECIAL, shape, Position(x, y))
+
+    return make
+
+@pytest.fixture
+def game_manager(tmp_path, monkeypatch, rng):
+    """Running game with two players; checkpoints are written to tmp_path.
+
+    The physics engine loads ./libphysics.so, so the tests using this fixture run from the
+    directory holding the library and are skipped without it.
+    """
+    try:
+        manager = GameManager(GameMode.SURVIVAL)
+    except RuntimeError as e:
+        pytest.skip(f"Physics library not available: {e}")
+    monkeypatch.chdir(tmp_path)
+
+    manager.initialize_game()
+    for name in ("A", "B"):
+        manager.set_player_ready(manager.add_player(name))
+    assert manager.start_game()
+    yield manager
+    manager.end_game()
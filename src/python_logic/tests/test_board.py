@@ -0,0 +1,264 @@
+"""
+Tests for the game board: the row bitboard, line clearing, the block store and the board kernels.
+
+Each optimized path is checked against a plain cell-by-cell reference.
+"""
+
+import base64
+import itertools
+import os
+import subprocess
+import sys
+import pytest
+import numpy as np
+from .. import game_logic
+from ..game_logic import (
+    BlockFactory,
+    BlockRotation,
+    BlockShape,
+    BlockStore,
+    BlockType,
+    GameBoard,
+    Position,
+    ROTATION_KICKS,
+    SHAPES,
+    EMPTY_CELL,
+    CELL_DTYPE,
+    _shape_fits,
+    _drop_distance,
+    _find_kick
+)
+
+WIDTH, HEIGHT = 10, 20
+
+def reference_fits(cells, shape, x, y):
+    """Whether a shape fits the grid with its origin at (x, y), checked cell by cell."""
+    height, width = cells.shape
+    for dx, dy in shape.offsets.tolist():
+        cx, cy = x + dx, y + dy
+        if not (0 <= cx < width and 0 <= cy < height) or cells[cy, cx] != EMPTY_CELL:
+            return False
+    return True
+
+def reference_clear(cells, lines):
+    """Remove the given rows and shift the rows above them down."""
+    kept = np.delete(cells, lines, axis=0)
+    cleared = np.full_like(cells, EMPTY_CELL)
+    cleared[len(lines):] = kept
+    return cleared
+
+def random_board(rng, make_cell, fill, full_rows=()):
+    """Board with about fill of its cells occupied by one-cell blocks and the given rows completely full."""
+    board = GameBoard(WIDTH, HEIGHT)
+    occupied = rng.random((HEIGHT, WIDTH)) < fill
+    occupied[list(full_rows)] = True
+    for y, x in np.argwhere(occupied).tolist():
+        assert board.place_block(make_cell(x, y))
+    return board
+
+def assert_consistent(board):
+    """The bitboard, top row and block store agree with the cell grid."""
+    occupied = board.cells != EMPTY_CELL
+    expected_mask = (occupied * (1 << np.arange(board.width))).sum(axis=1)
+    np.testing.assert_array_equal(board.row_mask, expected_mask)
+
+    rows = np.flatnonzero(occupied.any(axis=1))
+    expected_top = int(rows[0]) if rows.size else board.height
+    assert board.get_highest_block_position() == expected_top
+
+    assert board.check_lines() == np.flatnonzero(occupied.all(axis=1)).tolist()
+    assert board.store.size == len(board.blocks)
+    assert set(board.store.index) == set(board.blocks)
+
+def test_place_block_updates_bitboard(rng, make_cell):
+    """Placing blocks keeps the row mask equal to the occupied cells."""
+    board = random_board(rng, make_cell, 0.3)
+    assert_consistent(board)
+
+    for block_type in (BlockType.I, BlockType.T, BlockType.S):
+        block = BlockFactory.create_block(block_type)
+        block.position = Position(3, 0)
+        if board.place_block(block):
+            assert_consistent(board)
+
+@pytest.mark.parametrize("full_rows", [(19,), (18, 19), (5, 12), (0, 7, 8, 19)])
+def test_clear_lines_matches_reference(rng, make_cell, full_rows):
+    """clear_lines shifts the grid and the bitboard like a row-by-row clear."""
+    board = random_board(rng, make_cell, 0.5, full_rows)
+    assert board.check_lines() == sorted(full_rows)
+    before = board.cells.copy()
+
+    assert board.clear_lines(board.check_lines()) == len(full_rows)
+    np.testing.assert_array_equal(board.cells, reference_clear(before, list(full_rows)))
+    assert_consistent(board)
+
+    # Blocks that had a cell in a cleared row are gone
+    for block_id in np.unique(before[list(full_rows)]).tolist():
+        assert block_id not in board.blocks
+
+def test_clear_lines_drops_spanning_blocks(make_cell):
+    """A block reaching into a cleared line is removed from the board and its store."""
+    board = GameBoard(WIDTH, HEIGHT)
+    block = BlockFactory.create_block(BlockType.I)
+    block.rotate_clockwise()
+
+    # Stand the vertical I in column 2 with its lowest cell in the bottom row
+    offsets = block.shape.offsets
+    column = 2
+    block.position = Position(column - int(offsets[0, 0]), HEIGHT - 1 - int(offsets[:, 1].max()))
+    assert board.place_block(block)
+
+    # Complete the bottom row around the vertical I
+    for x in range(WIDTH):
+        if x != column:
+            assert board.place_block(make_cell(x, HEIGHT - 1))
+    assert board.check_lines() == [HEIGHT - 1]
+
+    board.clear_lines([HEIGHT - 1])
+    assert block.id not in board.blocks
+    assert block.id not in board.store.index
+    assert board.store.size == len(board.blocks) == 0
+
+def test_remove_block_updates_bitboard(rng, make_cell):
+    """Removing blocks clears their bits and marks the top row for recomputation."""
+    board = random_board(rng, make_cell, 0.4)
+    block_ids = list(board.blocks)
+    rng.shuffle(block_ids)
+    for block_id in block_ids[:len(block_ids) // 2]:
+        assert board.remove_block(block_id)
+        assert_consistent(board)
+
+def test_block_store_swap_remove(rng):
+    """Rows stay aligned with their blocks through interleaved adds and swap-removes."""
+    store = BlockStore(capacity=4)
+    blocks = {}
+
+    def check():
+        assert store.size == len(store.rows) == len(blocks)
+        for row, block in enumerate(store.rows):
+            assert store.index[block.id] == row
+            assert store.ids[row] == block.id
+            assert store.pos_x[row] == block.position.x
+            assert store.pos_y[row] == block.position.y
+            assert store.friction[row] == block.friction
+            assert store.is_static[row] == block.is_static
+        expected_dynamic = [row for row, block in enumerate(store.rows) if not block.is_static]
+        assert store.dynamic_rows().tolist() == expected_dynamic
+
+    for step in range(300):
+        if blocks and rng.random() < 0.4:
+            block_id = int(rng.choice(list(blocks)))
+            assert store.remove(block_id)
+            del blocks[block_id]
+        else:
+            block = BlockFactory.create_block(BlockType.O)
+            block.position = Position(float(rng.integers(WIDTH)), float(rng.integers(HEIGHT)))
+            block.friction = float(rng.random())
+            block.is_static = bool(rng.random() < 0.3)
+            store.add(block)
+            blocks[block.id] = block
+        check()
+
+    assert not store.remove(-1)
+
+def test_board_cells_hold_large_block_ids(make_cell, monkeypatch):
+    """Block IDs past the int16 range fit the grid and survive serialization."""
+    monkeypatch.setattr(BlockFactory, "_block_ids", itertools.count(40000))
+    board = GameBoard(WIDTH, HEIGHT)
+    block = make_cell(4, 10)
+    assert board.place_block(block)
+    assert board.cells[10, 4] == block.id
+
+    restored = GameBoard.from_dict(board.to_dict())
+    assert restored.cells.dtype == CELL_DTYPE
+    np.testing.assert_array_equal(restored.cells, board.cells)
+
+def test_from_dict_reads_int16_grid():
+    """Saves from before the int32 grid still load."""
+    board = GameBoard(WIDTH, HEIGHT)
+    board.cells[7, 3] = 123
+    data = board.to_dict()
+    data["cells_b64"] = base64.b64encode(board.cells.astype("<i2").tobytes()).decode("ascii")
+
+    restored = GameBoard.from_dict(data)
+    assert restored.cells.dtype == CELL_DTYPE
+    np.testing.assert_array_equal(restored.cells, board.cells)
+
+def test_board_equality(make_cell):
+    """Boards and shapes compare by value, including their cell grids."""
+    board, other = GameBoard(WIDTH, HEIGHT), GameBoard(WIDTH, HEIGHT)
+    assert board == other
+    assert board != GameBoard(WIDTH, HEIGHT + 1)
+
+    board.cells[3, 3] = 7
+    assert board != other
+
+    shape = SHAPES[BlockType.T][BlockRotation.R0]
+    assert shape == BlockShape.create(BlockType.T)
+    assert shape != SHAPES[BlockType.T][BlockRotation.R90]
+
+@pytest.mark.parametrize("block_type", [t for t in BlockType if t in SHAPES])
+def test_kernels_match_reference(rng, make_cell, block_type):
+    """_shape_fits, _drop_distance and _find_kick agree with a cell-by-cell search."""
+    board = random_board(rng, make_cell, 0.25)
+    cells = board.cells
+    kicks = ROTATION_KICKS.tolist()
+
+    block = BlockFactory.create_block(block_type)
+
+    for rotation in BlockRotation:
+        shape = SHAPES[block_type][rotation]
+        block.shape = shape
+        for x in range(-3, WIDTH + 1):
+            for y in range(-3, HEIGHT + 1):
+                fits = reference_fits(cells, shape, x, y)
+                assert _shape_fits(board.row_mask, shape.row_bits, x, y, board._full_row) == fits
+
+                block.position = Position(x, y)
+                assert board.can_place_block(block) == fits
+
+                distance = 0
+                while reference_fits(cells, shape, x, y + distance + 1):
+                    distance += 1
+                assert board.drop_distance(block) == distance
+
+                expected_kick = next(
+                    ((dx, dy) for dx, dy in kicks if reference_fits(cells, shape, x + dx, y + dy)),
+                    None
+                )
+                assert board.find_kick(block) == expected_kick
+
+def test_drop_distance_fractional_row(make_cell):
+    """A block between rows falls by whole rows counted from its current row."""
+    board = GameBoard(WIDTH, HEIGHT)
+    block = BlockFactory.create_block(BlockType.O)
+    block.position = Position(4, 2.6)
+    shape = block.shape
+    expected = 0
+    while reference_fits(board.cells, shape, 4, int(2.6 + expected + 1)):
+        expected += 1
+    assert board.drop_distance(block) == expected
+    assert _drop_distance(board.row_mask, shape.row_bits, 4, 2.6, board._full_row) == expected
+    assert _find_kick(board.row_mask, shape.row_bits, 4, 2.6, ROTATION_KICKS, board._full_row) == 0
+
+# Loads game_logic.py under the module name given as argv[1] and runs every kernel once
+_IMPORT_AS = """
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location(sys.argv[1], sys.argv[2])
+module = importlib.util.module_from_spec(spec)
+sys.modules[sys.argv[1]] = module
+spec.loader.exec_module(module)
+module.warm_up_board_kernels()
+"""
+
+def test_kernels_load_under_another_module_name(tmp_path):
+    """The kernels work when the file is imported under a new name after another name compiled them."""
+    if game_logic.njit is None:
+        pytest.skip("numba is not installed")
+    env = dict(os.environ, NUMBA_CACHE_DIR=str(tmp_path), PYTHONPATH=os.pathsep.join(sys.path))
+    for name in ("game_logic", "game_logic_copy", "game_logic"):
+        result = subprocess.run(
+            [sys.executable, "-c", _IMPORT_AS, name, game_logic.__file__],
+            env=env, capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
@@ -0,0 +1,194 @@
+"""
+Tests for saving and loading games: full and incremental checkpoints.
+"""
+
+import os
+import shutil
+import pytest
+from .. import game_logic
+from ..game_logic import (
+    GameConstants,
+    GameManager,
+    GameMode,
+    PlayerState
+)
+
+def play(manager, ticks):
+    """Advance the game by 50 ms ticks, hard-dropping a block every few ticks."""
+    player_ids = list(manager.players)
+    for tick in range(ticks):
+        manager._last_tick_ns -= 50_000_000
+        manager.update()
+        if tick % 5 == 0:
+            manager.drop_block(player_ids[tick % len(player_ids)], hard_drop=True)
+
+def save(manager):
+    """Write a checkpoint the way update() does and return (path, chunks, full)."""
+    with manager.lock:
+        checkpoint = manager._snapshot_game_state()
+    assert checkpoint is not None
+    manager._write_game_state(*checkpoint)
+    return checkpoint
+
+def set_score(manager, player_id, score):
+    """Change one player, as an action would."""
+    with manager.lock:
+        manager.players[player_id].score = score
+        manager._dirty_players.add(player_id)
+
+def summary(manager):
+    """What a reloaded game must reproduce."""
+    return {
+        player_id: (
+            player.score,
+            player.state,
+            player.level,
+            player.blocks_placed,
+            len(player.active_spells),
+            manager.boards[player_id].cells.tolist(),
+            sorted(manager.boards[player_id].blocks)
+        )
+        for player_id, player in manager.players.items()
+    }
+
+def load(manager):
+    """Load the game's checkpoint into a new manager."""
+    restored = GameManager(GameMode.SURVIVAL)
+    assert restored.load_game_state(checkpoint_path(manager))
+    return restored
+
+def checkpoint_path(manager):
+    return f"game_state_{manager.game_id}.{GameConstants.SAVE_FORMAT}"
+
+def test_full_checkpoint_round_trip(game_manager):
+    """A full checkpoint restores players, boards and block stores."""
+    play(game_manager, 100)
+    path, _, full = save(game_manager)
+    assert full and path == checkpoint_path(game_manager)
+
+    restored = load(game_manager)
+    assert summary(restored) == summary(game_manager)
+    assert restored.game_state == game_manager.game_state
+    for player_id, board in restored.boards.items():
+        assert board.store.size == len(board.blocks)
+        assert board.row_mask.tolist() == game_manager.boards[player_id].row_mask.tolist()
+        assert restored.players[player_id].action_lock.acquire(blocking=False)
+        restored.players[player_id].action_lock.release()
+
+    # The restored game keeps running
+    play(restored, 50)
+
+def test_incremental_checkpoints_replay(game_manager):
+    """Numbered checkpoints written after a full one are replayed in order on load."""
+    first, second = list(game_manager.players)
+    play(game_manager, 30)
+    assert save(game_manager)[2]
+
+    play(game_manager, 30)
+    path, _, full = save(game_manager)
+    assert not full and path.endswith(".1")
+
+    set_score(game_manager, second, 4321)
+    with game_manager.lock:
+        game_manager.players[first].state = PlayerState.ELIMINATED
+        game_manager._dirty_players.add(first)
+    path, _, full = save(game_manager)
+    assert not full and path.endswith(".2")
+
+    restored = load(game_manager)
+    assert summary(restored) == summary(game_manager)
+    assert restored.players[second].score == 4321
+
+def test_incremental_checkpoint_holds_only_changed_players(game_manager):
+    """Players unchanged since the last checkpoint are left out of the incremental one."""
+    first, second = list(game_manager.players)
+    save(game_manager)
+
+    set_score(game_manager, first, 99)
+    path, _, _ = save(game_manager)
+    delta = game_logic._load_checkpoint(path)
+    assert set(delta["players"]) == {first}
+    assert set(delta["boards"]) == {first}
+
+def test_full_checkpoint_removes_incremental_files(game_manager, monkeypatch):
+    """Every FULL_SAVE_EVERY checkpoints a full one starts over and deletes the numbered files."""
+    monkeypatch.setattr(GameConstants, "FULL_SAVE_EVERY", 3)
+    player_id = next(iter(game_manager.players))
+    fulls = []
+    for score in range(1, 9):
+        set_score(game_manager, player_id, score)
+        fulls.append(save(game_manager)[2])
+    assert fulls == [True, False, False, False, True, False, False, False]
+
+    path = checkpoint_path(game_manager)
+    assert os.path.exists(f"{path}.3") and not os.path.exists(f"{path}.4")
+    assert load(game_manager).players[player_id].score == 8
+
+def test_stale_generation_ends_replay(game_manager):
+    """A numbered file left over from an older full checkpoint is not replayed."""
+    player_id = next(iter(game_manager.players))
+    path = checkpoint_path(game_manager)
+
+    set_score(game_manager, player_id, 1)
+    save(game_manager)
+    set_score(game_manager, player_id, 2)
+    save(game_manager)
+    set_score(game_manager, player_id, 3)
+    save(game_manager)
+    shutil.copy(f"{path}.2", "stale")
+
+    # A new generation: full checkpoint, then one incremental
+    game_manager._checkpoint_seq = GameConstants.FULL_SAVE_EVERY
+    set_score(game_manager, player_id, 10)
+    assert save(game_manager)[2]
+    assert not os.path.exists(f"{path}.2")
+    set_score(game_manager, player_id, 11)
+    save(game_manager)
+    expected = summary(game_manager)
+
+    # The old second incremental checkpoint reappears behind the new first one
+    shutil.copy("stale", f"{path}.2")
+    restored = load(game_manager)
+    assert restored.players[player_id].score == 11
+    assert summary(restored) == expected
+
+def test_failed_write_forces_full_checkpoint(game_manager, monkeypatch):
+    """After a checkpoint fails to write, the next one is full rather than built on the missing one."""
+    player_id = next(iter(game_manager.players))
+    set_score(game_manager, player_id, 1)
+    save(game_manager)
+
+    def fail(file_path, chunks):
+        raise OSError("disk full")
+
+    set_score(game_manager, player_id, 2)
+    with monkeypatch.context() as patch:
+        patch.setattr(game_logic, "_write_checkpoint", fail)
+        path, _, full = save(game_manager)
+    assert not full and not os.path.exists(path)
+
+    set_score(game_manager, player_id, 3)
+    assert save(game_manager)[2]
+    assert load(game_manager).players[player_id].score == 3
+
+def test_checkpoint_restores_active_spells(game_manager):
+    """Active spells are shared by the game and their caster after a reload."""
+    caster_id, target_id = list(game_manager.players)
+    caster = game_manager.players[caster_id]
+    caster.mana = caster.max_mana
+    spell = max(caster.spells, key=lambda spell: spell.duration)
+    target = target_id if spell.target_type != "self" else caster_id
+    assert game_manager.cast_spell(caster_id, spell.id, target)
+    save(game_manager)
+
+    restored = load(game_manager)
+    assert len(restored.active_spells) == 1
+    assert restored.players[caster_id].active_spells[0] is restored.active_spells[0]
+
+@pytest.mark.parametrize("ticks", [20, 60])
+def test_reloaded_game_matches_original(game_manager, ticks):
+    """Scores and boards survive a series of full and incremental checkpoints."""
+    for _ in range(4):
+        play(game_manager, ticks)
+        save(game_manager)
+        assert summary(load(game_manager)) == summary(game_manager)
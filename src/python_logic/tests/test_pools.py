@@ -0,0 +1,128 @@
+"""
+Tests for the block and active spell pools.
+"""
+
+import time
+import pytest
+from ..game_logic import (
+    ActiveSpell,
+    Block,
+    BlockFactory,
+    BlockRotation,
+    BlockType,
+    GameBoard,
+    GameConstants,
+    Position,
+    SHAPES,
+    SpellFactory
+)
+
+@pytest.fixture(autouse=True)
+def empty_pools(monkeypatch):
+    """Give every test its own empty pools."""
+    monkeypatch.setattr(BlockFactory, "_pool", [])
+    monkeypatch.setattr(ActiveSpell, "_pool", [])
+
+def test_recycled_block_is_reset():
+    """A block removed from the board comes back from create_block as a fresh block."""
+    board = GameBoard(10, 20)
+    block = BlockFactory.create_block(BlockType.T, "p1")
+    block.position = Position(2, 5)
+    block.rotate_clockwise()
+    block.friction = 0.1
+    block.velocity.x = 3.0
+    block.get_cells()
+    assert board.place_block(block)
+    assert board.remove_block(block.id)
+
+    recycled = BlockFactory.create_block(BlockType.I, "p2")
+    assert recycled is block
+    assert recycled.id != 0
+    assert recycled.block_type == BlockType.I
+    assert recycled.player_id == "p2"
+    assert recycled.rotation == BlockRotation.R0
+    assert recycled.shape is SHAPES[BlockType.I][BlockRotation.R0]
+    assert recycled.friction == GameConstants.BLOCK_FRICTION
+    assert (recycled.position.x, recycled.position.y) == (0, 0)
+    assert (recycled.velocity.x, recycled.velocity.y) == (0, 0)
+    assert not recycled.is_placed
+
+    fresh = Block(0, BlockType.I, SHAPES[BlockType.I][BlockRotation.R0], Position(0, 0))
+    assert recycled.get_cells().tolist() == fresh.get_cells().tolist()
+
+def test_block_ids_are_unique():
+    """Pooled and new blocks never share an ID."""
+    blocks = [BlockFactory.create_block() for _ in range(50)]
+    for block in blocks[:25]:
+        BlockFactory.release(block)
+    blocks += [BlockFactory.create_block() for _ in range(50)]
+    assert len({block.id for block in blocks[25:]}) == 75
+
+def test_recycled_active_spell_is_reset():
+    """acquire reinitializes a released active spell."""
+    first, second = SpellFactory.create_all_spells()[:2]
+    active = ActiveSpell.acquire(first, "a", "b", 100.0)
+    active.is_active = False
+    ActiveSpell.release(active)
+
+    recycled = ActiveSpell.acquire(second, "c", "d", 200.0)
+    assert recycled is active
+    assert recycled.spell is second
+    assert (recycled.caster_id, recycled.target_id) == ("c", "d")
+    assert recycled.start_time == 200.0
+    assert recycled.end_time == 200.0 + second.duration
+    assert recycled.is_active
+
+def test_queued_spell_is_not_recycled(game_manager):
+    """An expired spell still waiting in the incoming queue is not handed out again."""
+    caster_id, target_id = list(game_manager.players)
+    caster = game_manager.players[caster_id]
+    caster.mana = caster.max_mana
+    spell = next(spell for spell in caster.spells if spell.target_type != "self")
+    spell.duration = 0.0
+
+    # Cast between the tick's drain of the incoming spells and the player loop
+    update_active_spells = game_manager._update_active_spells
+
+    def cast_after_drain():
+        dropped = update_active_spells()
+        assert game_manager._cast_spell(caster_id, spell.id, target_id)
+        return dropped
+
+    game_manager._update_active_spells = cast_after_drain
+    game_manager._last_tick_ns -= 50_000_000
+    game_manager.update()
+    del game_manager._update_active_spells
+
+    assert not ActiveSpell._pool
+    queued = game_manager._incoming_spells.get_nowait()
+    assert (queued.caster_id, queued.target_id) == (caster_id, target_id)
+
+def test_expired_spells_return_to_pool(game_manager):
+    """Once the game and the player have both dropped a spell, it goes back to the pool."""
+    caster_id, target_id = list(game_manager.players)
+    caster = game_manager.players[caster_id]
+    caster.mana = caster.max_mana
+    spell = next(spell for spell in caster.spells if spell.target_type != "self")
+    spell.duration = 0.0
+
+    assert game_manager.cast_spell(caster_id, spell.id, target_id)
+    game_manager.current_time = time.time()
+    game_manager._last_tick_ns -= 50_000_000
+    game_manager.update()
+
+    assert not game_manager.active_spells
+    assert not caster.active_spells
+    assert len(ActiveSpell._pool) == 1
+
+def test_removed_player_spells_leave_expiry_heap(game_manager):
+    """Removing a player drops their spells from the game-wide expiry heap too."""
+    caster_id, target_id = list(game_manager.players)
+    caster = game_manager.players[caster_id]
+    caster.mana = caster.max_mana
+    spell = next(spell for spell in caster.spells if spell.target_type != "self")
+    assert game_manager.cast_spell(caster_id, spell.id, target_id)
+
+    assert game_manager.remove_player(target_id)
+    assert not game_manager.active_spells
+    assert not game_manager._spell_expiry
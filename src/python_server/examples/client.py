@@ -1,23 +1,47 @@
+import argparse
 import asyncio
-import json
 import uuid
+from typing import Dict, Optional
+import orjson
 import websockets
 import logging
+try:
+    import msgpack
+except ImportError:  # без msgpack клиент работает в текстовом формате JSON
+    msgpack = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Заготовки сообщений игровых действий: при отправке копируется готовый словарь
+_ACTION_TEMPLATES = {
+    action: {"type": "game_action", "game_id": None, "action": action}
+    for action in ("move", "rotate", "drop")
+}
+
 class GameClient:
-    def __init__(self, server_url: str = "ws://localhost:8080/ws"):
+    def __init__(self, server_url: str = "ws://localhost:8080/ws", wire_format: str = "msgpack",
+                 request_timeout: float = 10.0):
         self.server_url = server_url
+        # Сколько секунд ждать ответа на запрос
+        self.request_timeout = request_timeout
+        # "msgpack" — компактные бинарные кадры, "json" — текстовые кадры для отладки
+        if wire_format == "msgpack" and msgpack is None:
+            logger.warning("msgpack is not installed, falling back to JSON")
+            wire_format = "json"
+        self.wire_format = wire_format
         self.websocket = None
         self.session_id = None
         self.game_id = None
+        # Запросы, ожидающие ответа, по req_id; ответы разбирает фоновая задача
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._reader_task: Optional[asyncio.Task] = None
 
     async def connect(self):
         """Устанавливает WebSocket соединение с сервером"""
         try:
             self.websocket = await websockets.connect(self.server_url)
+            self._reader_task = asyncio.create_task(self._read_responses())
             logger.info("Connected to server")
             return True
         except Exception as e:
@@ -28,6 +52,9 @@ class GameClient:
         """Закрывает WebSocket соединение"""
         if self.websocket:
             await self.websocket.close()
+            if self._reader_task:
+                await self._reader_task
+                self._reader_task = None
             logger.info("Disconnected from server")
 
     async def create_game(self, settings: dict):
@@ -36,8 +63,7 @@ class GameClient:
             "type": "create_game",
             "settings": settings
         }
-        await self._send_message(message)
-        response = await self._receive_message()
+        response = await self._request(message)
         if response["type"] == "success":
             self.game_id = response["data"]["game_id"]
             logger.info(f"Game created: {self.game_id}")
@@ -54,8 +80,7 @@ class GameClient:
             "game_id": game_id,
             "session_id": self.session_id
         }
-        await self._send_message(message)
-        response = await self._receive_message()
+        response = await self._request(message)
         if response["type"] == "success":
             self.game_id = game_id
             logger.info(f"Joined game: {game_id}")
@@ -71,8 +96,7 @@ class GameClient:
             "type": "leave_game",
             "session_id": self.session_id
         }
-        await self._send_message(message)
-        response = await self._receive_message()
+        response = await self._request(message)
         if response["type"] == "success":
             self.game_id = None
             logger.info("Left game")
@@ -84,32 +108,67 @@ class GameClient:
         if not self.game_id:
             return False
 
-        message = {
-            "type": "game_action",
-            "game_id": self.game_id,
-            "action": action,
-            **kwargs
-        }
-        await self._send_message(message)
-        response = await self._receive_message()
+        template = _ACTION_TEMPLATES.get(action)
+        if template is not None:
+            message = template.copy()
+            message["game_id"] = self.game_id
+        else:
+            message = {"type": "game_action", "game_id": self.game_id, "action": action}
+        if kwargs:
+            message.update(kwargs)
+        response = await self._request(message)
         return response["type"] == "success"
 
     async def _send_message(self, message: dict):
         """Отправляет сообщение на сервер"""
         if not self.websocket:
             raise ConnectionError("Not connected to server")
-        await self.websocket.send(json.dumps(message))
-
-    async def _receive_message(self) -> dict:
-        """Получает сообщение от сервера"""
-        if not self.websocket:
-            raise ConnectionError("Not connected to server")
-        response = await self.websocket.recv()
-        return json.loads(response)
+        if self.wire_format == "msgpack":
+            await self.websocket.send(msgpack.packb(message))
+        else:
+            # Текстовый кадр: байты orjson декодируются в строку
+            await self.websocket.send(orjson.dumps(message).decode())
+
+    async def _request(self, message: dict) -> dict:
+        """Отправляет запрос и ждет ответ на него, не задерживая другие запросы"""
+        req_id = uuid.uuid4().hex
+        message["req_id"] = req_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[req_id] = future
+        try:
+            await self._send_message(message)
+            return await asyncio.wait_for(future, self.request_timeout)
+        finally:
+            self._pending.pop(req_id, None)
 
-async def main():
+    async def _read_responses(self):
+        """Читает сообщения сервера и передает ответы ожидающим запросам по req_id"""
+        try:
+            async for raw in self.websocket:
+                # Сервер отвечает в формате запроса: bytes — MessagePack, str — JSON
+                try:
+                    message = msgpack.unpackb(raw) if isinstance(raw, bytes) else orjson.loads(raw)
+                except ValueError as e:
+                    # Испорченное сообщение пропускается, остальные ответы продолжают читаться
+                    logger.error(f"Failed to decode server message: {e}")
+                    continue
+                if not isinstance(message, dict):
+                    logger.error(f"Unexpected server message: {message!r}")
+                    continue
+                future = self._pending.get(message.get("req_id"))
+                if future is not None and not future.done():
+                    future.set_result(message)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            # Запросы без ответа завершаются ошибкой, а не ждут вечно
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Connection closed"))
+
+async def main(wire_format: str = "msgpack"):
     # Пример использования клиента
-    client = GameClient()
+    client = GameClient(wire_format=wire_format)
     
     try:
         # Подключаемся к серверу
@@ -127,10 +186,12 @@ async def main():
         if not await client.create_game(settings):
             return
 
-        # Отправляем несколько игровых действий
-        await client.send_game_action("move", direction="left")
-        await client.send_game_action("rotate", angle=90)
-        await client.send_game_action("drop")
+        # Отправляем несколько игровых действий, не дожидаясь ответа на каждое
+        await asyncio.gather(
+            client.send_game_action("move", direction="left"),
+            client.send_game_action("rotate", angle=90),
+            client.send_game_action("drop")
+        )
 
         # Ждем немного
         await asyncio.sleep(5)
@@ -144,4 +205,8 @@ async def main():
         await client.disconnect()
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--format", choices=("msgpack", "json"), default="msgpack",
+                        help="wire format (json is human-readable, for debugging)")
+    args = parser.parse_args()
+    asyncio.run(main(args.format)) 
\ No newline at end of file
@@ -1,29 +1,40 @@
-from pydantic import BaseSettings
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
 
 class Settings(BaseSettings):
+    """Единая модель настроек сервера"""
+    
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="", extra="ignore")
+    
+    # Значения по умолчанию переопределяются одноименными переменными окружения
+    # (SERVER_HOST, SERVER_PORT, ...) и файлом .env — их читает сам BaseSettings
+    
     # Основные настройки сервера
-    server_host: str = os.getenv("SERVER_HOST", "0.0.0.0")
-    server_port: int = int(os.getenv("SERVER_PORT", "8080"))
+    server_host: str = "0.0.0.0"
+    server_port: int = 8080
+    debug: bool = False
+    # Число процессов Uvicorn (WEB_CONCURRENCY). Состояние игр и WebSocket-соединений
+    # хранится в памяти процесса, поэтому больше одного воркера допустимо только
+    # при внешнем хранении сессий
+    web_concurrency: int = 1
     
     # Настройки игры
-    game_update_interval: float = float(os.getenv("GAME_UPDATE_INTERVAL", "0.016"))  # ~60 FPS
+    game_update_interval: float = 0.016  # ~60 FPS
     
     # Настройки сессии
-    session_cleanup_interval: int = int(os.getenv("SESSION_CLEANUP_INTERVAL", "300"))  # 5 минут
-    session_heartbeat_interval: int = int(os.getenv("SESSION_HEARTBEAT_INTERVAL", "30"))  # 30 секунд
+    session_cleanup_interval: int = 300  # 5 минут
+    session_heartbeat_interval: int = 30  # 30 секунд
     
     # Настройки физики
-    physics_gravity: float = float(os.getenv("PHYSICS_GRAVITY", "9.8"))
-    physics_friction: float = float(os.getenv("PHYSICS_FRICTION", "0.1"))
+    physics_gravity: float = 9.8
+    physics_friction: float = 0.1
     
     # Настройки логирования
-    log_level: str = os.getenv("LOG_LEVEL", "INFO")
-    log_file: Optional[str] = os.getenv("LOG_FILE", "logs/server.log")
-    
-    class Config:
-        env_file = ".env" 
\ No newline at end of file
+    log_level: str = "INFO"
+    log_file: Optional[str] = "logs/server.log"
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Единый экземпляр настроек на процесс"""
+    return Settings()
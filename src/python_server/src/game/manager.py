@@ -2,7 +2,7 @@ import asyncio
 import uuid
 from typing import Dict, Optional
 from loguru import logger
-from ..config import Settings
+from ..config import Settings, get_settings
 
 class Game:
     def __init__(self, game_id: uuid.UUID, settings: Settings):
@@ -54,7 +54,7 @@ class Game:
 class GameManager:
     def __init__(self):
         self.games: Dict[uuid.UUID, Game] = {}
-        self.settings = Settings()
+        self.settings = get_settings()
 
     async def create_game(self) -> uuid.UUID:
         game_id = uuid.uuid4()
@@ -1,19 +1,24 @@
 import asyncio
 import uvicorn
 from fastapi import FastAPI, WebSocket
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 import uuid
 from typing import Dict, Set
 import uvicorn.logging
-from .config import Settings
+from .config import get_settings
 from .game.manager import GameManager
 from .session.manager import SessionManager
 from .network.manager import NetworkManager
 from .physics.manager import PhysicsManager
 from .exceptions import GameError, SessionNotFoundError, NetworkError
 
-app = FastAPI(title="Tetris Game Server")
-settings = Settings()
+app = FastAPI(title="Tetris Game Server", default_response_class=ORJSONResponse)
+settings = get_settings()
+
+# Сжатие крупных HTTP-ответов (на WebSocket не влияет)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
 
 # Инициализация менеджеров
 game_manager = GameManager()
@@ -21,6 +26,9 @@ session_manager = SessionManager(game_manager)
 network_manager = NetworkManager(settings)
 physics_manager = PhysicsManager()
 
+# Ответ health-check не меняется, поэтому собирается один раз
+_HEALTH = {"status": "ok"}
+
 # Хранение активных WebSocket соединений
 active_connections: Dict[uuid.UUID, WebSocket] = {}
 
@@ -47,25 +55,37 @@ async def websocket_endpoint(websocket: WebSocket):
     connection_id = uuid.uuid4()
     await websocket.accept()
     active_connections[connection_id] = websocket
+    # Ответы NetworkManager отправляет по своему реестру соединений
+    network_manager.add_connection(connection_id, websocket)
     
     try:
         while True:
-            data = await websocket.receive_text()
+            # Клиент может слать как бинарные (MessagePack), так и текстовые (JSON) кадры
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            data = message.get("bytes")
+            if data is None:
+                data = message.get("text")
             await network_manager.handle_message(connection_id, data)
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
     finally:
         if connection_id in active_connections:
             del active_connections[connection_id]
+        network_manager.remove_connection(connection_id)
 
 @app.get("/health")
 async def health_check():
-    return {"status": "ok"}
+    return _HEALTH
 
 if __name__ == "__main__":
     uvicorn.run(
         "main:app",
         host=settings.server_host,
         port=settings.server_port,
-        reload=True
+        loop="uvloop",
+        http="httptools",
+        workers=1 if settings.debug else settings.web_concurrency,
+        reload=settings.debug
     ) 
\ No newline at end of file
@@ -1,7 +1,11 @@
 import json
 import uuid
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Set, Union
 from loguru import logger
+try:
+    import msgpack
+except ImportError:  # msgpack необязателен: без него принимаются только JSON-кадры
+    msgpack = None
 from ..config import Settings
 from ..game.manager import GameManager
 from ..session.manager import SessionManager
@@ -12,14 +16,24 @@ class NetworkManager:
         self.game_manager: Optional[GameManager] = None
         self.session_manager: Optional[SessionManager] = None
         self.active_connections: Dict[uuid.UUID, Any] = {}
+        # Соединения, приславшие бинарный кадр MessagePack: отвечаем им тем же форматом
+        self._binary_connections: Set[uuid.UUID] = set()
 
     def set_managers(self, game_manager: GameManager, session_manager: SessionManager) -> None:
         self.game_manager = game_manager
         self.session_manager = session_manager
 
-    async def handle_message(self, connection_id: uuid.UUID, message: str) -> None:
+    async def handle_message(self, connection_id: uuid.UUID, message: Union[str, bytes]) -> None:
         try:
-            data = json.loads(message)
+            # Бинарные кадры несут MessagePack, текстовые — JSON (отладочный формат)
+            if isinstance(message, bytes):
+                if msgpack is None:
+                    logger.error("Binary message received but msgpack is not installed")
+                    return
+                data = msgpack.unpackb(message)
+                self._binary_connections.add(connection_id)
+            else:
+                data = json.loads(message)
             message_type = data.get("type")
             
             if not message_type:
@@ -37,6 +51,13 @@ class NetworkManager:
         except Exception as e:
             logger.error(f"Error handling message: {e}")
 
+    def add_connection(self, connection_id: uuid.UUID, connection: Any) -> None:
+        self.active_connections[connection_id] = connection
+
+    def remove_connection(self, connection_id: uuid.UUID) -> None:
+        self.active_connections.pop(connection_id, None)
+        self._binary_connections.discard(connection_id)
+
     async def _handle_create_game(self, connection_id: uuid.UUID, data: Dict[str, Any]) -> None:
         if not self.game_manager:
             return
@@ -44,7 +65,7 @@ class NetworkManager:
         await self._send_response(connection_id, {
             "type": "game_created",
             "game_id": str(game_id)
-        })
+        }, data)
 
     async def _handle_join_game(self, connection_id: uuid.UUID, data: Dict[str, Any]) -> None:
         if not self.session_manager or not self.game_manager:
@@ -57,7 +78,7 @@ class NetworkManager:
         await self._send_response(connection_id, {
             "type": "game_joined",
             "game_id": str(game_id)
-        })
+        }, data)
 
     async def _handle_leave_game(self, connection_id: uuid.UUID, data: Dict[str, Any]) -> None:
         if not self.session_manager:
@@ -67,7 +88,7 @@ class NetworkManager:
         await self.session_manager.leave_game(session_id)
         await self._send_response(connection_id, {
             "type": "game_left"
-        })
+        }, data)
 
     async def _handle_game_action(self, connection_id: uuid.UUID, data: Dict[str, Any]) -> None:
         if not self.game_manager:
@@ -81,12 +102,19 @@ class NetworkManager:
             await self._send_response(connection_id, {
                 "type": "action_processed",
                 "action": action
-            })
+            }, data)
 
-    async def _send_response(self, connection_id: uuid.UUID, data: Dict[str, Any]) -> None:
+    async def _send_response(self, connection_id: uuid.UUID, data: Dict[str, Any],
+                             request: Optional[Dict[str, Any]] = None) -> None:
+        # Клиенты отправляют запросы не дожидаясь ответов и сопоставляют их по req_id
+        if request is not None and "req_id" in request:
+            data["req_id"] = request["req_id"]
         if connection := self.active_connections.get(connection_id):
             try:
-                await connection.send_json(data)
+                if connection_id in self._binary_connections:
+                    await connection.send_bytes(msgpack.packb(data))
+                else:
+                    await connection.send_json(data)
             except Exception as e:
                 logger.error(f"Error sending response: {e}")
 
@@ -95,4 +123,5 @@ class NetworkManager:
 
     async def stop(self) -> None:
         self.active_connections.clear()
+        self._binary_connections.clear()
         logger.info("Network manager stopped") 
\ No newline at end of file
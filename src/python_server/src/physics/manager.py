@@ -2,11 +2,11 @@ import asyncio
 import uuid
 from typing import Dict, Optional, Tuple
 from loguru import logger
-from ..config import Settings
+from ..config import get_settings
 
 class PhysicsManager:
     def __init__(self):
-        self.settings = Settings()
+        self.settings = get_settings()
         self.blocks: Dict[uuid.UUID, Dict] = {}
         self.running = False
         self.update_task: Optional[asyncio.Task] = None
@@ -2,7 +2,7 @@ import asyncio
 import uuid
 from typing import Dict, Optional
 from loguru import logger
-from ..config import Settings
+from ..config import get_settings
 from ..game.manager import GameManager
 
 class Session:
@@ -22,7 +22,7 @@ class SessionManager:
     def __init__(self, game_manager: GameManager):
         self.sessions: Dict[uuid.UUID, Session] = {}
         self.game_manager = game_manager
-        self.settings = Settings()
+        self.settings = get_settings()
         self.cleanup_task: Optional[asyncio.Task] = None
         self.heartbeat_task: Optional[asyncio.Task] = None
 
@@ -7,8 +7,11 @@ from rich.console import Console
 from rich.logging import RichHandler
 import logging
 import asyncio
+import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 import uvicorn
 
 # Настройка логирования
@@ -23,21 +26,29 @@ logger = logging.getLogger("python_tools")
 console = Console()
 
 # FastAPI приложение
-app = FastAPI(title="Tetris Development Tools")
+app = FastAPI(title="Tetris Development Tools", default_response_class=ORJSONResponse)
 
-# Настройка CORS
+# Сжатие крупных HTTP-ответов
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+
+# Настройка CORS: только известный источник дашборда и только используемые методы.
+# Wildcard вместе с allow_credentials браузеры отвергают; max_age кеширует preflight на сутки
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=os.getenv("DASHBOARD_ORIGIN", "http://localhost:5173").split(","),
+    allow_credentials=False,
+    allow_methods=["GET"],
+    allow_headers=["Content-Type"],
+    max_age=86400,
 )
 
+# Статус сервиса не меняется во время работы, поэтому собирается один раз
+_STATUS = {"status": "running", "version": "1.0.0"}
+
 # Эндпоинты для совместимости с существующим API
 @app.get("/api/v1/dev/status")
 async def get_status():
-    return {"status": "running", "version": "1.0.0"}
+    return _STATUS
 
 # CLI интерфейс
 @click.group()